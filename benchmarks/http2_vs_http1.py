@@ -0,0 +1,206 @@
+"""Benchmark: HTTP/2 multiplexing versus HTTP/1.1 for concurrent status checks.
+
+Starts a local stand-in for the ZenoPay API that answers ``/api/payments/order-status``
+after a fixed simulated latency, then fires a burst of concurrent
+``OrderService.check_status`` calls over HTTP/1.1 and over HTTP/2 and reports
+p50/p99 latency, throughput and the number of sockets the server accepted.
+
+The stand-in server speaks cleartext HTTP/2 (prior knowledge), so the benchmark
+client disables HTTP/1.1 when HTTP/2 is requested instead of negotiating via TLS ALPN.
+
+Requirements:
+    pip install zenopay-sdk[http2]
+
+Usage:
+    python benchmarks/http2_vs_http1.py --requests 2000 --concurrency 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+
+from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.http import HTTPClient
+from elusion.zenopay.services import OrderService
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+STATUS_BODY = json.dumps(
+    {
+        "reference": "0936183435",
+        "resultcode": "000",
+        "result": "SUCCESS",
+        "message": "Order fetch successful",
+        "data": [
+            {
+                "order_id": "3rer407fe-3ee8-4525-456f-ccb95de38250",
+                "creation_date": "2025-05-19 08:40:33",
+                "amount": "1000",
+                "payment_status": "PENDING",
+                "transid": None,
+                "channel": None,
+                "reference": None,
+                "msisdn": "255744963858",
+            }
+        ],
+    }
+).encode()
+
+
+class StandInServer:
+    """Minimal local ZenoPay stand-in serving HTTP/1.1 and cleartext HTTP/2."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.connections = 0
+        self.port = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            head = await reader.readexactly(3)
+            if head == H2_PREFACE[:3]:
+                await self._serve_h2(head, reader, writer)
+            else:
+                await self._serve_h1(head, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h1(self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        buffered = head
+        while True:
+            request = buffered + await reader.readuntil(b"\r\n\r\n")
+            buffered = b""
+            length = 0
+            for line in request.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+
+            await asyncio.sleep(self.latency)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n" + f"Content-Length: {len(STATUS_BODY)}\r\n\r\n".encode() + STATUS_BODY
+            )
+            await writer.drain()
+
+    async def _serve_h2(self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        conn.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 1000})
+        writer.write(conn.data_to_send())
+
+        data = head
+        while data:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.ensure_future(self._respond_h2(conn, writer, event.stream_id))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            data = await reader.read(65536)
+
+    async def _respond_h2(self, conn: h2.connection.H2Connection, writer: asyncio.StreamWriter, stream_id: int) -> None:
+        await asyncio.sleep(self.latency)
+        conn.send_headers(
+            stream_id,
+            [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(STATUS_BODY)))],
+        )
+        conn.send_data(stream_id, STATUS_BODY, end_stream=True)
+        writer.write(conn.data_to_send())
+
+
+class PriorKnowledgeHTTPClient(HTTPClient):
+    """HTTP client that speaks HTTP/2 without TLS, as the stand-in server has no certificate."""
+
+    def _client_options(self) -> Dict[str, Any]:
+        options = super()._client_options()
+        if self.config.http2:
+            options["http1"] = False
+        return options
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(http2: bool, requests: int, concurrency: int, latency: float) -> Dict[str, float]:
+    server = StandInServer(latency)
+    await server.start()
+
+    config = ZenoPayConfig(
+        api_key="benchmark",
+        base_url=f"http://127.0.0.1:{server.port}",
+        http2=http2,
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+    )
+    http_client = PriorKnowledgeHTTPClient(config)
+    orders = OrderService(http_client, config)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def check(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await orders.check_status(f"order-{i}")
+            latencies.append(time.perf_counter() - start)
+
+    async with http_client:
+        started = time.perf_counter()
+        await asyncio.gather(*(check(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    await server.stop()
+    return {
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "req_per_sec": requests / elapsed,
+        "sockets": float(server.connections),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated upstream latency in seconds")
+    args = parser.parse_args()
+
+    print(f"{args.requests} check_status calls, concurrency {args.concurrency}, upstream latency {args.latency * 1000:.0f} ms\n")
+    print(f"{'protocol':<10}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}{'req/s':>10}{'sockets':>10}")
+    for label, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+        result = asyncio.run(run(http2, args.requests, args.concurrency, args.latency))
+        print(
+            f"{label:<10}{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['mean_ms']:>10.1f}"
+            f"{result['req_per_sec']:>10.0f}{result['sockets']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
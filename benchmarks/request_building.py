@@ -0,0 +1,115 @@
+"""Microbenchmark: cost of building an order-creation request.
+
+Compares the previous request-building path with the current one for
+``OrderService.create``:
+
+* legacy: ``model_dump`` to a dict, a defensive copy of that dict, a copy of the
+  default headers on every call, then ``json.dumps`` inside httpx.
+* current: headers set once on the client, the validated model serialized by
+  pydantic-core straight to JSON bytes.
+
+Both paths run end to end through ``OrderService.create`` against an in-memory
+transport, so the numbers include httpx's own request handling. Reports time per
+call and the peak transient memory traced by ``tracemalloc`` per call.
+
+Usage:
+    python benchmarks/request_building.py --calls 20000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Type, Union
+
+import httpx
+from pydantic import BaseModel
+
+from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.http import HTTPClient
+from elusion.zenopay.models.common import APIResponse
+from elusion.zenopay.models.order import NewOrder
+from elusion.zenopay.services import OrderService
+from elusion.zenopay.services.base import T
+
+ORDER_RESPONSE = httpx.Response(200, json={"status": "success", "message": "Request in progress", "resultcode": "000", "order_id": "bench-order"})
+
+
+class InMemoryHTTPClient(HTTPClient):
+    """HTTP client answering every request from memory."""
+
+    def _client_options(self) -> Dict[str, Any]:
+        options = super()._client_options()
+        options["transport"] = httpx.MockTransport(lambda request: ORDER_RESPONSE)
+        return options
+
+
+class LegacyOrderService(OrderService):
+    """Order service reproducing the previous dict-based request building."""
+
+    async def post_async(self, endpoint: str, data: Union[BaseModel, Dict[str, Any]], model_class: Type[T]) -> APIResponse[T]:
+        url = self._build_url(endpoint)
+        if isinstance(data, BaseModel):
+            request_data = data.model_dump(exclude_unset=True, by_alias=True)
+        else:
+            request_data = data.copy()
+        prepared_data = request_data.copy()
+        headers = self.config.headers.copy()
+
+        response_data = await self.http_client.post(url, json=prepared_data, headers=headers)
+        return self._parse_response(response_data, model_class)
+
+
+def make_order() -> NewOrder:
+    return NewOrder(
+        order_id="bench-order",
+        buyer_email="buyer@example.com",
+        buyer_name="Bench Buyer",
+        buyer_phone="0744963858",
+        amount=1000,
+        webhook_url="https://example.com/webhook",
+        metadata={"product_id": "12345", "campaign": "payroll"},
+    )
+
+
+async def measure(service_class: Callable[[HTTPClient, ZenoPayConfig], OrderService], calls: int) -> Dict[str, float]:
+    config = ZenoPayConfig(api_key="benchmark", base_url="https://zenoapi.local")
+    http_client = InMemoryHTTPClient(config)
+    orders = service_class(http_client, config)
+    order = make_order()
+
+    async with http_client:
+        for _ in range(200):
+            await orders.create(order)
+
+        started = time.perf_counter()
+        for _ in range(calls):
+            await orders.create(order)
+        elapsed = time.perf_counter() - started
+
+        tracemalloc.start()
+        peaks = []
+        for _ in range(200):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            await orders.create(order)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        tracemalloc.stop()
+
+    return {"us_per_call": elapsed / calls * 1e6, "peak_kib": sorted(peaks)[len(peaks) // 2] / 1024}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{args.calls} OrderService.create calls against an in-memory transport\n")
+    print(f"{'path':<10}{'us/call':>12}{'peak KiB/call':>16}")
+    for label, service_class in (("legacy", LegacyOrderService), ("current", OrderService)):
+        result = asyncio.run(measure(service_class, args.calls))
+        print(f"{label:<10}{result['us_per_call']:>12.1f}{result['peak_kib']:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Microbenchmark: upstream requests saved by coalescing identical in-flight GETs.
+
+Fires bursts of concurrent ``orders.check_status`` calls for a handful of orders at an
+in-memory transport that answers after a fixed delay, with ``ZenoPayConfig`` left at
+``coalesce_requests=False`` and with ``coalesce_requests=True``. Reports upstream requests
+sent and wall time per burst.
+
+Usage:
+    python benchmarks/request_coalescing.py --callers 200 --orders 5 --bursts 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, Tuple
+
+import httpx
+
+from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.http import HTTPClient
+from elusion.zenopay.services import OrderService
+
+UPSTREAM_DELAY = 0.02
+
+
+def status_body(order_id: str) -> bytes:
+    """Build a COMPLETED order status response."""
+    return json.dumps(
+        {
+            "reference": "0936183435",
+            "resultcode": "000",
+            "result": "SUCCESS",
+            "message": "Order fetch successful",
+            "data": [
+                {
+                    "order_id": order_id,
+                    "creation_date": "2025-05-19 08:40:33",
+                    "amount": "1000",
+                    "payment_status": "COMPLETED",
+                    "transid": "CEJ3I3SETSN",
+                    "channel": "MPESA-TZ",
+                    "reference": "0936183435",
+                    "msisdn": "255744963858",
+                }
+            ],
+        }
+    ).encode()
+
+
+class SlowInMemoryHTTPClient(HTTPClient):
+    """HTTP client answering every request from memory after ``UPSTREAM_DELAY`` seconds."""
+
+    upstream_requests = 0
+
+    def _client_options(self) -> Dict[str, Any]:
+        options = super()._client_options()
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            self.upstream_requests += 1
+            await asyncio.sleep(UPSTREAM_DELAY)
+            return httpx.Response(200, content=status_body(request.url.params["order_id"]))
+
+        options["transport"] = httpx.MockTransport(respond)
+        return options
+
+
+async def measure(callers: int, orders: int, bursts: int, coalesce: bool) -> Tuple[int, float]:
+    """Return upstream requests sent and milliseconds per burst."""
+    config = ZenoPayConfig(api_key="bench-key", base_url="https://zenoapi.bench", coalesce_requests=coalesce)
+    http_client = SlowInMemoryHTTPClient(config)
+    service = OrderService(http_client, config)
+
+    async with http_client:
+        started = time.perf_counter()
+        for _ in range(bursts):
+            await asyncio.gather(*(service.check_status(f"order-{index % orders}") for index in range(callers)))
+        elapsed = time.perf_counter() - started
+    return http_client.upstream_requests, elapsed / bursts * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--callers", type=int, default=200)
+    parser.add_argument("--orders", type=int, default=5)
+    parser.add_argument("--bursts", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.bursts} bursts of {args.callers} concurrent status checks over {args.orders} orders\n")
+    print(f"{'coalescing':<12}{'upstream':>10}{'ms/burst':>10}")
+    for label, coalesce in (("off", False), ("on", True)):
+        upstream, per_burst = asyncio.run(measure(args.callers, args.orders, args.bursts, coalesce))
+        print(f"{label:<12}{upstream:>10}{per_burst:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Microbenchmark: per-request overhead of request hooks.
+
+Runs ``orders.sync.check_status`` against an in-memory transport with no hooks, and
+with one no-op hook registered for each of ``on_request`` and ``on_response``. With no
+hooks the pipeline skips creating the ``RequestEvent`` and attaching the trace
+extension, so that column is the baseline cost of a request.
+
+Usage:
+    python benchmarks/request_hooks.py --calls 20000
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict
+
+import httpx
+
+from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.http import HTTPClient
+from elusion.zenopay.services import OrderService
+
+STATUS_BODY = json.dumps(
+    {
+        "reference": "0936183435",
+        "resultcode": "000",
+        "result": "SUCCESS",
+        "message": "Order fetch successful",
+        "data": [
+            {
+                "order_id": "bench-order",
+                "creation_date": "2025-05-19 08:40:33",
+                "amount": "1000",
+                "payment_status": "COMPLETED",
+                "transid": "CEJ3I3SETSN",
+                "channel": "MPESA-TZ",
+                "reference": "0936183435",
+                "msisdn": "255744963858",
+            }
+        ],
+    }
+).encode()
+
+
+class InMemoryHTTPClient(HTTPClient):
+    """HTTP client answering every request from memory."""
+
+    def _client_options(self) -> Dict[str, Any]:
+        options = super()._client_options()
+        options["transport"] = httpx.MockTransport(lambda request: httpx.Response(200, content=STATUS_BODY))
+        return options
+
+
+def measure(calls: int, hooked: bool) -> float:
+    """Return microseconds per status check."""
+    http_client = InMemoryHTTPClient(ZenoPayConfig(api_key="bench-key", base_url="https://zenoapi.bench"))
+    if hooked:
+        http_client.on_request(lambda event: None)
+        http_client.on_response(lambda event: None)
+    orders = OrderService(http_client, http_client.config)
+
+    with http_client:
+        orders.sync.check_status("bench-order")
+        started = time.perf_counter()
+        for _ in range(calls):
+            orders.sync.check_status("bench-order")
+        elapsed = time.perf_counter() - started
+    return elapsed / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{args.calls} status checks against an in-memory transport\n")
+    print(f"{'hooks':<10}{'us/call':>10}")
+    for label, hooked in (("none", False), ("2 no-op", True)):
+        print(f"{label:<10}{measure(args.calls, hooked):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Microbenchmark: per-request cost of the built-in metrics registry.
+
+Measures the recording path ``HTTPClient.exchange`` runs for every call (shard lookup,
+in-flight counter, two clock reads and the histogram update) in isolation, then
+``orders.sync.check_status`` end to end against an in-memory transport with
+``ZenoPayConfig(metrics=False)`` and ``metrics=True``. Also reports how long
+``to_prometheus`` takes once the histograms are populated.
+
+Usage:
+    python benchmarks/request_metrics.py --calls 200000
+"""
+
+import argparse
+import time
+from typing import Any, Dict
+
+import httpx
+
+from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.http import HTTPClient, MetricsRegistry
+from elusion.zenopay.services import OrderService
+
+STATUS_BODY = (
+    b'{"reference":"0936183435","resultcode":"000","result":"SUCCESS","message":"Order fetch successful","data":[{"order_id":"bench-order",'
+    b'"creation_date":"2025-05-19 08:40:33","amount":"1000","payment_status":"COMPLETED","transid":"CEJ3I3SETSN","channel":"MPESA-TZ",'
+    b'"reference":"0936183435","msisdn":"255744963858"}]}'
+)
+
+
+class InMemoryHTTPClient(HTTPClient):
+    """HTTP client answering every request from memory."""
+
+    def _client_options(self) -> Dict[str, Any]:
+        options = super()._client_options()
+        options["transport"] = httpx.MockTransport(lambda request: httpx.Response(200, content=STATUS_BODY))
+        return options
+
+
+def recording_cost(calls: int) -> float:
+    """Return nanoseconds per recorded call, minus the cost of the empty loop."""
+    registry = MetricsRegistry()
+    perf_counter = time.perf_counter
+
+    started = perf_counter()
+    for _ in range(calls):
+        perf_counter()
+        perf_counter()
+    baseline = perf_counter() - started
+
+    started = perf_counter()
+    for _ in range(calls):
+        shard = registry.shard("order_status")
+        shard.started += 1
+        call_started = perf_counter()
+        shard.record(perf_counter() - call_started)
+    elapsed = perf_counter() - started
+    return (elapsed - baseline) / calls * 1e9
+
+
+def end_to_end(calls: int, metrics: bool) -> float:
+    """Return microseconds per status check."""
+    http_client = InMemoryHTTPClient(ZenoPayConfig(api_key="bench-key", base_url="https://zenoapi.bench", metrics=metrics))
+    orders = OrderService(http_client, http_client.config)
+
+    with http_client:
+        orders.sync.check_status("bench-order")
+        started = time.perf_counter()
+        for _ in range(calls):
+            orders.sync.check_status("bench-order")
+        elapsed = time.perf_counter() - started
+    return elapsed / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"recording only   {recording_cost(args.calls):>8.0f} ns/call ({args.calls} calls)")
+
+    e2e_calls = max(1, args.calls // 20)
+    off = end_to_end(e2e_calls, metrics=False)
+    on = end_to_end(e2e_calls, metrics=True)
+    print(f"check_status     {off:>8.1f} us/call without metrics, {on:.1f} us/call with ({e2e_calls} calls)")
+
+    registry = MetricsRegistry()
+    for index in range(args.calls):
+        registry.shard("order_status").record((index % 5000) / 1e4)
+    started = time.perf_counter()
+    registry.to_prometheus()
+    print(f"to_prometheus    {(time.perf_counter() - started) * 1e3:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark: per-response parse cost before and after cached response parsers.
+
+* before: ``model_validate`` on the decoded dict, then ``APIResponse[model](...)``,
+  which looks up the parameterized generic and re-validates the results on every call.
+* after: ``get_response_parser(model).parse(...)``, which reuses a precomputed
+  ``APIResponse[model]`` class and ``TypeAdapter``.
+
+It also compares decoding the raw body with ``json.loads`` before parsing against
+validating the bytes directly with ``parse_json`` (the path the services use).
+
+Usage:
+    python benchmarks/response_parsing.py --iterations 50000
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Dict, List, Tuple, Type
+
+from pydantic import BaseModel
+
+from elusion.zenopay.models.checkout import CheckoutResponse
+from elusion.zenopay.models.common import APIResponse
+from elusion.zenopay.models.disbursement import DisbursementSuccessResponse
+from elusion.zenopay.models.order import OrderResponse, OrderStatusResponse
+from elusion.zenopay.models.utility_payments import UtilityPaymentResponse
+from elusion.zenopay.services.parsing import get_response_parser
+
+SAMPLES: List[Tuple[Type[BaseModel], Dict[str, Any]]] = [
+    (OrderResponse, {"status": "success", "message": "Request in progress", "resultcode": "000", "order_id": "3rer407fe-3ee8"}),
+    (
+        OrderStatusResponse,
+        {
+            "reference": "0936183435",
+            "resultcode": "000",
+            "result": "SUCCESS",
+            "message": "Order fetch successful",
+            "data": [
+                {
+                    "order_id": "3rer407fe-3ee8",
+                    "creation_date": "2025-05-19 08:40:33",
+                    "amount": "1000",
+                    "payment_status": "COMPLETED",
+                    "transid": "CEJ3I3SETSN",
+                    "channel": "MPESA-TZ",
+                    "reference": "0936183435",
+                    "msisdn": "255744963858",
+                }
+            ],
+        },
+    ),
+    (
+        DisbursementSuccessResponse,
+        {
+            "status": "success",
+            "message": "Wallet Cashin processed successfully.",
+            "fee": 1500,
+            "amount_sent_to_customer": 3000,
+            "total_deducted": 4500,
+            "new_balance": "62984034.00",
+            "zenopay_response": {
+                "reference": "0949694808",
+                "transid": "7pbBXlnnASwerdsadasdwnnnrrr09AZ",
+                "resultcode": "000",
+                "result": "SUCCESS",
+                "message": "Mpesa To JOHN DOE",
+                "data": [],
+            },
+        },
+    ),
+    (
+        UtilityPaymentResponse,
+        {
+            "status": "success",
+            "message": "Utility payment processed successfully.",
+            "selcom_response": {
+                "reference": "0949694808",
+                "transid": "TX-1",
+                "resultcode": "000",
+                "result": "SUCCESS",
+                "message": "LUKU token 1234",
+                "data": [],
+            },
+        },
+    ),
+    (CheckoutResponse, {"payment_link": "https://checkout.example/pay/abc", "tx_ref": "TX-66c4bb9c9abb1_12345"}),
+]
+
+
+def parse_before(model_class: Type[BaseModel], response_data: Dict[str, Any]) -> Any:
+    parsed_data = model_class.model_validate(response_data)
+    return APIResponse[model_class](  # type: ignore[valid-type]
+        success=True,
+        results=parsed_data,
+        message=response_data.get("message", None),
+        error=None,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f"{'model':<30}{'before us':>12}{'after us':>12}{'speedup':>10}{'loads us':>12}{'bytes us':>12}")
+    for model_class, data in SAMPLES:
+        response_parser = get_response_parser(model_class)
+        body = json.dumps(data).encode()
+        before = timeit.timeit(lambda: parse_before(model_class, data), number=args.iterations)
+        after = timeit.timeit(lambda: response_parser.parse(data), number=args.iterations)
+        loads = timeit.timeit(lambda: response_parser.parse(json.loads(body)), number=args.iterations)
+        raw = timeit.timeit(lambda: response_parser.parse_json(body), number=args.iterations)
+        scale = 1e6 / args.iterations
+        print(
+            f"{model_class.__name__:<30}{before * scale:>12.2f}{after * scale:>12.2f}{before / after:>9.1f}x"
+            f"{loads * scale:>12.2f}{raw * scale:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
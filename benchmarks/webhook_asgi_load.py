@@ -0,0 +1,100 @@
+"""Load test: requests per second and latency of the ASGI webhook receiver.
+
+Posts webhook bodies with a fixed number of concurrent senders and reports requests per
+second with p50/p99 latency. By default the ``WebhookASGIApp`` runs in-process behind
+``httpx.ASGITransport``, with a coroutine handler that sleeps ``--handler-latency``
+seconds to stand in for database work, handled inline or, with ``--dispatch``, through
+an ``AsyncWebhookDispatcher`` that acknowledges as soon as the event is queued.
+
+To load-test a real server instead, pass ``--url``. For example, serve the app with
+uvicorn from a module containing ``app = WebhookASGIApp(client.webhooks)``::
+
+    uvicorn myapp:app --port 8000
+    python benchmarks/webhook_asgi_load.py --url http://127.0.0.1:8000/zenopay/webhook
+
+Usage:
+    python benchmarks/webhook_asgi_load.py --requests 20000 --concurrency 100 --dispatch
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import List, Optional
+
+import httpx
+
+from elusion.zenopay.models.webhook import WebhookEvent
+from elusion.zenopay.services import WebhookService
+from elusion.zenopay.webhooks import AsyncWebhookDispatcher
+from elusion.zenopay.webhooks.asgi import DEFAULT_WEBHOOK_PATH, WebhookASGIApp
+
+
+async def run(requests: int, concurrency: int, url: Optional[str], handler_latency: float, dispatch: bool) -> None:
+    """Send the requests and print the results."""
+    dispatcher: Optional[AsyncWebhookDispatcher] = None
+    if url is None:
+        service = WebhookService()
+        service.audit_sinks.clear()
+
+        async def handler(event: WebhookEvent) -> None:
+            await asyncio.sleep(handler_latency)
+
+        service.on_payment_completed(handler)
+        if dispatch:
+            dispatcher = AsyncWebhookDispatcher(service.handle_webhook_async, workers=concurrency, max_queue_size=requests)
+            await dispatcher.start()
+            service.use_dispatcher(dispatcher)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=WebhookASGIApp(service)), base_url="http://loadtest")
+        target = DEFAULT_WEBHOOK_PATH
+    else:
+        client = httpx.AsyncClient(limits=httpx.Limits(max_connections=concurrency))
+        target = url
+
+    bodies = [json.dumps({"order_id": f"order-{i}", "payment_status": "COMPLETED", "reference": f"REF{i:010d}"}) for i in range(requests)]
+    latencies: List[float] = []
+    failures = 0
+    next_index = 0
+
+    async def sender() -> None:
+        nonlocal next_index, failures
+        while next_index < requests:
+            body = bodies[next_index]
+            next_index += 1
+            started = time.perf_counter()
+            response = await client.post(target, content=body)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                failures += 1
+
+    async with client:
+        started = time.perf_counter()
+        await asyncio.gather(*(sender() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    if dispatcher is not None:
+        await dispatcher.stop()
+
+    latencies.sort()
+    mode = url or ("in-process, dispatched" if dispatch else "in-process, inline")
+    print(f"{requests} webhooks, {concurrency} concurrent senders ({mode})\n")
+    print(f"requests/s   {requests / elapsed:>10.0f}")
+    print(f"p50 ms       {statistics.median(latencies) * 1000:>10.2f}")
+    print(f"p99 ms       {latencies[int(len(latencies) * 0.99)] * 1000:>10.2f}")
+    print(f"non-200      {failures:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--url", default=None, help="Webhook URL of a running server (default: in-process app)")
+    parser.add_argument("--handler-latency", type=float, default=0.005, help="Seconds the in-process handler sleeps")
+    parser.add_argument("--dispatch", action="store_true", help="Acknowledge once queued in an AsyncWebhookDispatcher")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.concurrency, args.url, args.handler_latency, args.dispatch))
+
+
+if __name__ == "__main__":
+    main()
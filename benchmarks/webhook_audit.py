@@ -0,0 +1,85 @@
+"""Benchmark: webhooks per second with audit logging off and on.
+
+Runs ``WebhookService.process_webhook_request`` with a no-op handler under several
+audit configurations:
+
+* none: ``audit_sinks`` cleared.
+* logger-off: the default ``LoggerAuditSink`` with INFO disabled, the out-of-the-box
+  setup when the application does not configure logging.
+* logger-on: the default sink with INFO enabled and written to an in-memory stream.
+* ndjson: an ``NDJSONAuditSink`` writing to a temporary file.
+
+Usage:
+    python benchmarks/webhook_audit.py --webhooks 50000
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Callable, List
+
+from elusion.zenopay.services import WebhookService
+from elusion.zenopay.webhooks import NDJSONAuditSink
+
+
+def bodies(count: int) -> List[str]:
+    """Build distinct webhook bodies."""
+    return [json.dumps({"order_id": f"order-{i}", "payment_status": "COMPLETED", "reference": f"REF{i:010d}"}) for i in range(count)]
+
+
+def measure(configure: Callable[[WebhookService], None], webhooks: List[str]) -> float:
+    """Return webhooks processed per second."""
+    service = WebhookService()
+    service.on_payment_completed(lambda event: None)
+    configure(service)
+
+    started = time.perf_counter()
+    for body in webhooks:
+        service.process_webhook_request(body)
+    elapsed = time.perf_counter() - started
+
+    for sink in service.audit_sinks:
+        sink.close()
+    return len(webhooks) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--webhooks", type=int, default=50000)
+    args = parser.parse_args()
+
+    webhooks = bodies(args.webhooks)
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    package_logger = logging.getLogger("elusion.zenopay")
+    package_logger.addHandler(handler)
+    package_logger.propagate = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        def none(service: WebhookService) -> None:
+            service.audit_sinks.clear()
+            package_logger.setLevel(logging.WARNING)
+
+        def logger_off(service: WebhookService) -> None:
+            package_logger.setLevel(logging.WARNING)
+
+        def logger_on(service: WebhookService) -> None:
+            package_logger.setLevel(logging.INFO)
+
+        def ndjson(service: WebhookService) -> None:
+            package_logger.setLevel(logging.WARNING)
+            service.audit_sinks = [NDJSONAuditSink(os.path.join(tmp, "audit.ndjson"))]
+
+        print(f"{args.webhooks} webhooks handled inline\n")
+        print(f"{'audit':<12}{'webhooks/s':>12}")
+        for label, configure in (("none", none), ("logger-off", logger_off), ("logger-on", logger_on), ("ndjson", ndjson)):
+            print(f"{label:<12}{measure(configure, webhooks):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ from elusion.zenopay.exceptions import (
     ZenoPayAuthenticationError,
     ZenoPayValidationError,
     ZenoPayNetworkError,
+    ZenoPayCircuitOpenError,
 )
 from elusion.zenopay.models import (
     Order,
@@ -38,6 +39,7 @@ __all__ = [
     "ZenoPayAuthenticationError",
     "ZenoPayValidationError",
     "ZenoPayNetworkError",
+    "ZenoPayCircuitOpenError",
     # Models
     "Order",
     "NewOrder",
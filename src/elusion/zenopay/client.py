@@ -5,6 +5,10 @@ from types import TracebackType
 
 from elusion.zenopay.config import ZenoPayConfig
 from elusion.zenopay.http import HTTPClient
+from elusion.zenopay.http.circuit import CircuitBreaker, CircuitHook
+from elusion.zenopay.http.hooks import RequestHook
+from elusion.zenopay.http.ratelimit import RateLimiter
+from elusion.zenopay.http.tracing import Tracer
 from elusion.zenopay.services import (
     OrderService,
     WebhookService,
@@ -34,6 +38,11 @@ class ZenoPayClient:
         ...         "webhook_url": "https://example.xyz/webhook"
         ...     })
 
+        Tuned connection pool:
+        >>> config = ZenoPayConfig(api_key="your-api-key", max_connections=200, warm_connections=10)
+        >>> async with ZenoPayClient(config=config) as client:
+        ...     status = await client.orders.check_status("order-id")
+
         Sync usage:
         >>> with ZenoPayClient(api_key="your-api-key") as client:
         ...     order = client.orders.sync.create({
@@ -60,6 +69,7 @@ class ZenoPayClient:
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
+        config: Optional[ZenoPayConfig] = None,
     ):
         """Initialize the ZenoPay client.
 
@@ -68,8 +78,9 @@ class ZenoPayClient:
             base_url: Base URL for the API (optional, defaults to production).
             timeout: Request timeout in seconds (optional).
             max_retries: Maximum number of retries for failed requests (optional).
+            config: Fully built configuration (optional). When given, the other arguments are ignored.
         """
-        self.config = ZenoPayConfig(
+        self.config = config or ZenoPayConfig(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
@@ -77,12 +88,13 @@ class ZenoPayClient:
         )
 
         self.http_client = HTTPClient(self.config)
+        self.metrics = self.http_client.metrics
 
         self.orders = OrderService(self.http_client, self.config)
         self.checkout = CheckoutService(self.http_client, self.config)
         self.disbursements = DisbursementService(self.http_client, self.config)
         self.utilities = UtilityPaymentsService(self.http_client, self.config)
-        self.webhooks = WebhookService()
+        self.webhooks = WebhookService(secret=self.config.webhook_secret)
 
     async def __aenter__(self) -> "ZenoPayClient":
         """Enter async context manager."""
@@ -120,6 +132,83 @@ class ZenoPayClient:
         """Close the client and cleanup resources (sync version)."""
         self.http_client.close_sync()
 
+    def use_tracer(self, tracer: Optional[Tracer]) -> None:
+        """Trace API calls with a tracer, or turn tracing off.
+
+        See ``HTTPClient.use_tracer``.
+
+        Examples:
+            >>> from elusion.zenopay.http import OpenTelemetryTracer
+            >>> client.use_tracer(OpenTelemetryTracer())
+        """
+        self.http_client.use_tracer(tracer)
+
+    def use_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """Pace requests of every service with a rate limiter, or turn rate limiting off.
+
+        See ``HTTPClient.use_rate_limiter``.
+        """
+        self.http_client.use_rate_limiter(rate_limiter)
+
+    def use_circuit_breaker(self, circuit_breaker: Optional[CircuitBreaker]) -> None:
+        """Fail fast on endpoints that keep failing, or turn circuit breaking off.
+
+        See ``HTTPClient.use_circuit_breaker``.
+        """
+        self.http_client.use_circuit_breaker(circuit_breaker)
+
+    def on_request(self, hook: RequestHook) -> RequestHook:
+        """Register a hook called before every API request attempt.
+
+        See ``HTTPClient.on_request``.
+        """
+        return self.http_client.on_request(hook)
+
+    def on_response(self, hook: RequestHook) -> RequestHook:
+        """Register a hook called with every API response, with its status code, sizes and timings.
+
+        See ``HTTPClient.on_response``.
+
+        Examples:
+            >>> @client.on_response
+            ... def log_timing(event):
+            ...     print(f"{event.endpoint} {event.status_code} in {event.timing.total * 1000:.1f} ms")
+        """
+        return self.http_client.on_response(hook)
+
+    def on_error(self, hook: RequestHook) -> RequestHook:
+        """Register a hook called when an API request attempt fails.
+
+        See ``HTTPClient.on_error``.
+        """
+        return self.http_client.on_error(hook)
+
+    def on_retry(self, hook: RequestHook) -> RequestHook:
+        """Register a hook called before a failed API request is retried.
+
+        See ``HTTPClient.on_retry``.
+        """
+        return self.http_client.on_retry(hook)
+
+    def remove_hook(self, hook: RequestHook) -> bool:
+        """Remove a request hook.
+
+        See ``HTTPClient.remove_hook``.
+        """
+        return self.http_client.remove_hook(hook)
+
+    def on_circuit_change(self, hook: CircuitHook) -> CircuitHook:
+        """Register a hook called whenever an endpoint's circuit opens, half-opens or closes.
+
+        See ``HTTPClient.on_circuit_change``.
+
+        Examples:
+            >>> @client.on_circuit_change
+            ... def shed_load(event):
+            ...     accepting_payments[event.endpoint] = event.state != "open"
+        """
+        return self.http_client.on_circuit_change(hook)
+
     @property
     def api_key(self) -> str:
         """Get the current API key."""
@@ -10,11 +10,26 @@ DEFAULT_BASE_URL = "https://zenoapi.com"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_RETRY_MAX_DELAY = 30.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+DEFAULT_BULK_CONCURRENCY = 10
+DEFAULT_POLL_CONCURRENCY = 20
+DEFAULT_POLL_MIN_INTERVAL = 5.0
+DEFAULT_POLL_MAX_INTERVAL = 60.0
+DEFAULT_POLL_TIMEOUT = 300.0
+DEFAULT_STATUS_CACHE_TTL = 2.0
+DEFAULT_STATUS_CACHE_MAX_SIZE = 10000
+DEFAULT_CIRCUIT_BREAKER_MIN_CALLS = 10
+DEFAULT_CIRCUIT_BREAKER_WINDOW = 20
+DEFAULT_CIRCUIT_BREAKER_RESET_TIMEOUT = 30.0
 
 # Environment variable names
 ENV_API_KEY = "ZENOPAY_API_KEY"
 ENV_BASE_URL = "ZENOPAY_BASE_URL"
 ENV_TIMEOUT = "ZENOPAY_TIMEOUT"
+ENV_WEBHOOK_SECRET = "ZENOPAY_WEBHOOK_SECRET"
 
 # HTTP headers
 DEFAULT_HEADERS = {
@@ -51,7 +66,30 @@ class ZenoPayConfig:
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
         retry_delay: Optional[float] = None,
+        retry_max_delay: Optional[float] = None,
         headers: Optional[Dict[str, str]] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        warm_connections: int = 0,
+        http2: bool = False,
+        status_cache: bool = False,
+        status_cache_ttl: Optional[float] = None,
+        status_cache_max_size: Optional[int] = None,
+        webhook_secret: Optional[str] = None,
+        metrics: bool = True,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        rate_limit_max: Optional[float] = None,
+        circuit_breaker_failure_rate: Optional[float] = None,
+        circuit_breaker_min_calls: Optional[int] = None,
+        circuit_breaker_window: Optional[int] = None,
+        circuit_breaker_reset_timeout: Optional[float] = None,
+        coalesce_requests: bool = False,
     ) -> None:
         """Initialize configuration.
 
@@ -59,9 +97,32 @@ class ZenoPayConfig:
             api_key: ZenoPay API key. If not provided, will try to get from environment.
             base_url: Base URL for the ZenoPay API.
             timeout: Request timeout in seconds.
-            max_retries: Maximum number of retries for failed requests.
-            retry_delay: Delay between retries in seconds.
+            max_retries: Maximum number of retries for failed requests. Use 0 to disable retries.
+            retry_delay: Base delay between retries in seconds, doubled on every attempt.
+            retry_max_delay: Upper bound in seconds for a single backoff delay.
             headers: Additional headers to include in requests.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept open before it is closed.
+            connect_timeout: Timeout for establishing a connection. Defaults to ``timeout``.
+            read_timeout: Timeout for receiving a chunk of the response. Defaults to ``timeout``.
+            write_timeout: Timeout for sending a chunk of the request. Defaults to ``timeout``.
+            pool_timeout: Timeout for acquiring a connection from the pool. Defaults to ``timeout``.
+            warm_connections: Number of connections to open when entering the async client context.
+            http2: Multiplex requests over HTTP/2 connections. Requires the ``http2`` extra.
+            status_cache: Cache order status lookups and coalesce concurrent lookups of the same order.
+            status_cache_ttl: Seconds a PENDING status is served from the cache. Final statuses are kept until evicted.
+            status_cache_max_size: Maximum number of orders kept in the status cache.
+            webhook_secret: Shared secret for verifying webhook HMAC signatures. If not provided, will try to get from environment.
+            metrics: Record per-endpoint call counts, errors and latency histograms in ``HTTPClient.metrics``.
+            rate_limit: Requests per second sent to each endpoint. None disables client-side rate limiting.
+            rate_limit_burst: Requests sent back to back after an idle period. Defaults to one second's worth.
+            rate_limit_max: Highest rate the limiter climbs back to after 429 responses slowed it down. Defaults to ``rate_limit``.
+            circuit_breaker_failure_rate: Share of failed attempts, e.g. 0.5, that opens an endpoint's circuit. None disables circuit breaking.
+            circuit_breaker_min_calls: Attempts to an endpoint recorded before its circuit can open.
+            circuit_breaker_window: Number of most recent attempts per endpoint the failure rate is computed over.
+            circuit_breaker_reset_timeout: Seconds an open circuit fails fast before letting a probe request through.
+            coalesce_requests: Share one upstream request between identical GET requests in flight at the same time.
         """
         self.api_key = os.getenv(ENV_API_KEY) or api_key
 
@@ -81,8 +142,45 @@ class ZenoPayConfig:
             env_timeout_float = DEFAULT_TIMEOUT
 
         self.timeout = timeout or env_timeout_float
-        self.max_retries = max_retries or DEFAULT_MAX_RETRIES
-        self.retry_delay = retry_delay or DEFAULT_RETRY_DELAY
+        self.max_retries = max_retries if max_retries is not None else DEFAULT_MAX_RETRIES
+        self.retry_delay = retry_delay if retry_delay is not None else DEFAULT_RETRY_DELAY
+        self.retry_max_delay = retry_max_delay if retry_max_delay is not None else DEFAULT_RETRY_MAX_DELAY
+
+        # Connection pool and per-phase timeouts
+        self.max_connections = max_connections or DEFAULT_MAX_CONNECTIONS
+        self.max_keepalive_connections = max_keepalive_connections if max_keepalive_connections is not None else DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        self.keepalive_expiry = keepalive_expiry if keepalive_expiry is not None else DEFAULT_KEEPALIVE_EXPIRY
+        self.connect_timeout = connect_timeout or self.timeout
+        self.read_timeout = read_timeout or self.timeout
+        self.write_timeout = write_timeout or self.timeout
+        self.pool_timeout = pool_timeout or self.timeout
+        self.warm_connections = warm_connections
+        self.http2 = http2
+
+        # Order status cache
+        self.status_cache = status_cache
+        self.status_cache_ttl = status_cache_ttl if status_cache_ttl is not None else DEFAULT_STATUS_CACHE_TTL
+        self.status_cache_max_size = status_cache_max_size or DEFAULT_STATUS_CACHE_MAX_SIZE
+
+        # Webhook signature verification
+        self.webhook_secret = os.getenv(ENV_WEBHOOK_SECRET) or webhook_secret
+
+        # Request metrics
+        self.metrics = metrics
+
+        # Client-side rate limiting
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.rate_limit_max = rate_limit_max
+
+        # Circuit breaking
+        self.circuit_breaker_failure_rate = circuit_breaker_failure_rate
+        self.circuit_breaker_min_calls = circuit_breaker_min_calls or DEFAULT_CIRCUIT_BREAKER_MIN_CALLS
+        self.circuit_breaker_window = max(circuit_breaker_window or DEFAULT_CIRCUIT_BREAKER_WINDOW, self.circuit_breaker_min_calls)
+        self.circuit_breaker_reset_timeout = circuit_breaker_reset_timeout or DEFAULT_CIRCUIT_BREAKER_RESET_TIMEOUT
+
+        # GET request coalescing
+        self.coalesce_requests = coalesce_requests
 
         self.headers = DEFAULT_HEADERS.copy()
 
@@ -102,6 +102,28 @@ class ZenoPayValidationError(ZenoPayAPIError):
         self.validation_errors = validation_errors or {}
 
 
+class ZenoPayResponseValidationError(ZenoPayValidationError):
+    """Exception raised when a successful (2xx) response does not match the expected model.
+
+    The API accepted and processed the request; only its response could not be parsed.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 200,
+        validation_errors: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize ZenoPayResponseValidationError.
+
+        Args:
+            message: Error message.
+            status_code: HTTP status code of the response.
+            validation_errors: Detailed validation errors by field.
+        """
+        super().__init__(message, status_code, None, validation_errors)
+
+
 class ZenoPayRateLimitError(ZenoPayAPIError):
     """Exception raised when rate limit is exceeded (429)."""
 
@@ -170,6 +192,27 @@ class ZenoPayTimeoutError(ZenoPayNetworkError):
         self.timeout_duration = timeout_duration
 
 
+class ZenoPayCircuitOpenError(ZenoPayError):
+    """Exception raised without sending a request while the endpoint's circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        endpoint: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Initialize ZenoPayCircuitOpenError.
+
+        Args:
+            message: Error message.
+            endpoint: Name of the endpoint whose circuit is open.
+            retry_after: Seconds until the circuit lets a probe request through.
+        """
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
 class ZenoPayWebhookError(ZenoPayError):
     """Exception raised for webhook-related errors."""
 
@@ -188,6 +231,36 @@ class ZenoPayWebhookError(ZenoPayError):
         self.webhook_data = webhook_data or {}
 
 
+class ZenoPayWebhookQueueFullError(ZenoPayWebhookError):
+    """Exception raised when the webhook dispatch queue is full and the event is rejected."""
+
+    def __init__(
+        self,
+        message: str = "Webhook queue is full, retry later",
+        queue_size: Optional[int] = None,
+    ) -> None:
+        """Initialize ZenoPayWebhookQueueFullError.
+
+        Args:
+            message: Error message.
+            queue_size: Capacity of the queue that overflowed.
+        """
+        super().__init__(message)
+        self.queue_size = queue_size
+
+
+class ZenoPayWebhookSignatureError(ZenoPayWebhookError):
+    """Exception raised when a webhook signature is missing or does not match the body."""
+
+    def __init__(self, message: str = "Invalid webhook signature") -> None:
+        """Initialize ZenoPayWebhookSignatureError.
+
+        Args:
+            message: Error message.
+        """
+        super().__init__(message)
+
+
 def create_api_error(
     status_code: int,
     message: str,
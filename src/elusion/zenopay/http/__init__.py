@@ -1,5 +1,25 @@
+from elusion.zenopay.http.circuit import CircuitBreaker, CircuitEvent
 from elusion.zenopay.http.client import HTTPClient
+from elusion.zenopay.http.coalesce import RequestCoalescer
+from elusion.zenopay.http.hooks import RequestEvent, RequestHooks, RequestTiming
+from elusion.zenopay.http.metrics import MetricsRegistry
+from elusion.zenopay.http.ratelimit import RateLimiter, TokenBucket
+from elusion.zenopay.http.retry import RetryPolicy
+from elusion.zenopay.http.tracing import OpenTelemetryTracer, Span, Tracer
 
 __all__ = [
+    "CircuitBreaker",
+    "CircuitEvent",
     "HTTPClient",
+    "MetricsRegistry",
+    "OpenTelemetryTracer",
+    "RateLimiter",
+    "RequestCoalescer",
+    "RequestEvent",
+    "RequestHooks",
+    "RequestTiming",
+    "RetryPolicy",
+    "Span",
+    "TokenBucket",
+    "Tracer",
 ]
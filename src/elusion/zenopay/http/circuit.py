@@ -0,0 +1,281 @@
+"""Per-endpoint circuit breaking for the ZenoPay HTTP client."""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from elusion.zenopay.exceptions import ZenoPayCircuitOpenError, ZenoPayError, ZenoPayNetworkError, ZenoPayServerError
+from elusion.zenopay.http.metrics import OTHER_ENDPOINT
+
+logger = logging.getLogger(__name__)
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitEvent:
+    """A circuit state change, passed to every state change hook.
+
+    Attributes:
+        endpoint: Name of the endpoint in ``ENDPOINTS``, or ``"other"``.
+        previous: State before the change.
+        state: New state: ``"closed"``, ``"open"`` or ``"half_open"``.
+        failure_rate: Failure rate over the window when the change happened.
+    """
+
+    __slots__ = ("endpoint", "previous", "state", "failure_rate")
+
+    def __init__(self, endpoint: str, previous: str, state: str, failure_rate: float) -> None:
+        """Initialize the event."""
+        self.endpoint = endpoint
+        self.previous = previous
+        self.state = state
+        self.failure_rate = failure_rate
+
+    def __repr__(self) -> str:
+        """Return a string representation of the event."""
+        return f"CircuitEvent({self.endpoint}: {self.previous} -> {self.state}, failure_rate={self.failure_rate:.2f})"
+
+
+CircuitHook = Callable[[CircuitEvent], Any]
+
+
+class Circuit:
+    """State and recent outcomes of one endpoint.
+
+    While closed, the outcomes of the last ``window`` attempts are kept. Once at least
+    ``min_calls`` are recorded and the share of failures reaches ``failure_rate``, the
+    circuit opens and every attempt fails fast for ``reset_timeout`` seconds. It then
+    half-opens and lets a single probe through: success closes it, failure opens it again.
+
+    Every state change, and every probe let through, starts a new generation. ``allow``
+    returns the generation an attempt is admitted under and ``record`` drops outcomes of
+    earlier generations, so a slow attempt sent before the circuit opened cannot close
+    it, nor reopen it, on behalf of the probe.
+    """
+
+    def __init__(self, endpoint: str, breaker: "CircuitBreaker") -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            endpoint: Endpoint name.
+            breaker: Breaker holding the thresholds and hooks.
+        """
+        self.endpoint = endpoint
+        self.state = CLOSED
+        self._breaker = breaker
+        self._outcomes: Deque[bool] = deque(maxlen=breaker.window)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of failed attempts in the window."""
+        return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    def allow(self) -> int:
+        """Check that an attempt may be sent.
+
+        Returns:
+            Generation the attempt is admitted under, to pass to ``record``.
+
+        Raises:
+            ZenoPayCircuitOpenError: If the circuit is open, or half-open with a probe in flight.
+        """
+        # Read before the state: a change in between only makes the outcome count as stale.
+        generation = self._generation
+        if self.state == CLOSED:
+            return generation
+
+        event = None
+        with self._lock:
+            now = time.monotonic()
+            reset_timeout = self._breaker.reset_timeout
+            if self.state == OPEN:
+                remaining = self._opened_at + reset_timeout - now
+                if remaining > 0:
+                    raise ZenoPayCircuitOpenError(f"Circuit for {self.endpoint} is open", self.endpoint, remaining)
+                event = self._change(HALF_OPEN)
+            # A probe that never reported back, e.g. a cancelled call, is given up after reset_timeout.
+            if self.state == HALF_OPEN and self._probe_started is not None and now - self._probe_started < reset_timeout:
+                raise ZenoPayCircuitOpenError(
+                    f"Circuit for {self.endpoint} is half-open with a probe in flight",
+                    self.endpoint,
+                    self._probe_started + reset_timeout - now,
+                )
+            self._probe_started = now
+            self._generation += 1
+            generation = self._generation
+        if event is not None:
+            self._breaker._notify(event)
+        return generation
+
+    def record(self, failure: bool, generation: int) -> None:
+        """Record the outcome of an attempt.
+
+        Args:
+            failure: Whether the attempt failed in a way that counts against the endpoint.
+            generation: Generation returned by ``allow`` when the attempt was admitted.
+        """
+        event = None
+        with self._lock:
+            if generation != self._generation:
+                # Admitted before the last state change or probe: says nothing about the current state.
+                return
+            if self.state == CLOSED:
+                if len(self._outcomes) == self._outcomes.maxlen:
+                    self._failures -= self._outcomes[0]
+                self._outcomes.append(failure)
+                self._failures += failure
+                if failure and len(self._outcomes) >= self._breaker.min_calls and self.failure_rate >= self._breaker.failure_rate:
+                    event = self._change(OPEN)
+            elif self.state == HALF_OPEN:
+                event = self._change(OPEN if failure else CLOSED)
+        if event is not None:
+            self._breaker._notify(event)
+
+    def _change(self, state: str) -> CircuitEvent:
+        """Move to a new state. Must be called with the lock held."""
+        event = CircuitEvent(self.endpoint, self.state, state, self.failure_rate)
+        self.state = state
+        self._probe_started = None
+        self._generation += 1
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._outcomes.clear()
+            self._failures = 0
+        return event
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breakers shared by every service of an ``HTTPClient``.
+
+    Server errors (5xx) and network errors, timeouts included, count as failures; any
+    other response, 4xx and 429 included, shows the endpoint is up and counts as a
+    success. While an endpoint's circuit is open, attempts raise
+    ``ZenoPayCircuitOpenError`` at once instead of waiting for the upstream to time out.
+
+    Examples:
+        >>> config = ZenoPayConfig(circuit_breaker_failure_rate=0.5)
+        >>> client = ZenoPayClient(config=config)
+        >>> @client.on_circuit_change
+        ... def shed_load(event):
+        ...     print(event.endpoint, event.state)
+    """
+
+    def __init__(self, failure_rate: float = 0.5, min_calls: int = 10, window: int = 20, reset_timeout: float = 30.0) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_rate: Share of failed attempts, between 0 and 1, that opens a circuit.
+            min_calls: Attempts recorded before the failure rate is acted upon.
+            window: Number of most recent attempts the failure rate is computed over.
+            reset_timeout: Seconds a circuit stays open before letting a probe through.
+
+        Raises:
+            ValueError: If a threshold is out of range.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be greater than 0 and at most 1")
+        if min_calls < 1 or window < min_calls:
+            raise ValueError("min_calls must be at least 1 and window at least min_calls")
+        if reset_timeout <= 0:
+            raise ValueError("reset_timeout must be greater than 0")
+
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.hooks: List[CircuitHook] = []
+        self._circuits: Dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_failure(error: ZenoPayError) -> bool:
+        """Check if an error counts against the endpoint.
+
+        Args:
+            error: Error raised by an attempt.
+
+        Returns:
+            True for server and network errors.
+        """
+        return isinstance(error, (ZenoPayServerError, ZenoPayNetworkError))
+
+    def circuit(self, endpoint: Optional[str]) -> Circuit:
+        """Get the circuit of an endpoint, creating it on first use.
+
+        Args:
+            endpoint: Endpoint name, or None for URLs outside ``ENDPOINTS``.
+
+        Returns:
+            The endpoint's circuit.
+        """
+        name = endpoint or OTHER_ENDPOINT
+        circuit = self._circuits.get(name)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.get(name)
+                if circuit is None:
+                    circuit = self._circuits[name] = Circuit(name, self)
+        return circuit
+
+    def on_state_change(self, hook: CircuitHook) -> CircuitHook:
+        """Register a hook called whenever a circuit changes state.
+
+        Hooks run synchronously in the thread or task whose attempt caused the change.
+
+        Args:
+            hook: Called with the ``CircuitEvent``.
+
+        Returns:
+            The hook, so this can be used as a decorator.
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: CircuitHook) -> bool:
+        """Remove a state change hook.
+
+        Args:
+            hook: Hook to remove.
+
+        Returns:
+            True if the hook was registered.
+        """
+        removed = False
+        while hook in self.hooks:
+            self.hooks.remove(hook)
+            removed = True
+        return removed
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the state of every circuit.
+
+        Returns:
+            Per endpoint: ``state``, ``failure_rate`` and the number of ``calls`` in the window.
+        """
+        with self._lock:
+            circuits = dict(self._circuits)
+        return {
+            name: {"state": circuit.state, "failure_rate": circuit.failure_rate, "calls": len(circuit._outcomes)}
+            for name, circuit in sorted(circuits.items())
+        }
+
+    def _notify(self, event: CircuitEvent) -> None:
+        """Log a state change and call the hooks, logging any that fail."""
+        log = logger.warning if event.state == OPEN else logger.info
+        log("Circuit for %s changed from %s to %s (failure rate %.2f)", event.endpoint, event.previous, event.state, event.failure_rate)
+        for hook in list(self.hooks):
+            try:
+                hook(event)
+            except Exception as e:
+                logger.error("Circuit hook %r failed for %s: %s", hook, event.endpoint, e)
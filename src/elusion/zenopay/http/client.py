@@ -1,19 +1,36 @@
 """HTTP client for the ZenoPay SDK."""
 
+import asyncio
+import copy
+import importlib.util
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, TypeVar
 
 import httpx
 
-from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.config import ENDPOINTS, ZenoPayConfig
 from elusion.zenopay.exceptions import (
+    ZenoPayError,
     ZenoPayNetworkError,
+    ZenoPayRateLimitError,
     ZenoPayTimeoutError,
     create_api_error,
 )
+from elusion.zenopay.http.circuit import CircuitBreaker, CircuitHook
+from elusion.zenopay.http.coalesce import RequestCoalescer
+from elusion.zenopay.http.hooks import RequestEvent, RequestHook, RequestHooks, RequestTiming
+from elusion.zenopay.http.metrics import MetricsRegistry
+from elusion.zenopay.http.pipeline import Pipeline, PreparedRequest, Sleep, drive, drive_sync
+from elusion.zenopay.http.ratelimit import RateLimiter
+from elusion.zenopay.http.retry import RetryPolicy
+from elusion.zenopay.http.tracing import NOOP_TRACER, Tracer
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class HTTPClient:
     """HTTP client for making requests to the ZenoPay API."""
@@ -25,12 +42,32 @@ class HTTPClient:
             config: ZenoPay configuration instance.
         """
         self.config = config
+        self.retry_policy = RetryPolicy.from_config(config)
+        self.hooks = RequestHooks()
+        self.metrics: Optional[MetricsRegistry] = MetricsRegistry() if config.metrics else None
+        self.tracer: Tracer = NOOP_TRACER
+        self.rate_limiter: Optional[RateLimiter] = None
+        if config.rate_limit is not None:
+            self.rate_limiter = RateLimiter(config.rate_limit, config.rate_limit_burst, config.rate_limit_max)
+        self.circuit_breaker: Optional[CircuitBreaker] = None
+        if config.circuit_breaker_failure_rate is not None:
+            self.circuit_breaker = CircuitBreaker(
+                config.circuit_breaker_failure_rate,
+                config.circuit_breaker_min_calls,
+                config.circuit_breaker_window,
+                config.circuit_breaker_reset_timeout,
+            )
+        self.coalescer: Optional[RequestCoalescer] = RequestCoalescer() if config.coalesce_requests else None
+        self._endpoint_names = {config.get_endpoint_url(name): name for name in ENDPOINTS}
         self._client: Optional[httpx.AsyncClient] = None
         self._sync_client: Optional[httpx.Client] = None
+        self._sync_client_lock = threading.Lock()
 
     async def __aenter__(self) -> "HTTPClient":
         """Async context manager entry."""
         await self._ensure_client()
+        if self.config.warm_connections > 0:
+            await self.warm_up(self.config.warm_connections)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -46,21 +83,81 @@ class HTTPClient:
         """Sync context manager exit."""
         self.close_sync()
 
+    def _build_timeout(self) -> httpx.Timeout:
+        """Build per-phase timeouts from the configuration."""
+        return httpx.Timeout(
+            self.config.timeout,
+            connect=self.config.connect_timeout,
+            read=self.config.read_timeout,
+            write=self.config.write_timeout,
+            pool=self.config.pool_timeout,
+        )
+
+    def _build_limits(self) -> httpx.Limits:
+        """Build connection pool limits from the configuration."""
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+    def _client_options(self) -> Dict[str, Any]:
+        """Build the keyword arguments shared by the async and sync httpx clients.
+
+        Raises:
+            ImportError: If HTTP/2 is enabled but the ``h2`` package is not installed.
+        """
+        if self.config.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError("HTTP/2 support requires the 'h2' package. Install it with: pip install zenopay-sdk[http2]")
+
+        return {
+            "timeout": self._build_timeout(),
+            "limits": self._build_limits(),
+            "headers": self.config.headers.copy(),
+            "http2": self.config.http2,
+        }
+
     async def _ensure_client(self) -> None:
         """Ensure async client is initialized."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.config.timeout,
-                headers=self.config.headers.copy(),
-            )
+            self._client = httpx.AsyncClient(**self._client_options())
 
     def _ensure_sync_client(self) -> None:
-        """Ensure sync client is initialized."""
+        """Ensure sync client is initialized, once even when called from worker threads."""
         if self._sync_client is None:
-            self._sync_client = httpx.Client(
-                timeout=self.config.timeout,
-                headers=self.config.headers.copy(),
-            )
+            with self._sync_client_lock:
+                if self._sync_client is None:
+                    self._sync_client = httpx.Client(**self._client_options())
+
+    async def warm_up(self, connections: Optional[int] = None) -> int:
+        """Open pooled connections ahead of the first burst of requests.
+
+        Sends concurrent HEAD requests to the base URL so that TCP and TLS handshakes
+        happen up front and the connections are kept alive in the pool. Failures are
+        ignored; warming is best effort.
+
+        Args:
+            connections: Number of connections to open. Defaults to ``config.warm_connections``.
+                Capped at ``config.max_keepalive_connections``.
+
+        Returns:
+            Number of warm-up requests that succeeded.
+        """
+        await self._ensure_client()
+        if self._client is None:
+            return 0
+
+        count = min(connections or self.config.warm_connections, self.config.max_keepalive_connections)
+        if count <= 0:
+            return 0
+
+        results = await asyncio.gather(
+            *(self._client.head(self.config.base_url) for _ in range(count)),
+            return_exceptions=True,
+        )
+        warmed = sum(1 for result in results if isinstance(result, httpx.Response))
+        logger.debug("Warmed %d of %d connections to %s", warmed, count, self.config.base_url)
+        return warmed
 
     async def close(self) -> None:
         """Close the async HTTP client."""
@@ -74,9 +171,145 @@ class HTTPClient:
             self._sync_client.close()
             self._sync_client = None
 
-    def _clean_params(self, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    def fork(self) -> "HTTPClient":
+        """Create a client with connection pools of its own, sharing everything else.
+
+        The retry policy, hooks, metrics, tracer, rate limiter, circuit breaker and
+        coalescer are shared, so the fork's calls are paced and counted together with this
+        client's. An httpx async client is bound to one event loop; a fork lets another
+        loop make API calls without touching this client's pool.
+
+        Returns:
+            The new client. It must be closed separately.
+        """
+        client = copy.copy(self)
+        client._client = None
+        client._sync_client = None
+        client._sync_client_lock = threading.Lock()
+        return client
+
+    def use_tracer(self, tracer: Optional[Tracer]) -> None:
+        """Trace API calls with a tracer, or turn tracing off.
+
+        Args:
+            tracer: Tracer creating the spans, e.g. an ``OpenTelemetryTracer``. None restores the no-op default.
+
+        Examples:
+            >>> from elusion.zenopay.http import OpenTelemetryTracer
+            >>> client.http_client.use_tracer(OpenTelemetryTracer())
+        """
+        self.tracer = tracer or NOOP_TRACER
+
+    def use_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """Pace requests with a rate limiter, or turn rate limiting off.
+
+        Args:
+            rate_limiter: Rate limiter shared by every service using this client. None disables rate limiting.
+
+        Examples:
+            >>> from elusion.zenopay.http import RateLimiter
+            >>> client.http_client.use_rate_limiter(RateLimiter(rate=5, max_rate=20))
+        """
+        self.rate_limiter = rate_limiter
+
+    def use_circuit_breaker(self, circuit_breaker: Optional[CircuitBreaker]) -> None:
+        """Fail fast on endpoints that keep failing, or turn circuit breaking off.
+
+        Args:
+            circuit_breaker: Circuit breaker shared by every service using this client. None disables circuit breaking.
+        """
+        self.circuit_breaker = circuit_breaker
+
+    def on_circuit_change(self, hook: CircuitHook) -> CircuitHook:
+        """Register a hook called whenever an endpoint's circuit opens, half-opens or closes.
+
+        Args:
+            hook: Called with the ``CircuitEvent``.
+
+        Returns:
+            The hook, so this can be used as a decorator.
+
+        Raises:
+            ValueError: If circuit breaking is not enabled.
+        """
+        if self.circuit_breaker is None:
+            raise ValueError("Circuit breaking is disabled. Set circuit_breaker_failure_rate or call use_circuit_breaker() first.")
+        return self.circuit_breaker.on_state_change(hook)
+
+    def on_request(self, hook: RequestHook) -> RequestHook:
+        """Register a hook called before every request attempt.
+
+        Args:
+            hook: Called with the ``RequestEvent`` of the attempt.
+
+        Returns:
+            The hook, so this can be used as a decorator.
+
+        Examples:
+            >>> @client.http_client.on_request
+            ... def log_request(event):
+            ...     print(f"{event.method} {event.endpoint} (attempt {event.attempt})")
+        """
+        self.hooks.request.append(hook)
+        return hook
+
+    def on_response(self, hook: RequestHook) -> RequestHook:
+        """Register a hook called with every HTTP response, successful or not.
+
+        Args:
+            hook: Called with the ``RequestEvent`` carrying the status code, sizes and timings.
+
+        Returns:
+            The hook, so this can be used as a decorator.
+
+        Examples:
+            >>> @client.http_client.on_response
+            ... def record_latency(event):
+            ...     latency.labels(event.endpoint, event.status_code).observe(event.timing.total)
+        """
+        self.hooks.response.append(hook)
+        return hook
+
+    def on_error(self, hook: RequestHook) -> RequestHook:
+        """Register a hook called when a request attempt fails.
+
+        Args:
+            hook: Called with the ``RequestEvent`` whose ``error`` is the SDK error raised.
+
+        Returns:
+            The hook, so this can be used as a decorator.
+        """
+        self.hooks.error.append(hook)
+        return hook
+
+    def on_retry(self, hook: RequestHook) -> RequestHook:
+        """Register a hook called when a failed attempt is about to be retried.
+
+        Args:
+            hook: Called with the ``RequestEvent`` of the failed attempt and its ``retry_delay``.
+
+        Returns:
+            The hook, so this can be used as a decorator.
+        """
+        self.hooks.retry.append(hook)
+        return hook
+
+    def remove_hook(self, hook: RequestHook) -> bool:
+        """Remove a hook registered with any of the ``on_*`` methods.
+
+        Args:
+            hook: Hook to remove.
+
+        Returns:
+            True if the hook was registered.
+        """
+        return self.hooks.remove(hook)
+
+    def _clean_params(self, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Clean query parameters by removing None values and converting to strings.
 
+        Parameters that are already all strings are returned as-is without copying.
+
         Args:
             params: Query parameters to clean.
 
@@ -86,6 +319,9 @@ class HTTPClient:
         if not params:
             return None
 
+        if all(type(value) is str for value in params.values()):
+            return params
+
         cleaned_params: Dict[str, str] = {}
         for key, value in params.items():
             if value is not None:
@@ -96,6 +332,8 @@ class HTTPClient:
     def _clean_data(self, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Clean form data by removing None values and converting to strings.
 
+        Form data that is already all strings is returned as-is without copying.
+
         Args:
             data: Form data to clean.
 
@@ -105,6 +343,9 @@ class HTTPClient:
         if not data:
             return None
 
+        if all(type(value) is str for value in data.values()):
+            return data
+
         cleaned_data: Dict[str, Any] = {}
         for key, value in data.items():
             if value is not None:
@@ -112,85 +353,262 @@ class HTTPClient:
 
         return cleaned_data if cleaned_data else None
 
-    async def request(
+    def prepare(
         self,
         method: str,
         url: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        endpoint: Optional[str] = None,
         **kwargs: Any,
-    ) -> Dict[str, Any]:
-        """Make an async HTTP request.
+    ) -> PreparedRequest:
+        """Build a request, cleaning its form data and query parameters.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.).
             url: Request URL.
             data: Form data to send (for POST/PUT requests).
             params: Query parameters to send (for GET requests).
-            headers: Additional headers.
+            headers: Additional headers, merged over the client's default headers.
+            idempotent: Whether the request can safely be repeated. Defaults to True for
+                GET, HEAD, OPTIONS, PUT and DELETE, and False otherwise.
+            endpoint: Name of the endpoint in ``ENDPOINTS`` reported to hooks. Looked up from the URL by default.
             **kwargs: Additional arguments for httpx.
 
         Returns:
-            Parsed response data.
+            Request ready to be passed to ``exchange``.
+        """
+        if idempotent is None:
+            idempotent = self.retry_policy.is_idempotent(method)
+        if endpoint is None:
+            endpoint = self._endpoint_names.get(url)
+        return PreparedRequest(method, url, self._clean_data(data), self._clean_params(params), headers, kwargs, idempotent, endpoint)
+
+    def exchange(self, request: PreparedRequest) -> Pipeline[httpx.Response]:
+        """Pipeline sending a request, classifying failures and retrying transient ones.
+
+        Transport errors are mapped to SDK errors and unsuccessful responses to the
+        matching API error. Retryable failures are retried after a backoff as decided
+        by ``retry_policy``. Every attempt is first checked against ``circuit_breaker``
+        and takes a token from ``rate_limiter`` when these are set; identical GETs in
+        flight at the same time share one upstream request through ``coalescer``. The
+        call is recorded in ``metrics`` when enabled.
+
+        Args:
+            request: Request to send.
+
+        Returns:
+            Pipeline returning the successful HTTP response.
 
         Raises:
             ZenoPayAPIError: For API errors.
             ZenoPayNetworkError: For network errors.
             ZenoPayTimeoutError: For timeout errors.
+            ZenoPayCircuitOpenError: If the endpoint's circuit is open.
         """
-        await self._ensure_client()
+        metrics = self.metrics
+        if metrics is None:
+            return (yield from self._attempts(request))
 
-        request_headers = self.config.headers.copy()
-        if headers:
-            request_headers.update(headers)
+        shard = metrics.shard(request.endpoint)
+        shard.started += 1
+        started = time.perf_counter()
+        try:
+            response = yield from self._attempts(request)
+        except GeneratorExit:
+            shard.cancelled += 1
+            raise
+        except BaseException as e:
+            shard.record(time.perf_counter() - started, e)
+            raise
+        shard.record(time.perf_counter() - started)
+        return response
+
+    def _attempts(self, request: PreparedRequest) -> Pipeline[httpx.Response]:
+        """Pipeline of the attempts of a request, calling hooks and backing off between retries."""
+        attempt = 0
+        circuit = None if self.circuit_breaker is None else self.circuit_breaker.circuit(request.endpoint)
+        bucket = None if self.rate_limiter is None else self.rate_limiter.bucket(request.endpoint)
+        generation = 0
+        while True:
+            if circuit is not None:
+                generation = circuit.allow()
+            if bucket is not None:
+                wait = bucket.acquire()
+                while wait > 0:
+                    yield Sleep(wait)
+                    wait = bucket.acquire()
+            event = RequestEvent(request.method, request.url, request.endpoint, attempt) if self.hooks else None
+            if event is not None:
+                request.timing = event.timing
+                RequestHooks.call(self.hooks.request, event)
+            else:
+                request.timing = None if request.span is None else RequestTiming()
+            status_code: Optional[int] = None
+            try:
+                try:
+                    response: httpx.Response = yield request
+                except ZenoPayError:
+                    raise
+                except Exception as e:
+                    raise self._transport_error(e) from e
+                status_code = response.status_code
+                if event is not None:
+                    self._record_response(event, response)
+                self._raise_for_error(response)
+                if circuit is not None:
+                    circuit.record(False, generation)
+                if bucket is not None:
+                    bucket.on_success()
+                if request.span is not None:
+                    self._trace_attempt(request, attempt, status_code, None)
+                return response
+            except ZenoPayError as e:
+                if circuit is not None:
+                    circuit.record(CircuitBreaker.is_failure(e), generation)
+                if bucket is not None and isinstance(e, ZenoPayRateLimitError):
+                    bucket.on_rate_limited(RetryPolicy.retry_after(e))
+                retry = self.retry_policy.should_retry(e, attempt, request.idempotent)
+                if event is not None:
+                    self._record_error(event, e)
+                if request.span is not None:
+                    self._trace_attempt(request, attempt, status_code, e)
+                if not retry:
+                    raise
+                delay = self.retry_policy.get_delay(e, attempt)
+                self._log_retry(request.method, request.url, e, attempt, delay)
+                if self.metrics is not None:
+                    self.metrics.shard(request.endpoint).retries += 1
+                if event is not None:
+                    event.retry_delay = delay
+                    RequestHooks.call(self.hooks.retry, event)
+                attempt += 1
+            yield Sleep(delay)
+
+    def _record_response(self, event: RequestEvent, response: httpx.Response) -> None:
+        """Complete an event with the response of its attempt and call the response hooks."""
+        event.timing.finish()
+        event.status_code = response.status_code
+        event.bytes_sent = int(response.request.headers.get("content-length", 0))
+        event.bytes_received = response.num_bytes_downloaded
+        RequestHooks.call(self.hooks.response, event)
+
+    @staticmethod
+    def _trace_attempt(request: PreparedRequest, attempt: int, status_code: Optional[int], error: Optional[ZenoPayError]) -> None:
+        """Add the ``pool_wait`` and ``network`` child spans of a finished attempt to the request's span."""
+        span, timing = request.span, request.timing
+        if span is None or timing is None:
+            return
+        if timing.total is None:
+            timing.finish()
+
+        attributes: Dict[str, Any] = {"zenopay.attempt": attempt}
+        if status_code is not None:
+            attributes["http.status_code"] = status_code
+        network_started = 0.0
+        if timing.pool_wait is not None:
+            network_started = timing.pool_wait
+            span.child("pool_wait", attributes, start_time_ns=timing.started_ns).end(timing.epoch_ns(network_started))
+
+        network = span.child("network", attributes, start_time_ns=timing.epoch_ns(network_started))
+        if error is not None:
+            network.record_exception(error)
+        network.end(timing.epoch_ns(timing.total or 0.0))
+
+    def _record_error(self, event: RequestEvent, error: ZenoPayError) -> None:
+        """Complete an event with the error of its attempt and call the error hooks."""
+        if event.timing.total is None:
+            event.timing.finish()
+        event.error = error
+        RequestHooks.call(self.hooks.error, event)
+
+    async def run(self, pipeline: Pipeline[T]) -> T:
+        """Run a request pipeline with the async HTTP client.
 
-        cleaned_data = self._clean_data(data)
-        cleaned_params = self._clean_params(params)
+        Args:
+            pipeline: Pipeline to run, e.g. from ``exchange``.
 
-        try:
+        Returns:
+            Result of the pipeline.
+        """
+        await self._ensure_client()
+        return await drive(pipeline, self._transport_send)
 
-            if self._client is None:
-                raise ZenoPayNetworkError("Async HTTP client is not initialized.", None)
+    def run_sync(self, pipeline: Pipeline[T]) -> T:
+        """Run a request pipeline with the sync HTTP client.
 
-            response = await self._client.request(
-                method=method,
-                url=url,
-                data=cleaned_data,
-                params=cleaned_params,
-                headers=request_headers,
-                **kwargs,
-            )
+        Args:
+            pipeline: Pipeline to run, e.g. from ``exchange``.
 
-            return await self._handle_response(response)
+        Returns:
+            Result of the pipeline.
+        """
+        self._ensure_sync_client()
+        return drive_sync(pipeline, self._transport_send_sync)
 
-        except httpx.TimeoutException as e:
-            raise ZenoPayTimeoutError(
-                f"Request timeout after {self.config.timeout} seconds",
-                self.config.timeout,
-            ) from e
-        except httpx.NetworkError as e:
-            raise ZenoPayNetworkError(f"Network error: {str(e)}", e) from e
-        except Exception as e:
-            raise ZenoPayNetworkError(f"Unexpected error: {str(e)}", e) from e
+    async def _transport_send(self, request: PreparedRequest) -> httpx.Response:
+        """Send a single request attempt with the async HTTP client, joining an identical GET in flight when coalescing."""
+        if self._client is None:
+            raise ZenoPayNetworkError("Async HTTP client is not initialized.", None)
+        client = self._client
+        kwargs = request.kwargs if request.timing is None else self._with_trace(request.kwargs, request.timing.atrace)
+        if self.coalescer is not None:
+            key = self.coalescer.key(request)
+            if key is not None:
+                return await self.coalescer.send(
+                    key, lambda: client.request(request.method, request.url, params=request.params, headers=request.headers, **kwargs)
+                )
+        return await client.request(request.method, request.url, data=request.data, params=request.params, headers=request.headers, **kwargs)
+
+    def _transport_send_sync(self, request: PreparedRequest) -> httpx.Response:
+        """Send a single request attempt with the sync HTTP client, joining an identical GET in flight when coalescing."""
+        if self._sync_client is None:
+            raise ZenoPayNetworkError("Sync HTTP client is not initialized.", None)
+        client = self._sync_client
+        kwargs = request.kwargs if request.timing is None else self._with_trace(request.kwargs, request.timing.trace)
+        if self.coalescer is not None:
+            key = self.coalescer.key(request)
+            if key is not None:
+                return self.coalescer.send_sync(
+                    key, lambda: client.request(request.method, request.url, params=request.params, headers=request.headers, **kwargs)
+                )
+        return client.request(request.method, request.url, data=request.data, params=request.params, headers=request.headers, **kwargs)
+
+    @staticmethod
+    def _with_trace(kwargs: Dict[str, Any], trace: Any) -> Dict[str, Any]:
+        """Add an httpcore trace callback to the request extensions."""
+        return {**kwargs, "extensions": {**kwargs.get("extensions", {}), "trace": trace}}
+
+    def _transport_error(self, error: Exception) -> ZenoPayError:
+        """Map an exception raised by the transport to an SDK error."""
+        if isinstance(error, httpx.TimeoutException):
+            return ZenoPayTimeoutError(f"Request timeout after {self.config.timeout} seconds", self.config.timeout)
+        if isinstance(error, httpx.NetworkError):
+            return ZenoPayNetworkError(f"Network error: {str(error)}", error)
+        return ZenoPayNetworkError(f"Unexpected error: {str(error)}", error)
 
-    def request_sync(
+    async def request(
         self,
         method: str,
         url: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
-        """Make a sync HTTP request.
+        """Make an async HTTP request and decode the JSON response.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.).
             url: Request URL.
             data: Form data to send (for POST/PUT requests).
             params: Query parameters to send (for GET requests).
-            headers: Additional headers.
+            headers: Additional headers, merged over the client's default headers.
+            idempotent: Whether the request can safely be repeated. Defaults to True for
+                GET, HEAD, OPTIONS, PUT and DELETE, and False otherwise.
             **kwargs: Additional arguments for httpx.
 
         Returns:
@@ -201,127 +619,170 @@ class HTTPClient:
             ZenoPayNetworkError: For network errors.
             ZenoPayTimeoutError: For timeout errors.
         """
-        self._ensure_sync_client()
-
-        request_headers = self.config.headers.copy()
-        if headers:
-            request_headers.update(headers)
+        response = await self.send(method, url, data=data, params=params, headers=headers, idempotent=idempotent, **kwargs)
+        return self._decode_response(response)
 
-        cleaned_data = self._clean_data(data)
-        cleaned_params = self._clean_params(params)
-
-        try:
-
-            if self._sync_client is None:
-                raise ZenoPayNetworkError("Sync HTTP client is not initialized.", None)
+    async def send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send an async HTTP request, retrying transient failures.
 
-            response = self._sync_client.request(
-                method=method,
-                url=url,
-                data=cleaned_data,
-                params=cleaned_params,
-                headers=request_headers,
-                **kwargs,
-            )
+        Unlike ``request``, the successful response is returned undecoded so callers can
+        validate the raw body directly.
 
-            # Log response details for debugging
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.).
+            url: Request URL.
+            data: Form data to send (for POST/PUT requests).
+            params: Query parameters to send (for GET requests).
+            headers: Additional headers, merged over the client's default headers.
+            idempotent: Whether the request can safely be repeated. Defaults to True for
+                GET, HEAD, OPTIONS, PUT and DELETE, and False otherwise.
+            **kwargs: Additional arguments for httpx.
 
-            return self._handle_response_sync(response)
+        Returns:
+            Successful HTTP response.
 
-        except httpx.TimeoutException as e:
-            raise ZenoPayTimeoutError(
-                f"Request timeout after {self.config.timeout} seconds",
-                self.config.timeout,
-            ) from e
-        except httpx.NetworkError as e:
-            raise ZenoPayNetworkError(f"Network error: {str(e)}", e) from e
-        except Exception as e:
-            raise ZenoPayNetworkError(f"Unexpected error: {str(e)}", e) from e
+        Raises:
+            ZenoPayAPIError: For API errors.
+            ZenoPayNetworkError: For network errors.
+            ZenoPayTimeoutError: For timeout errors.
+        """
+        request = self.prepare(method, url, data=data, params=params, headers=headers, idempotent=idempotent, **kwargs)
+        return await self.run(self.exchange(request))
 
-    async def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
-        """Handle HTTP response for async requests.
+    def request_sync(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make a sync HTTP request and decode the JSON response.
 
         Args:
-            response: HTTP response object.
+            method: HTTP method (GET, POST, PUT, DELETE, etc.).
+            url: Request URL.
+            data: Form data to send (for POST/PUT requests).
+            params: Query parameters to send (for GET requests).
+            headers: Additional headers, merged over the client's default headers.
+            idempotent: Whether the request can safely be repeated. Defaults to True for
+                GET, HEAD, OPTIONS, PUT and DELETE, and False otherwise.
+            **kwargs: Additional arguments for httpx.
 
         Returns:
             Parsed response data.
 
         Raises:
             ZenoPayAPIError: For API errors.
+            ZenoPayNetworkError: For network errors.
+            ZenoPayTimeoutError: For timeout errors.
         """
+        response = self.send_sync(method, url, data=data, params=params, headers=headers, idempotent=idempotent, **kwargs)
+        return self._decode_response(response)
 
-        response_data: Dict[str, Any] = {}
-
-        try:
-            response_data = response.json()
-        except Exception:
-            response_text = response.text
+    def send_sync(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a sync HTTP request, retrying transient failures.
 
-            if response.is_success:
-                return {
-                    "success": True,
-                    "data": response_text,
-                    "message": "Request successful",
-                }
-            else:
-                response_data = {
-                    "success": False,
-                    "error": response_text or f"HTTP {response.status_code}",
-                    "message": f"Request failed with status {response.status_code}",
-                    "status_code": response.status_code,
-                }
+        Unlike ``request_sync``, the successful response is returned undecoded so callers
+        can validate the raw body directly.
 
-        if response.is_success:
-            return response_data
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.).
+            url: Request URL.
+            data: Form data to send (for POST/PUT requests).
+            params: Query parameters to send (for GET requests).
+            headers: Additional headers, merged over the client's default headers.
+            idempotent: Whether the request can safely be repeated. Defaults to True for
+                GET, HEAD, OPTIONS, PUT and DELETE, and False otherwise.
+            **kwargs: Additional arguments for httpx.
 
-        error_message = self._extract_error_message(response_data, response)
-        error_code = response_data.get("code") or response_data.get("error_code")
+        Returns:
+            Successful HTTP response.
 
-        raise create_api_error(
-            status_code=response.status_code,
-            message=error_message,
-            response_data=response_data,
-            error_code=error_code,
+        Raises:
+            ZenoPayAPIError: For API errors.
+            ZenoPayNetworkError: For network errors.
+            ZenoPayTimeoutError: For timeout errors.
+        """
+        request = self.prepare(method, url, data=data, params=params, headers=headers, idempotent=idempotent, **kwargs)
+        return self.run_sync(self.exchange(request))
+
+    def _log_retry(self, method: str, url: str, error: ZenoPayError, attempt: int, delay: float) -> None:
+        """Log a retry decision."""
+        logger.warning(
+            "Retrying %s %s in %.2fs after %s (retry %d of %d)",
+            method,
+            url,
+            delay,
+            type(error).__name__,
+            attempt + 1,
+            self.retry_policy.max_retries,
         )
 
-    def _handle_response_sync(self, response: httpx.Response) -> Dict[str, Any]:
-        """Handle HTTP response for sync requests.
+    def _decode_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Decode a successful HTTP response.
 
         Args:
-            response: HTTP response object.
+            response: Successful HTTP response object.
 
         Returns:
-            Parsed response data.
+            Parsed JSON data, or a success envelope around a plain-text body.
+        """
+        try:
+            response_data: Dict[str, Any] = response.json()
+        except Exception:
+            return {
+                "success": True,
+                "data": response.text,
+                "message": "Request successful",
+            }
+
+        return response_data
+
+    def _raise_for_error(self, response: httpx.Response) -> None:
+        """Raise the matching API error for an unsuccessful HTTP response.
+
+        Args:
+            response: HTTP response object.
 
         Raises:
             ZenoPayAPIError: For API errors.
         """
-
-        response_data: Dict[str, Any] = {}
+        if response.is_success:
+            return
 
         try:
-            response_data = response.json()
+            response_data: Dict[str, Any] = response.json()
         except Exception:
             response_text = response.text
-
-            if response.is_success:
-                return {
-                    "success": True,
-                    "data": response_text,
-                    "message": "Request successful",
-                }
-            else:
-                response_data = {
-                    "success": False,
-                    "error": response_text or f"HTTP {response.status_code}",
-                    "message": f"Request failed with status {response.status_code}",
-                    "status_code": response.status_code,
-                }
-
-        if response.is_success:
-            return response_data
-
+            response_data = {
+                "success": False,
+                "error": response_text or f"HTTP {response.status_code}",
+                "message": f"Request failed with status {response.status_code}",
+                "status_code": response.status_code,
+            }
+
+        self._add_retry_after(response_data, response)
         error_message = self._extract_error_message(response_data, response)
         error_code = response_data.get("code") or response_data.get("error_code")
 
@@ -332,6 +793,20 @@ class HTTPClient:
             error_code=error_code,
         )
 
+    def _add_retry_after(self, response_data: Dict[str, Any], response: httpx.Response) -> None:
+        """Copy the Retry-After header into rate limit error data when the body lacks it.
+
+        Args:
+            response_data: Parsed response data.
+            response: HTTP response object.
+        """
+        if response.status_code != 429 or "retry_after" in response_data:
+            return
+
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            response_data["retry_after"] = int(retry_after)
+
     def _extract_error_message(self, response_data: Dict[str, Any], response: httpx.Response) -> str:
         """Extract detailed error message from response data.
 
@@ -365,9 +840,6 @@ class HTTPClient:
             formatted_errors = "; ".join(error_parts)
             return formatted_errors
 
-        if "success" in response_data and response_data["success"] is False:
-            print("DEBUG: Response indicates failure, checking for error details")
-
         if "error" in response_data and isinstance(response_data["error"], dict):
             nested_error: Dict[str, Any] = response_data["error"]  # type: ignore
             for field in error_fields:
@@ -0,0 +1,75 @@
+"""Coalescing of identical in-flight GET requests for the ZenoPay HTTP client."""
+
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+import httpx
+
+from elusion.zenopay.http.pipeline import PreparedRequest
+from elusion.zenopay.utils.concurrency import SingleFlight
+
+
+class RequestCoalescer:
+    """Shares one upstream request between identical GETs in flight at the same time.
+
+    The first caller of a key sends the request; callers arriving while it is in flight
+    wait for it and receive the same ``httpx.Response``, or the same transport error.
+    Nothing is cached: once the response arrives, the next identical GET is sent again.
+    Async callers share a request per event loop; sync callers share the request across
+    threads. Each caller still classifies the response, retries and records metrics on
+    its own, so only the upstream traffic is shared.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty coalescer."""
+        self._flights: SingleFlight[Hashable, httpx.Response] = SingleFlight()
+
+    @staticmethod
+    def key(request: PreparedRequest) -> Optional[Hashable]:
+        """Get the key identical requests share.
+
+        Args:
+            request: Request about to be sent.
+
+        Returns:
+            The key, or None if the request must not be coalesced: it is not an
+            idempotent GET, or it carries a body or extra ``httpx`` options.
+        """
+        if request.method != "GET" or not request.idempotent or request.data is not None or request.kwargs:
+            return None
+        params: Tuple[Tuple[str, Any], ...] = tuple(sorted(request.params.items())) if request.params else ()
+        headers: Tuple[Tuple[str, str], ...] = tuple(sorted(request.headers.items())) if request.headers else ()
+        return (request.url, params, headers)
+
+    @property
+    def coalesced(self) -> int:
+        """Number of requests that joined one already in flight."""
+        return self._flights.coalesced
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently shared."""
+        return self._flights.in_flight
+
+    async def send(self, key: Hashable, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send a request, or join the identical one already in flight on this event loop.
+
+        Args:
+            key: Key from ``key``.
+            send: Coroutine function sending the request.
+
+        Returns:
+            Response of the shared request.
+        """
+        return await self._flights.run(key, send)
+
+    def send_sync(self, key: Hashable, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Sync counterpart of ``send``, joining identical requests across threads.
+
+        Args:
+            key: Key from ``key``.
+            send: Function sending the request.
+
+        Returns:
+            Response of the shared request.
+        """
+        return self._flights.run_sync(key, send)
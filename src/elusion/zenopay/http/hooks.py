@@ -0,0 +1,171 @@
+"""Request lifecycle hooks for instrumenting the ZenoPay HTTP client."""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTiming:
+    """Monotonic timings of one request attempt, in seconds.
+
+    Pool wait, connection and first-byte times are collected through the httpcore
+    ``trace`` extension, which is only attached while hooks are registered or tracing
+    is enabled. ``pool_wait`` is the time until a connection was acquired and the
+    request started on it; ``connect`` is 0.0 when a pooled connection was reused.
+    ``pool_wait`` and ``ttfb`` are None when the transport does not report them, e.g.
+    with a mocked transport.
+    """
+
+    __slots__ = ("started", "started_ns", "pool_wait", "connect", "ttfb", "total", "_connect_started")
+
+    def __init__(self) -> None:
+        """Start timing an attempt."""
+        self.started = time.perf_counter()
+        self.started_ns = time.time_ns()
+        self.pool_wait: Optional[float] = None
+        self.connect = 0.0
+        self.ttfb: Optional[float] = None
+        self.total: Optional[float] = None
+        self._connect_started: Optional[float] = None
+
+    def finish(self) -> None:
+        """Record the total duration of the attempt."""
+        self.total = time.perf_counter() - self.started
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback for the sync client."""
+        now = time.perf_counter()
+        if self.pool_wait is None and (name == "connection.connect_tcp.started" or name.endswith(".send_request_headers.started")):
+            self.pool_wait = now - self.started
+        if name == "connection.connect_tcp.started":
+            self._connect_started = now
+        elif name in ("connection.connect_tcp.complete", "connection.start_tls.complete") and self._connect_started is not None:
+            self.connect = now - self._connect_started
+        elif name.endswith(".receive_response_headers.complete"):
+            self.ttfb = now - self.started
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback for the async client."""
+        self.trace(name, info)
+
+    def epoch_ns(self, offset: float) -> int:
+        """Convert a duration since the start of the attempt to nanoseconds since the epoch.
+
+        Args:
+            offset: Seconds since the attempt started.
+
+        Returns:
+            Wall-clock time in nanoseconds.
+        """
+        return self.started_ns + int(offset * 1e9)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the timings."""
+        return f"RequestTiming(connect={self.connect!r}, ttfb={self.ttfb!r}, total={self.total!r})"
+
+
+class RequestEvent:
+    """Details of one request attempt, passed to every hook.
+
+    Attributes:
+        method: HTTP method.
+        url: Request URL.
+        endpoint: Name of the endpoint in ``ENDPOINTS``, or None for other URLs.
+        attempt: Zero-based attempt number; above 0 for retries.
+        timing: Timings of the attempt.
+        status_code: HTTP status of the response, or None if none was received.
+        bytes_sent: Size of the request body.
+        bytes_received: Size of the response body as read from the network.
+        error: Error raised by the attempt, for ``on_error`` and ``on_retry`` hooks.
+        retry_delay: Seconds until the next attempt, for ``on_retry`` hooks.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "endpoint",
+        "attempt",
+        "timing",
+        "status_code",
+        "bytes_sent",
+        "bytes_received",
+        "error",
+        "retry_delay",
+    )
+
+    def __init__(self, method: str, url: str, endpoint: Optional[str], attempt: int) -> None:
+        """Initialize the event for an attempt that is about to be sent."""
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.timing = RequestTiming()
+        self.status_code: Optional[int] = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.error: Optional[Exception] = None
+        self.retry_delay: Optional[float] = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the event."""
+        return f"RequestEvent({self.method} {self.endpoint or self.url}, attempt={self.attempt}, status_code={self.status_code})"
+
+
+RequestHook = Callable[[RequestEvent], Any]
+
+
+class RequestHooks:
+    """Hooks called around every request attempt.
+
+    * ``request``: before an attempt is sent.
+    * ``response``: when an HTTP response was received, successful or not.
+    * ``error``: when an attempt failed, with a transport or API error.
+    * ``retry``: when a failed attempt will be retried, before the backoff.
+
+    A hook that raises is logged and otherwise ignored, so instrumentation cannot fail
+    a payment. The collection is falsy while empty, which lets the client skip all
+    timing and event work when nothing is registered.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty hook lists."""
+        self.request: List[RequestHook] = []
+        self.response: List[RequestHook] = []
+        self.error: List[RequestHook] = []
+        self.retry: List[RequestHook] = []
+
+    def __bool__(self) -> bool:
+        """Whether any hook is registered."""
+        return bool(self.request or self.response or self.error or self.retry)
+
+    def remove(self, hook: RequestHook) -> bool:
+        """Remove a hook from every list it was registered in.
+
+        Args:
+            hook: Hook to remove.
+
+        Returns:
+            True if the hook was registered.
+        """
+        removed = False
+        for hooks in (self.request, self.response, self.error, self.retry):
+            while hook in hooks:
+                hooks.remove(hook)
+                removed = True
+        return removed
+
+    @staticmethod
+    def call(hooks: List[RequestHook], event: RequestEvent) -> None:
+        """Call hooks with an event, logging any that fail.
+
+        Args:
+            hooks: Hooks to call.
+            event: Event of the attempt.
+        """
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.error("Request hook %r failed for %s %s: %s", hook, event.method, event.url, e)
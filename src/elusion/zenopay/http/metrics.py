@@ -0,0 +1,341 @@
+"""Per-endpoint request metrics for the ZenoPay HTTP client."""
+
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+# Histogram resolution: 2**SUB_BUCKET_BITS buckets per doubling of latency, i.e. within 12.5%.
+SUB_BUCKET_BITS = 3
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_LINEAR_LIMIT = _SUB_BUCKETS * 2
+
+# Latencies are recorded in microseconds and clamped to about 134 seconds.
+MAX_TRACKED_MICROS = (1 << 27) - 1
+_BUCKET_COUNT = ((MAX_TRACKED_MICROS.bit_length() - SUB_BUCKET_BITS - 1) << SUB_BUCKET_BITS) + _LINEAR_LIMIT
+
+# Bucket bounds, in seconds, of the exported Prometheus histogram.
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Endpoint label of requests to URLs outside ``ENDPOINTS``.
+OTHER_ENDPOINT = "other"
+
+
+def bucket_index(micros: int) -> int:
+    """Get the histogram bucket of a latency.
+
+    Latencies below 16 microseconds have a bucket each; above that, every doubling is
+    split into 8 buckets, HDR histogram style.
+
+    Args:
+        micros: Latency in microseconds.
+
+    Returns:
+        Bucket index.
+    """
+    if micros < _LINEAR_LIMIT:
+        return micros if micros > 0 else 0
+    if micros > MAX_TRACKED_MICROS:
+        micros = MAX_TRACKED_MICROS
+    shift = micros.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift << SUB_BUCKET_BITS) + (micros >> shift)
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Get the highest latency, in microseconds, recorded in a bucket."""
+    if index < _LINEAR_LIMIT:
+        return index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = index - (shift << SUB_BUCKET_BITS)
+    return ((mantissa + 1) << shift) - 1
+
+
+class EndpointShard:
+    """Counters of one endpoint written by a single thread.
+
+    Only the owning thread increments a shard, so recording needs no lock; readers sum
+    all shards of an endpoint and may see counts a few requests behind.
+    """
+
+    __slots__ = ("started", "finished", "cancelled", "retries", "errors", "latency_sum", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize zeroed counters."""
+        self.started = 0
+        self.finished = 0
+        self.cancelled = 0
+        self.retries = 0
+        self.errors: Dict[str, int] = {}
+        self.latency_sum = 0.0
+        self.buckets = [0] * _BUCKET_COUNT
+
+    def record(self, elapsed: float, error: Optional[BaseException] = None) -> None:
+        """Record a finished call.
+
+        Args:
+            elapsed: Duration of the call in seconds, retries included.
+            error: Exception the call failed with, if any.
+        """
+        self.finished += 1
+        self.latency_sum += elapsed
+        # bucket_index, inlined: this runs on every request.
+        index = int(elapsed * 1e6)
+        if index >= _LINEAR_LIMIT:
+            if index > MAX_TRACKED_MICROS:
+                index = MAX_TRACKED_MICROS
+            shift = index.bit_length() - SUB_BUCKET_BITS - 1
+            index = (shift << SUB_BUCKET_BITS) + (index >> shift)
+        elif index < 0:
+            index = 0
+        self.buckets[index] += 1
+        if error is not None:
+            name = type(error).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def merged(self, other: "EndpointShard") -> "EndpointShard":
+        """Get a new shard holding the counts of this shard and another.
+
+        Args:
+            other: Shard to add.
+
+        Returns:
+            The summed shard.
+        """
+        shard = EndpointShard()
+        shard.started = self.started + other.started
+        shard.finished = self.finished + other.finished
+        shard.cancelled = self.cancelled + other.cancelled
+        shard.retries = self.retries + other.retries
+        shard.errors = dict(self.errors)
+        for name, count in list(other.errors.items()):
+            shard.errors[name] = shard.errors.get(name, 0) + count
+        shard.latency_sum = self.latency_sum + other.latency_sum
+        shard.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        return shard
+
+
+class _ThreadShards:
+    """Shards of one thread, held in the registry's thread-local storage."""
+
+    __slots__ = ("shards", "__weakref__")
+
+    def __init__(self) -> None:
+        """Initialize without shards."""
+        self.shards: Dict[Optional[str], EndpointShard] = {}
+
+
+class LatencySnapshot:
+    """Merged latency histogram of an endpoint."""
+
+    def __init__(self, buckets: List[int], total: float) -> None:
+        """Initialize the snapshot.
+
+        Args:
+            buckets: Counts per histogram bucket.
+            total: Sum of all latencies in seconds.
+        """
+        self.buckets = buckets
+        self.count = sum(buckets)
+        self.sum = total
+
+    def quantile(self, q: float) -> float:
+        """Get a latency quantile in seconds, accurate to the bucket resolution.
+
+        Args:
+            q: Quantile between 0 and 1.
+
+        Returns:
+            Upper bound of the bucket holding the quantile, or 0.0 without samples.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return bucket_upper_bound(index) / 1e6
+        return MAX_TRACKED_MICROS / 1e6
+
+    def cumulative(self, bounds: Tuple[float, ...]) -> List[int]:
+        """Count samples at or below each bound, for a Prometheus histogram.
+
+        Args:
+            bounds: Ascending bucket bounds in seconds.
+
+        Returns:
+            Cumulative count per bound.
+        """
+        counts = [0] * len(bounds)
+        for index, count in enumerate(self.buckets):
+            if count:
+                upper = bucket_upper_bound(index) / 1e6
+                for position, bound in enumerate(bounds):
+                    if upper <= bound:
+                        counts[position] += count
+        return counts
+
+
+class MetricsRegistry:
+    """Call counts, error counts, in-flight gauges and latency histograms per endpoint.
+
+    ``HTTPClient`` records every call, retries included, under its ``ENDPOINTS`` name.
+    Each thread records into its own ``EndpointShard``, so the hot path is a handful of
+    integer increments with no lock; ``snapshot`` and ``to_prometheus`` merge the shards.
+    When a thread exits, its shards are folded into a single retired shard per endpoint,
+    so servers starting a thread per request do not accumulate shards.
+
+    Examples:
+        >>> client.metrics.snapshot()["order_status"]["latency"]["p99"]
+        0.184
+        >>> print(client.metrics.to_prometheus())
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: Dict[str, List[EndpointShard]] = {}
+        self._retired: Dict[str, EndpointShard] = {}
+
+    def shard(self, endpoint: Optional[str]) -> EndpointShard:
+        """Get the calling thread's counters of an endpoint.
+
+        Args:
+            endpoint: Endpoint name, or None for URLs outside ``ENDPOINTS``.
+
+        Returns:
+            Shard to record into from this thread only.
+        """
+        try:
+            shards: Dict[Optional[str], EndpointShard] = self._local.owner.shards
+        except AttributeError:
+            owner = self._local.owner = _ThreadShards()
+            # Runs when the thread exits and its thread-local storage is cleared.
+            weakref.finalize(owner, MetricsRegistry._retire, weakref.ref(self), owner.shards).atexit = False
+            shards = owner.shards
+        shard = shards.get(endpoint)
+        if shard is None:
+            shard = shards[endpoint] = EndpointShard()
+            with self._lock:
+                self._shards.setdefault(endpoint or OTHER_ENDPOINT, []).append(shard)
+        return shard
+
+    def reset(self) -> None:
+        """Forget all recorded metrics."""
+        with self._lock:
+            self._shards = {}
+            self._retired = {}
+            self._local = threading.local()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Merge the recorded metrics into a dictionary per endpoint.
+
+        Returns:
+            Per endpoint: ``calls``, ``in_flight``, ``retries``, ``errors`` by exception class
+            and ``latency`` with ``count``, ``sum``, ``mean``, ``p50``, ``p90``, ``p99`` and ``max`` in seconds.
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        for endpoint, (calls, in_flight, retries, errors, latency) in self._merge().items():
+            result[endpoint] = {
+                "calls": calls,
+                "in_flight": in_flight,
+                "retries": retries,
+                "errors": errors,
+                "latency": {
+                    "count": latency.count,
+                    "sum": latency.sum,
+                    "mean": latency.sum / latency.count if latency.count else 0.0,
+                    "p50": latency.quantile(0.5),
+                    "p90": latency.quantile(0.9),
+                    "p99": latency.quantile(0.99),
+                    "max": latency.quantile(1.0),
+                },
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = "zenopay") -> str:
+        """Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prefix of the metric names.
+
+        Returns:
+            Exposition text, ending with a newline.
+        """
+        merged = self._merge()
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            return metric
+
+        metric = family("requests_total", "counter", "API calls completed, including failed ones.")
+        for endpoint, (calls, _, _, _, _) in merged.items():
+            lines.append(f'{metric}{{endpoint="{endpoint}"}} {calls}')
+
+        metric = family("request_errors_total", "counter", "API calls that failed, by exception class.")
+        for endpoint, (_, _, _, errors, _) in merged.items():
+            for error, count in sorted(errors.items()):
+                lines.append(f'{metric}{{endpoint="{endpoint}",error="{error}"}} {count}')
+
+        metric = family("request_retries_total", "counter", "Retried request attempts.")
+        for endpoint, (_, _, retries, _, _) in merged.items():
+            lines.append(f'{metric}{{endpoint="{endpoint}"}} {retries}')
+
+        metric = family("requests_in_flight", "gauge", "API calls currently in progress.")
+        for endpoint, (_, in_flight, _, _, _) in merged.items():
+            lines.append(f'{metric}{{endpoint="{endpoint}"}} {in_flight}')
+
+        metric = family("request_duration_seconds", "histogram", "Duration of API calls, retries included.")
+        for endpoint, (_, _, _, _, latency) in merged.items():
+            for bound, count in zip(PROMETHEUS_BUCKETS, latency.cumulative(PROMETHEUS_BUCKETS)):
+                lines.append(f'{metric}_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}')
+            lines.append(f'{metric}_bucket{{endpoint="{endpoint}",le="+Inf"}} {latency.count}')
+            lines.append(f'{metric}_sum{{endpoint="{endpoint}"}} {latency.sum}')
+            lines.append(f'{metric}_count{{endpoint="{endpoint}"}} {latency.count}')
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _retire(registry_ref: "weakref.ref[MetricsRegistry]", shards: Dict[Optional[str], EndpointShard]) -> None:
+        """Fold the shards of an exited thread into the retired shard of each endpoint."""
+        registry = registry_ref()
+        if registry is None:
+            return
+        with registry._lock:
+            for endpoint, shard in shards.items():
+                name = endpoint or OTHER_ENDPOINT
+                live = registry._shards.get(name, [])
+                if shard not in live:
+                    continue  # Dropped by reset
+                retired = registry._retired.get(name)
+                # The retired shard is replaced, never updated, so a concurrent _merge
+                # holding the old list still counts every call exactly once.
+                folded = retired.merged(shard) if retired is not None else shard
+                registry._shards[name] = [s for s in live if s is not shard and s is not retired] + [folded]
+                registry._retired[name] = folded
+
+    def _merge(self) -> Dict[str, Tuple[int, int, int, Dict[str, int], LatencySnapshot]]:
+        """Sum the shards of every endpoint."""
+        with self._lock:
+            endpoints = {endpoint: list(shards) for endpoint, shards in self._shards.items()}
+
+        merged: Dict[str, Tuple[int, int, int, Dict[str, int], LatencySnapshot]] = {}
+        for endpoint in sorted(endpoints):
+            calls = in_flight = retries = 0
+            total = 0.0
+            errors: Dict[str, int] = {}
+            buckets = [0] * _BUCKET_COUNT
+            for shard in endpoints[endpoint]:
+                calls += shard.finished
+                in_flight += shard.started - shard.finished - shard.cancelled
+                retries += shard.retries
+                total += shard.latency_sum
+                for error, count in list(shard.errors.items()):
+                    errors[error] = errors.get(error, 0) + count
+                for index, count in enumerate(shard.buckets):
+                    buckets[index] += count
+            merged[endpoint] = (calls, max(in_flight, 0), retries, errors, LatencySnapshot(buckets, total))
+        return merged
@@ -0,0 +1,149 @@
+"""Transport-agnostic request pipelines for the ZenoPay SDK.
+
+A pipeline is a generator that yields the I/O it needs, a ``PreparedRequest`` to send
+or a ``Sleep`` to wait, and returns its result. ``drive`` and ``drive_sync`` carry out
+those steps with an async or a sync transport, so building requests, retries, error
+classification and response parsing are written once and behave the same in both modes.
+Pipelines compose with ``yield from``.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Generator, Optional, TypeVar, Union
+
+import httpx
+
+from elusion.zenopay.http.hooks import RequestTiming
+from elusion.zenopay.http.tracing import Span
+
+T = TypeVar("T")
+
+
+class PreparedRequest:
+    """A request ready to be sent, with cleaned form data and query parameters."""
+
+    __slots__ = ("method", "url", "data", "params", "headers", "kwargs", "idempotent", "endpoint", "timing", "span")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        kwargs: Dict[str, Any],
+        idempotent: bool,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        """Initialize the request.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            data: Cleaned form data.
+            params: Cleaned query parameters.
+            headers: Additional headers, merged over the client's default headers.
+            kwargs: Additional arguments for httpx, e.g. ``content`` or ``json``.
+            idempotent: Whether the request can safely be repeated.
+            endpoint: Name of the endpoint in ``ENDPOINTS``, or None for other URLs.
+        """
+        self.method = method
+        self.url = url
+        self.data = data
+        self.params = params
+        self.headers = headers
+        self.kwargs = kwargs
+        self.idempotent = idempotent
+        self.endpoint = endpoint
+        self.timing: Optional[RequestTiming] = None
+        self.span: Optional[Span] = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the request."""
+        return f"PreparedRequest({self.method} {self.url})"
+
+
+class Sleep:
+    """A wait requested by a pipeline, e.g. a retry backoff."""
+
+    __slots__ = ("delay",)
+
+    def __init__(self, delay: float) -> None:
+        """Initialize the wait.
+
+        Args:
+            delay: Seconds to wait.
+        """
+        self.delay = delay
+
+
+Step = Union[PreparedRequest, Sleep]
+Pipeline = Generator[Step, Any, T]
+
+
+def drive_sync(pipeline: Pipeline[T], send: Callable[[PreparedRequest], httpx.Response]) -> T:
+    """Run a pipeline in the calling thread.
+
+    Each ``PreparedRequest`` is passed to ``send`` and the response sent back into the
+    pipeline; an exception raised by ``send`` is thrown into the pipeline instead.
+
+    If the run is interrupted by an exception the pipeline does not see, e.g.
+    ``KeyboardInterrupt``, the pipeline is closed before it propagates, so its cleanup
+    runs now and in this thread rather than whenever it is garbage collected.
+
+    Args:
+        pipeline: Pipeline to run.
+        send: Sends a request and returns the response.
+
+    Returns:
+        Result of the pipeline.
+    """
+    try:
+        step = next(pipeline)
+        while True:
+            try:
+                if isinstance(step, Sleep):
+                    time.sleep(step.delay)
+                    result: Optional[httpx.Response] = None
+                else:
+                    result = send(step)
+            except Exception as e:
+                step = pipeline.throw(e)
+            else:
+                step = pipeline.send(result)
+    except StopIteration as stop:
+        return stop.value  # type: ignore[no-any-return]
+    finally:
+        pipeline.close()
+
+
+async def drive(pipeline: Pipeline[T], send: Callable[[PreparedRequest], Awaitable[httpx.Response]]) -> T:
+    """Run a pipeline on the event loop.
+
+    Same as ``drive_sync``, with ``send`` awaited and waits done with ``asyncio.sleep``.
+    A cancelled run closes the pipeline before the cancellation propagates.
+
+    Args:
+        pipeline: Pipeline to run.
+        send: Coroutine function sending a request and returning the response.
+
+    Returns:
+        Result of the pipeline.
+    """
+    try:
+        step = next(pipeline)
+        while True:
+            try:
+                if isinstance(step, Sleep):
+                    await asyncio.sleep(step.delay)
+                    result: Optional[httpx.Response] = None
+                else:
+                    result = await send(step)
+            except Exception as e:
+                step = pipeline.throw(e)
+            else:
+                step = pipeline.send(result)
+    except StopIteration as stop:
+        return stop.value  # type: ignore[no-any-return]
+    finally:
+        pipeline.close()
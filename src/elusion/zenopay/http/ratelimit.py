@@ -0,0 +1,175 @@
+"""Client-side rate limiting for the ZenoPay HTTP client."""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from elusion.zenopay.http.metrics import OTHER_ENDPOINT
+
+# Factor the rate is multiplied by after a 429 response.
+DECREASE_FACTOR = 0.5
+
+# Seconds after a decrease during which further 429s only extend the pause. Requests
+# sent before the decrease are still answered at the old rate and must not halve it again.
+DECREASE_COOLDOWN = 1.0
+
+# Lowest rate, in requests per second, a bucket is slowed down to.
+MIN_RATE = 0.1
+
+
+class TokenBucket:
+    """Token bucket pacing the requests to one endpoint.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per second;
+    every request attempt takes one. The rate adapts to the server: a 429 response
+    halves it and pauses the endpoint for the ``retry_after`` the server asked for,
+    and every successful request raises it again, additively, up to ``max_rate``.
+    """
+
+    def __init__(self, rate: float, burst: int, max_rate: Optional[float] = None, increase: float = 1.0) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Initial rate in requests per second.
+            burst: Maximum number of tokens, i.e. requests sent back to back after an idle period.
+            max_rate: Highest rate the bucket recovers to after a 429. Defaults to ``rate``.
+            increase: Requests per second added to the rate per second of successful requests.
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.max_rate = max(rate, max_rate or rate)
+        self.min_rate = min(rate, MIN_RATE)
+        self.increase = increase
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if tokens >= 1.0:
+                self._tokens = tokens - 1.0
+                return 0.0
+            self._tokens = tokens
+            return (1.0 - tokens) / self.rate
+
+    def on_success(self) -> None:
+        """Raise the rate after a successful request, up to ``max_rate``."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a 429 response.
+
+        Args:
+            retry_after: Seconds the server asked to wait, paused for every request to the endpoint.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if now >= self._cooldown_until:
+                self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+                self._cooldown_until = max(self._paused_until, now + DECREASE_COOLDOWN)
+            self._tokens = 0.0
+            self._updated = max(now, self._paused_until)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._updated:
+                return 0.0
+            return min(self.burst, self._tokens + (now - self._updated) * self.rate)
+
+
+class RateLimiter:
+    """Per-endpoint token buckets shared by every service of an ``HTTPClient``.
+
+    Each endpoint in ``ENDPOINTS`` gets its own ``TokenBucket``, so bulk disbursements
+    do not slow down order status checks. Both the sync and async pipelines take a
+    token before every attempt, retries included, and wait without holding a
+    connection while the bucket is empty.
+
+    Examples:
+        >>> config = ZenoPayConfig(rate_limit=10, rate_limit_max=50)
+        >>> client = ZenoPayClient(config=config)
+        >>> client.http_client.rate_limiter.snapshot()["disbursement"]["rate"]
+        10.0
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None, max_rate: Optional[float] = None, increase: float = 1.0) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Initial rate per endpoint, in requests per second.
+            burst: Tokens per bucket. Defaults to one second's worth of requests.
+            max_rate: Highest rate an endpoint recovers to after a 429. Defaults to ``rate``.
+            increase: Requests per second added to the rate per second of successful requests.
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.max_rate = max_rate
+        self.increase = increase
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, endpoint: Optional[str]) -> TokenBucket:
+        """Get the bucket of an endpoint, creating it on first use.
+
+        Args:
+            endpoint: Endpoint name, or None for URLs outside ``ENDPOINTS``.
+
+        Returns:
+            The endpoint's token bucket.
+        """
+        name = endpoint or OTHER_ENDPOINT
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(name)
+                if bucket is None:
+                    bucket = self._buckets[name] = TokenBucket(self.rate, self.burst, self.max_rate, self.increase)
+        return bucket
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Get the state of every bucket.
+
+        Returns:
+            Per endpoint: current ``rate``, available ``tokens`` and the number of 429s seen as ``throttled``.
+        """
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {name: {"rate": bucket.rate, "tokens": bucket.tokens, "throttled": bucket.throttled} for name, bucket in sorted(buckets.items())}
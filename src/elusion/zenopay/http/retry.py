@@ -0,0 +1,165 @@
+"""Retry policy for the ZenoPay SDK HTTP client."""
+
+import random
+from typing import Optional
+
+import httpx
+
+from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.exceptions import (
+    ZenoPayAPIError,
+    ZenoPayCircuitOpenError,
+    ZenoPayError,
+    ZenoPayNetworkError,
+    ZenoPayRateLimitError,
+    ZenoPayServerError,
+)
+
+# Methods that can be repeated without changing the outcome on the server.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Transport errors raised before the request left the client, so the server never saw it.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to wait before the next attempt.
+
+    Retries use exponential backoff with jitter. Rate limit (429), server (5xx) and network
+    errors are retryable; validation and other 4xx errors never are. Non-idempotent requests
+    (POST by default) are only retried when the server cannot have processed them: a 429
+    rejection, or a transport error raised before the request was sent. This keeps a
+    disbursement from being submitted twice after an ambiguous failure.
+    """
+
+    def __init__(self, max_retries: int, retry_delay: float, retry_max_delay: float) -> None:
+        """Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt.
+            retry_delay: Base delay in seconds, doubled on every attempt.
+            retry_max_delay: Upper bound in seconds for a single backoff delay.
+        """
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+
+    @classmethod
+    def from_config(cls, config: ZenoPayConfig) -> "RetryPolicy":
+        """Create a retry policy from the SDK configuration.
+
+        Args:
+            config: ZenoPay configuration instance.
+
+        Returns:
+            Retry policy using the configured limits.
+        """
+        return cls(config.max_retries, config.retry_delay, config.retry_max_delay)
+
+    @staticmethod
+    def is_idempotent(method: str) -> bool:
+        """Check if an HTTP method is safe to repeat.
+
+        Args:
+            method: HTTP method name.
+
+        Returns:
+            True if the method is idempotent.
+        """
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def is_retryable(self, error: ZenoPayError, idempotent: bool) -> bool:
+        """Classify an error raised by a request.
+
+        Args:
+            error: Error raised by the request.
+            idempotent: Whether the request can safely be repeated.
+
+        Returns:
+            True if the request may be sent again.
+        """
+        if isinstance(error, ZenoPayRateLimitError):
+            return True
+        if isinstance(error, ZenoPayServerError):
+            return idempotent
+        if isinstance(error, ZenoPayNetworkError):
+            return idempotent or self._was_not_sent(error)
+        return False
+
+    @classmethod
+    def is_ambiguous(cls, error: ZenoPayError) -> bool:
+        """Check if the server may have processed a request that failed with this error.
+
+        Only 4xx rejections and requests that were never sent (an open circuit, a
+        transport error raised before sending, a request that failed to serialize) are
+        definite failures. Anything else, including a 2xx response that failed to parse,
+        leaves the outcome unknown.
+
+        Args:
+            error: Error raised by the request.
+
+        Returns:
+            True if the request may have taken effect.
+        """
+        if isinstance(error, ZenoPayCircuitOpenError):
+            return False
+        if isinstance(error, ZenoPayNetworkError):
+            return not cls._was_not_sent(error)
+        if isinstance(error, ZenoPayAPIError):
+            return error.status_code is None or not 400 <= error.status_code < 500
+        return True
+
+    def should_retry(self, error: ZenoPayError, attempt: int, idempotent: bool) -> bool:
+        """Check if a failed attempt should be retried.
+
+        Args:
+            error: Error raised by the attempt.
+            attempt: Zero-based number of the failed attempt.
+            idempotent: Whether the request can safely be repeated.
+
+        Returns:
+            True if another attempt should be made.
+        """
+        return attempt < self.max_retries and self.is_retryable(error, idempotent)
+
+    def get_delay(self, error: ZenoPayError, attempt: int) -> float:
+        """Compute the delay before the next attempt.
+
+        Args:
+            error: Error raised by the failed attempt.
+            attempt: Zero-based number of the failed attempt.
+
+        Returns:
+            Delay in seconds. Never shorter than the server's ``retry_after`` hint.
+        """
+        backoff = min(self.retry_max_delay, self.retry_delay * (1 << attempt))
+        delay = backoff / 2 + random.uniform(0, backoff / 2)
+
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+    @staticmethod
+    def retry_after(error: ZenoPayError) -> Optional[float]:
+        """Extract the server's retry hint from a rate limit error.
+
+        Args:
+            error: Error raised by the request.
+
+        Returns:
+            Seconds the server asked to wait, or None if it gave no hint.
+        """
+        if not isinstance(error, ZenoPayRateLimitError) or error.retry_after is None:
+            return None
+        try:
+            return max(0.0, float(error.retry_after))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _was_not_sent(error: ZenoPayNetworkError) -> bool:
+        """Check if a network error happened before the request reached the server."""
+        cause = error.original_error or error.__cause__
+        return isinstance(cause, _NOT_SENT_ERRORS)
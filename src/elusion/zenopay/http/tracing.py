@@ -0,0 +1,158 @@
+"""Tracing spans around ZenoPay API calls.
+
+Tracing is off by default: ``HTTPClient.tracer`` is a no-op ``Tracer`` whose ``enabled``
+flag lets services skip all span work. ``OpenTelemetryTracer`` adapts an OpenTelemetry
+tracer and imports ``opentelemetry`` only when it is created.
+"""
+
+from types import TracebackType
+from typing import Any, Dict, Optional, Type
+
+
+class Span:
+    """A traced operation. The base class does nothing and is shared by the no-op tracer."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the span.
+
+        Args:
+            key: Attribute name.
+            value: Attribute value.
+        """
+
+    def record_exception(self, error: BaseException) -> None:
+        """Record an exception and mark the span as failed.
+
+        Args:
+            error: Exception raised by the operation.
+        """
+
+    def child(self, name: str, attributes: Optional[Dict[str, Any]] = None, start_time_ns: Optional[int] = None) -> "Span":
+        """Start a child span.
+
+        Args:
+            name: Span name.
+            attributes: Initial attributes.
+            start_time_ns: Start time in nanoseconds since the epoch. Defaults to now.
+
+        Returns:
+            The child span.
+        """
+        return self
+
+    def end(self, end_time_ns: Optional[int] = None) -> None:
+        """End the span.
+
+        Args:
+            end_time_ns: End time in nanoseconds since the epoch. Defaults to now.
+        """
+
+    def __enter__(self) -> "Span":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """End the span, recording the exception that left the block, if any."""
+        if exc_val is not None:
+            self.record_exception(exc_val)
+        self.end()
+
+
+NOOP_SPAN = Span()
+
+
+class Tracer:
+    """Creates spans for API calls. The base class is the no-op default.
+
+    Each call produces a ``zenopay.<endpoint>`` span with children ``serialize``,
+    ``pool_wait`` and ``network`` per attempt, and ``parse``, carrying the endpoint,
+    HTTP status and ``resultcode`` as attributes.
+
+    Subclass it to send spans elsewhere, setting ``enabled`` to True.
+    """
+
+    enabled = False
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """Start a root span for an API call.
+
+        Args:
+            name: Span name.
+            attributes: Initial attributes.
+
+        Returns:
+            The span.
+        """
+        return NOOP_SPAN
+
+
+NOOP_TRACER = Tracer()
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer recording spans with OpenTelemetry.
+
+    Call spans are children of the span active when the call starts, so they nest
+    under your request or job spans. The child spans are parented explicitly rather
+    than made current, which keeps them correct across sync and async pipelines.
+
+    Examples:
+        >>> from elusion.zenopay.http import OpenTelemetryTracer
+        >>> client.use_tracer(OpenTelemetryTracer())
+    """
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None, name: str = "elusion.zenopay") -> None:
+        """Initialize the tracer.
+
+        Args:
+            tracer: OpenTelemetry ``Tracer`` to use. Defaults to ``trace.get_tracer(name)``.
+            name: Instrumentation name for the default tracer.
+
+        Raises:
+            ImportError: If the ``opentelemetry-api`` package is not installed.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("OpenTelemetry tracing requires the 'opentelemetry-api' package. Install it with: pip install zenopay-sdk[otel]") from e
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer(name)
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """Start a span as a child of the current OpenTelemetry context."""
+        return _OpenTelemetrySpan(self, self._tracer.start_span(name, attributes=attributes))
+
+
+class _OpenTelemetrySpan(Span):
+    """Span backed by an OpenTelemetry span."""
+
+    def __init__(self, tracer: OpenTelemetryTracer, span: Any) -> None:
+        self._tracer = tracer
+        self._span = span
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the OpenTelemetry span."""
+        self._span.set_attribute(key, value)
+
+    def record_exception(self, error: BaseException) -> None:
+        """Record an exception and set the OpenTelemetry span status to error."""
+        self._span.record_exception(error)
+        self._span.set_status(self._tracer._trace.Status(self._tracer._trace.StatusCode.ERROR, str(error)))
+
+    def child(self, name: str, attributes: Optional[Dict[str, Any]] = None, start_time_ns: Optional[int] = None) -> Span:
+        """Start an OpenTelemetry span parented to this one."""
+        context = self._tracer._trace.set_span_in_context(self._span)
+        span = self._tracer._tracer.start_span(name, context=context, attributes=attributes, start_time=start_time_ns)
+        return _OpenTelemetrySpan(self._tracer, span)
+
+    def end(self, end_time_ns: Optional[int] = None) -> None:
+        """End the OpenTelemetry span."""
+        self._span.end(end_time=end_time_ns)
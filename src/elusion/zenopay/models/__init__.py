@@ -1,6 +1,6 @@
 """Models package for the ZenoPay SDK."""
 
-from elusion.zenopay.models.common import PAYMENT_STATUSES, APIResponse, StatusCheckRequest, UtilityCodes, Currency
+from elusion.zenopay.models.common import PAYMENT_STATUSES, APIResponse, BatchResult, CacheStats, StatusCheckRequest, UtilityCodes, Currency
 from elusion.zenopay.models.utility_payments import (
     NewUtilityPayment,
     PensionMerchantService,
@@ -19,17 +19,24 @@ from elusion.zenopay.models.order import (
     Order,
     OrderResponse,
     OrderStatusResponse,
+    PaymentResolution,
 )
 
 from elusion.zenopay.models.webhook import (
     WebhookPayload,
     WebhookEvent,
     WebhookResponse,
+    DedupStats,
+    DispatchMetrics,
+    WebhookAuditRecord,
+    WebhookLogStats,
+    WebhookParseFailure,
 )
 
 from elusion.zenopay.models.disbursement import (
     NewDisbursement,
     DisbursementSuccessResponse,
+    DisbursementBatchReport,
 )
 
 __all__ = [
@@ -37,6 +44,8 @@ __all__ = [
     "PAYMENT_STATUSES",
     # Common models
     "APIResponse",
+    "BatchResult",
+    "CacheStats",
     "StatusCheckRequest",
     "UtilityCodes",
     "Currency",
@@ -47,13 +56,20 @@ __all__ = [
     "Order",
     "OrderResponse",
     "OrderStatusResponse",
+    "PaymentResolution",
     # Webhook models
     "WebhookPayload",
     "WebhookEvent",
     "WebhookResponse",
+    "DedupStats",
+    "DispatchMetrics",
+    "WebhookAuditRecord",
+    "WebhookLogStats",
+    "WebhookParseFailure",
     # Disbursement
     "NewDisbursement",
     "DisbursementSuccessResponse",
+    "DisbursementBatchReport",
     # Utility Payments
     "NewUtilityPayment",
     "PensionMerchantService",
@@ -2,10 +2,12 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from elusion.zenopay.exceptions import ZenoPayError
+
 T = TypeVar("T")
 
 
@@ -18,6 +20,38 @@ class APIResponse(BaseModel, Generic[T]):
     error: Optional[str] = Field(None, description="Error message if applicable")
 
 
+class BatchResult(BaseModel, Generic[T]):
+    """Outcome of a single item in a bulk operation."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(..., description="Zero-based position of the item in the input")
+    item: Any = Field(..., description="Input item the result belongs to")
+    response: Optional[APIResponse[T]] = Field(default=None, description="API response if the item succeeded")
+    error: Optional[ZenoPayError] = Field(default=None, description="Error raised if the item failed")
+
+    @property
+    def success(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+class CacheStats(BaseModel):
+    """Counters of a response cache."""
+
+    hits: int = Field(default=0, description="Lookups served from the cache")
+    misses: int = Field(default=0, description="Lookups that sent a request")
+    coalesced: int = Field(default=0, description="Lookups that joined a request already in flight")
+    evictions: int = Field(default=0, description="Entries evicted as least recently used")
+    size: int = Field(default=0, description="Entries currently cached")
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that did not send a request."""
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
 class TimestampedModel(BaseModel):
     """Base model with timestamp fields."""
 
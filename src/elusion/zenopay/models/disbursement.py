@@ -72,3 +72,26 @@ class DisbursementSuccessResponse(BaseModel):
             }
         }
     )
+
+
+class DisbursementBatchReport(BaseModel):
+    """Summary of a disbursement batch run."""
+
+    succeeded: int = Field(default=0, description="Disbursements acknowledged in this run")
+    failed: int = Field(default=0, description="Disbursements definitely rejected in this run")
+    in_doubt: int = Field(default=0, description="Disbursements sent in this run whose outcome is unknown")
+    skipped: int = Field(default=0, description="Disbursements not sent because the journal blocked them")
+    total_fee: int = Field(default=0, description="Sum of fees of acknowledged disbursements")
+    total_deducted: int = Field(default=0, description="Sum of amounts deducted for acknowledged disbursements")
+    total_amount_sent: int = Field(default=0, description="Sum of amounts sent to customers")
+    elapsed: float = Field(default=0.0, description="Wall-clock duration of the run in seconds")
+
+    @property
+    def submitted(self) -> int:
+        """Number of disbursements sent to the API in this run."""
+        return self.succeeded + self.failed + self.in_doubt
+
+    @property
+    def throughput(self) -> float:
+        """Disbursements sent per second."""
+        return self.submitted / self.elapsed if self.elapsed > 0 else 0.0
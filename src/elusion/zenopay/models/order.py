@@ -3,6 +3,8 @@
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from elusion.zenopay.models.webhook import WebhookEvent
+
 
 class OrderBase(BaseModel):
     """Base order model with common fields."""
@@ -190,3 +192,18 @@ class OrderStatusResponse(BaseModel):
     result: str
     message: str
     data: List[OrderData]
+
+
+class PaymentResolution(BaseModel):
+    """Final payment status of an order tracked by the payment status poller."""
+
+    order_id: str = Field(..., description="Order ID")
+    payment_status: str = Field(..., description="Final payment status (COMPLETED, FAILED or CANCELLED)")
+    source: str = Field(..., description="How the status was learned: 'poll' or 'webhook'")
+    order: Optional[OrderData] = Field(default=None, description="Order status record, when resolved by polling")
+    event: Optional[WebhookEvent] = Field(default=None, description="Webhook event, when resolved by a webhook")
+
+    @property
+    def is_paid(self) -> bool:
+        """Check if the order has been paid."""
+        return self.payment_status == "COMPLETED"
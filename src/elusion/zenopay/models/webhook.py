@@ -72,6 +72,7 @@ class WebhookEvent(BaseModel):
     raw_data: str = Field(..., description="Raw webhook data received")
     timestamp: Optional[str] = Field(None, description="Event timestamp")
     signature: Optional[str] = Field(None, description="Webhook signature for verification")
+    log_position: Optional[int] = Field(default=None, description="Position of the event in the webhook log, if one is used")
 
     @classmethod
     def from_raw_data(cls, raw_data: str) -> "WebhookEvent":
@@ -111,6 +112,7 @@ class WebhookResponse(BaseModel):
 
     status: str = Field("success", description="Response status")
     message: str = Field("Webhook received", description="Response message")
+    status_code: int = Field(default=200, description="HTTP status code to answer ZenoPay with", exclude=True)
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -120,3 +122,63 @@ class WebhookResponse(BaseModel):
             }
         }
     )
+
+
+class DispatchMetrics(BaseModel):
+    """Snapshot of webhook dispatch queue metrics."""
+
+    queue_depth: int = Field(default=0, description="Events waiting in the queue")
+    max_queue_depth: int = Field(default=0, description="Highest queue depth seen")
+    capacity: int = Field(default=0, description="Maximum number of queued events")
+    spill_depth: int = Field(default=0, description="Events waiting in the spill file")
+    enqueued: int = Field(default=0, description="Events accepted for dispatch")
+    processed: int = Field(default=0, description="Events handled successfully")
+    failed: int = Field(default=0, description="Events whose handler raised")
+    rejected: int = Field(default=0, description="Events rejected because the queue was full")
+    spilled: int = Field(default=0, description="Events written to the spill file because the queue was full")
+
+
+class DedupStats(BaseModel):
+    """Snapshot of webhook deduplication counters."""
+
+    checked: int = Field(default=0, description="Events checked against the store")
+    duplicates: int = Field(default=0, description="Redelivered events dropped as duplicates")
+    released: int = Field(default=0, description="Keys released so that a redelivery is handled again")
+    evictions: int = Field(default=0, description="Keys evicted to stay within the size limit")
+    size: int = Field(default=0, description="Keys currently remembered")
+
+
+class WebhookLogStats(BaseModel):
+    """Snapshot of webhook write-ahead log counters."""
+
+    appended: int = Field(default=0, description="Entries appended since the log was opened")
+    fsyncs: int = Field(default=0, description="fsync calls since the log was opened")
+    pending: int = Field(default=0, description="Entries whose handlers have not run yet")
+    failed: int = Field(default=0, description="Entries whose handlers failed, kept for the next replay")
+    segments: int = Field(default=0, description="Segment files on disk")
+    checkpoint: int = Field(default=0, description="Position of the oldest entry whose handlers have not run, failed entries aside")
+    end: int = Field(default=0, description="Position after the last entry")
+
+    @property
+    def appends_per_fsync(self) -> float:
+        """Average number of entries made durable by one fsync."""
+        return self.appended / self.fsyncs if self.fsyncs else 0.0
+
+
+class WebhookParseFailure(BaseModel):
+    """A record that could not be parsed by a batch webhook parse."""
+
+    line: int = Field(..., description="1-based record number in the input")
+    raw_data: str = Field(..., description="Raw record")
+    error: str = Field(..., description="Validation error message")
+
+
+class WebhookAuditRecord(BaseModel):
+    """Structured audit record of a webhook passing through ``WebhookService``."""
+
+    stage: str = Field(..., description="What happened: handled, failed, queued or duplicate")
+    order_id: str = Field(..., description="Order ID")
+    payment_status: str = Field(..., description="Payment status")
+    reference: Optional[str] = Field(default=None, description="Payment reference number")
+    recorded_at: float = Field(..., description="Unix time the record was created")
+    message: Optional[str] = Field(default=None, description="Error message for failed webhooks")
@@ -3,5 +3,6 @@ from elusion.zenopay.services.webhooks import WebhookService
 from elusion.zenopay.services.disbursements import DisbursementService
 from elusion.zenopay.services.utility_payments import UtilityPaymentsService
 from elusion.zenopay.services.checkout import CheckoutService
+from elusion.zenopay.services.poller import PaymentStatusPoller
 
-__all__ = ["OrderService", "WebhookService", "DisbursementService", "UtilityPaymentsService", "CheckoutService"]
+__all__ = ["OrderService", "WebhookService", "DisbursementService", "UtilityPaymentsService", "CheckoutService", "PaymentStatusPoller"]
@@ -1,13 +1,17 @@
 """Base service class for all ZenoPay SDK services."""
 
-from typing import Any, Dict, Type, TypeVar, Union, Optional
+import json
+from typing import Any, Dict, Generic, Type, TypeVar, Union, Optional
 
 from pydantic import BaseModel, ValidationError
 
 from elusion.zenopay.config import ZenoPayConfig
-from elusion.zenopay.exceptions import ZenoPayValidationError
+from elusion.zenopay.exceptions import ZenoPayResponseValidationError
 from elusion.zenopay.http import HTTPClient
+from elusion.zenopay.http.pipeline import Pipeline, PreparedRequest
+from elusion.zenopay.http.tracing import Tracer
 from elusion.zenopay.models.common import APIResponse
+from elusion.zenopay.services.parsing import get_response_parser
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -36,24 +40,22 @@ class BaseService:
         """
         return self.config.get_endpoint_url(endpoint)
 
-    def _prepare_request_data(self, data: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
-        """Prepare and validate data for API requests.
+    def _serialize_request_data(self, data: Union[BaseModel, Dict[str, Any]]) -> bytes:
+        """Serialize request data straight to a JSON body.
+
+        Validated models are serialized by pydantic-core directly to bytes, without an
+        intermediate dictionary.
 
         Args:
-            data: Data to prepare for the request.
+            data: Data to send in the request.
 
         Returns:
-            Prepared data dictionary for form submission.
-
-        Raises:
-            ZenoPayValidationError: If validation fails.
+            JSON request body.
         """
         if isinstance(data, BaseModel):
-            request_data = data.model_dump(exclude_unset=True, by_alias=True)
-        else:
-            request_data = data.copy()
+            return data.__pydantic_serializer__.to_json(data, exclude_unset=True, by_alias=True)
 
-        return request_data
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
     def _prepare_query_params(self, params: Optional[Union[BaseModel, Dict[str, Any]]] = None) -> Dict[str, Any]:
         """Prepare and validate query parameters for GET requests.
@@ -68,51 +70,144 @@ class BaseService:
             ZenoPayValidationError: If validation fails.
         """
         if params is None:
-            query_params = {}
-        elif isinstance(params, BaseModel):
-            query_params = params.model_dump(exclude_unset=True, by_alias=True)
-        else:
-            query_params = params.copy()
-
-        return query_params
+            return {}
+        if isinstance(params, BaseModel):
+            return params.model_dump(exclude_unset=True, by_alias=True)
+        return params
 
     def _parse_response(
         self,
         response_data: Dict[str, Any],
         model_class: Type[T],
+        status_code: int = 200,
     ) -> APIResponse[T]:
         """Parse API response into typed models.
 
         Args:
             response_data: Raw response data from API.
             model_class: Pydantic model class to parse data into.
+            status_code: HTTP status code of the response.
 
         Returns:
             Parsed response with typed data.
 
         Raises:
-            ZenoPayValidationError: If response parsing fails.
+            ZenoPayResponseValidationError: If response parsing fails.
         """
         try:
-            parsed_data = model_class.model_validate(response_data)
-            success = True
-            message = response_data.get("message", None)
-            error = None
-
-            return APIResponse[model_class](
-                success=success,
-                results=parsed_data,
-                message=message,
-                error=error,
-            )
+            return get_response_parser(model_class).parse(response_data)
+        except ValidationError as e:
+            raise ZenoPayResponseValidationError(
+                f"Failed to parse response: {str(e)}",
+                status_code,
+                validation_errors={"errors": e.errors()},
+            ) from e
+
+    def _parse_raw_response(self, content: bytes, model_class: Type[T], status_code: int = 200) -> APIResponse[T]:
+        """Parse a raw API response body into typed models.
+
+        Validates straight from the body bytes, skipping the intermediate dictionary.
 
+        Args:
+            content: Raw response body from the API.
+            model_class: Pydantic model class to parse data into.
+            status_code: HTTP status code of the response.
+
+        Returns:
+            Parsed response with typed data.
+
+        Raises:
+            ZenoPayResponseValidationError: If response parsing fails.
+        """
+        try:
+            return get_response_parser(model_class).parse_json(content)
         except ValidationError as e:
-            # print(f"{response_data}")
-            raise ZenoPayValidationError(
+            raise ZenoPayResponseValidationError(
                 f"Failed to parse response: {str(e)}",
+                status_code,
                 validation_errors={"errors": e.errors()},
             ) from e
 
+    def _prepare(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Union[BaseModel, Dict[str, Any]]],
+        params: Optional[Union[BaseModel, Dict[str, Any]]],
+    ) -> PreparedRequest:
+        """Build the request of an API call, with a JSON body or query parameters."""
+        url = self._build_url(endpoint)
+        if data is not None:
+            return self.http_client.prepare(method, url, endpoint=endpoint, content=self._serialize_request_data(data))
+        return self.http_client.prepare(method, url, params=self._prepare_query_params(params), endpoint=endpoint)
+
+    def _call(
+        self,
+        method: str,
+        endpoint: str,
+        model_class: Type[T],
+        data: Optional[Union[BaseModel, Dict[str, Any]]] = None,
+        params: Optional[Union[BaseModel, Dict[str, Any]]] = None,
+    ) -> Pipeline[APIResponse[T]]:
+        """Pipeline of an API call: build the request, send it and parse the response.
+
+        Args:
+            method: HTTP method.
+            endpoint: API endpoint name.
+            model_class: Model class to parse response into.
+            data: Data to send as the JSON body.
+            params: Query parameters to send with the request.
+
+        Returns:
+            Pipeline returning the parsed API response.
+        """
+        tracer = self.http_client.tracer
+        if tracer.enabled:
+            return (yield from self._traced_call(tracer, method, endpoint, model_class, data, params))
+
+        request = self._prepare(method, endpoint, data, params)
+        response = yield from self.http_client.exchange(request)
+        return self._parse_raw_response(response.content, model_class, response.status_code)
+
+    def _traced_call(
+        self,
+        tracer: Tracer,
+        method: str,
+        endpoint: str,
+        model_class: Type[T],
+        data: Optional[Union[BaseModel, Dict[str, Any]]],
+        params: Optional[Union[BaseModel, Dict[str, Any]]],
+    ) -> Pipeline[APIResponse[T]]:
+        """Pipeline of an API call wrapped in a ``zenopay.<endpoint>`` span.
+
+        The span gets ``serialize`` and ``parse`` children here, and ``pool_wait`` and
+        ``network`` children per attempt from ``HTTPClient.exchange``.
+        """
+        span = tracer.start_span(f"zenopay.{endpoint}", {"zenopay.endpoint": endpoint, "http.method": method})
+        try:
+            with span.child("serialize"):
+                request = self._prepare(method, endpoint, data, params)
+            request.span = span
+            response = yield from self.http_client.exchange(request)
+            span.set_attribute("http.status_code", response.status_code)
+
+            with span.child("parse"):
+                result = self._parse_raw_response(response.content, model_class, response.status_code)
+            resultcode = getattr(result.results, "resultcode", None)
+            if resultcode is not None:
+                span.set_attribute("zenopay.resultcode", str(resultcode))
+            return result
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            status_code = getattr(e, "status_code", None)
+            if status_code is not None:
+                span.set_attribute("http.status_code", status_code)
+            span.record_exception(e)
+            raise
+        finally:
+            span.end()
+
     async def post_async(
         self,
         endpoint: str,
@@ -129,11 +224,7 @@ class BaseService:
         Returns:
             Parsed API response.
         """
-        url = self._build_url(endpoint)
-        prepared_data = self._prepare_request_data(data)
-
-        response_data = await self.http_client.post(url, json=prepared_data)
-        return self._parse_response(response_data, model_class)
+        return await self.http_client.run(self._call("POST", endpoint, model_class, data=data))
 
     def post_sync(
         self,
@@ -151,11 +242,7 @@ class BaseService:
         Returns:
             Parsed API response.
         """
-        url = self._build_url(endpoint)
-        prepared_data = self._prepare_request_data(data)
-
-        response_data = self.http_client.post_sync(url, json=prepared_data)
-        return self._parse_response(response_data, model_class)
+        return self.http_client.run_sync(self._call("POST", endpoint, model_class, data=data))
 
     async def get_async(
         self,
@@ -173,11 +260,7 @@ class BaseService:
         Returns:
             Parsed API response.
         """
-        url = self._build_url(endpoint)
-        query_params = self._prepare_query_params(params)
-
-        response_data = await self.http_client.get(url, params=query_params)
-        return self._parse_response(response_data, model_class)
+        return await self.http_client.run(self._call("GET", endpoint, model_class, params=params))
 
     def get_sync(
         self,
@@ -195,8 +278,34 @@ class BaseService:
         Returns:
             Parsed API response.
         """
-        url = self._build_url(endpoint)
-        query_params = self._prepare_query_params(params)
+        return self.http_client.run_sync(self._call("GET", endpoint, model_class, params=params))
+
+
+S = TypeVar("S", bound=BaseService)
+
+
+class SyncMethods(BaseService, Generic[S]):
+    """Base class for the ``sync`` namespace of a service.
+
+    Holds no state of its own: the HTTP client and configuration are read from the
+    owning ``service``, so both namespaces always share them, and requests run through
+    the same pipelines as the async methods.
+    """
+
+    def __init__(self, service: S) -> None:
+        """Initialize the sync namespace.
+
+        Args:
+            service: Service the namespace belongs to.
+        """
+        self.service = service
+
+    @property
+    def http_client(self) -> HTTPClient:  # type: ignore[override]
+        """HTTP client of the owning service."""
+        return self.service.http_client
 
-        response_data = self.http_client.get_sync(url, params=query_params)
-        return self._parse_response(response_data, model_class)
+    @property
+    def config(self) -> ZenoPayConfig:  # type: ignore[override]
+        """Configuration of the owning service."""
+        return self.service.config
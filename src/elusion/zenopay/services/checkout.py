@@ -7,11 +7,11 @@ from elusion.zenopay.models.checkout import (
     NewCheckout,
     CheckoutResponse,
 )
-from elusion.zenopay.services.base import BaseService
+from elusion.zenopay.services.base import BaseService, SyncMethods
 
 
-class CheckoutSyncMethods(BaseService):
-    """Sync methods for CheckoutService - inherits from BaseService for direct access."""
+class CheckoutSyncMethods(SyncMethods["CheckoutService"]):
+    """Sync methods for CheckoutService, sharing its HTTP client and configuration."""
 
     def create(self, checkout_data: NewCheckout) -> APIResponse[CheckoutResponse]:
         """Create a new checkout session (sync).
@@ -31,7 +31,7 @@ class CheckoutService(BaseService):
     def __init__(self, http_client: HTTPClient, config: ZenoPayConfig):
         """Initialize CheckoutService with sync namespace."""
         super().__init__(http_client, config)
-        self.sync = CheckoutSyncMethods(http_client, config)
+        self.sync = CheckoutSyncMethods(self)
 
     async def create(self, checkout_data: NewCheckout) -> APIResponse[CheckoutResponse]:
         """Create a new checkout session (async).
@@ -1,17 +1,67 @@
 """Disbursement service for the ZenoPay SDK"""
 
-from elusion.zenopay.config import ZenoPayConfig
-from elusion.zenopay.http import HTTPClient
-from elusion.zenopay.models.common import APIResponse
+import time
+from typing import AsyncIterable, Callable, Iterable, Optional, Union
+
+from elusion.zenopay.config import DEFAULT_BULK_CONCURRENCY, ZenoPayConfig
+from elusion.zenopay.exceptions import ZenoPayError
+from elusion.zenopay.http import HTTPClient, RetryPolicy
+from elusion.zenopay.models.common import APIResponse, BatchResult
 from elusion.zenopay.models.disbursement import (
     NewDisbursement,
     DisbursementSuccessResponse,
+    DisbursementBatchReport,
 )
-from elusion.zenopay.services.base import BaseService
+from elusion.zenopay.services.base import BaseService, SyncMethods
+from elusion.zenopay.utils.concurrency import bounded_map, bounded_map_sync
+from elusion.zenopay.utils.journal import DisbursementJournal, JournalState
+
+DisbursementBatchResult = BatchResult[DisbursementSuccessResponse]
+
+# Outcome of one batch item: the journal state that blocked it, or the result of sending it.
+_Outcome = Union[JournalState, DisbursementBatchResult]
+
+
+def _journal_result(journal: DisbursementJournal, result: DisbursementBatchResult) -> DisbursementBatchResult:
+    """Record the outcome of a sent disbursement in the journal."""
+    transid = result.item.transid
+    if result.response is not None:
+        payout = result.response.results
+        journal.record(transid, JournalState.SUCCEEDED, fee=payout.fee, total_deducted=payout.total_deducted)
+    elif result.error is not None and RetryPolicy.is_ambiguous(result.error):
+        journal.record(transid, JournalState.PENDING, error=str(result.error))
+    else:
+        journal.record(transid, JournalState.FAILED, error=str(result.error))
+    return result
+
+
+def _tally(
+    report: DisbursementBatchReport,
+    outcome: _Outcome,
+    on_result: Optional[Callable[[DisbursementBatchResult], None]],
+) -> None:
+    """Add the outcome of one batch item to the report."""
+    if isinstance(outcome, JournalState):
+        report.skipped += 1
+        return
 
+    if outcome.response is not None:
+        payout = outcome.response.results
+        report.succeeded += 1
+        report.total_fee += payout.fee
+        report.total_deducted += payout.total_deducted
+        report.total_amount_sent += payout.amount_sent_to_customer
+    elif outcome.error is not None and RetryPolicy.is_ambiguous(outcome.error):
+        report.in_doubt += 1
+    else:
+        report.failed += 1
 
-class DisbursementSyncMethods(BaseService):
-    """Sync methods for DisbursementService - inherits from BaseService for direct access."""
+    if on_result is not None:
+        on_result(outcome)
+
+
+class DisbursementSyncMethods(SyncMethods["DisbursementService"]):
+    """Sync methods for DisbursementService, sharing its HTTP client and configuration."""
 
     def disburse(self, disbursement_data: NewDisbursement) -> APIResponse[DisbursementSuccessResponse]:
         """Send money to mobile wallet (sync).
@@ -24,6 +74,46 @@ class DisbursementSyncMethods(BaseService):
         """
         return self.post_sync("disbursement", disbursement_data, DisbursementSuccessResponse)
 
+    def disburse_batch(
+        self,
+        disbursements: Iterable[NewDisbursement],
+        journal: DisbursementJournal,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        resubmit_in_doubt: bool = False,
+        on_result: Optional[Callable[[DisbursementBatchResult], None]] = None,
+    ) -> DisbursementBatchReport:
+        """Send many disbursements on a thread pool, journaling every transid (sync).
+
+        Args:
+            disbursements: Disbursements to send. Consumed lazily.
+            journal: Journal recording each transid and its state.
+            concurrency: Maximum number of disbursements in flight, and the thread pool size.
+            rate_limit: Maximum number of disbursements started per second (optional).
+            resubmit_in_doubt: Whether to send again transids whose earlier outcome is unknown.
+            on_result: Called in the calling thread with the result of every sent disbursement.
+
+        Returns:
+            Report with counts, throughput and fee totals for this run.
+        """
+
+        def disburse_one(index: int, item: NewDisbursement) -> _Outcome:
+            blocking = journal.claim(item.transid, resubmit_in_doubt)
+            if blocking is not None:
+                return blocking
+            try:
+                result = DisbursementBatchResult(index=index, item=item, response=self.disburse(item))
+            except ZenoPayError as e:
+                result = DisbursementBatchResult(index=index, item=item, error=e)
+            return _journal_result(journal, result)
+
+        report = DisbursementBatchReport()
+        started = time.perf_counter()
+        for outcome in bounded_map_sync(disburse_one, disbursements, concurrency, rate_limit):
+            _tally(report, outcome, on_result)
+        report.elapsed = time.perf_counter() - started
+        return report
+
 
 class DisbursementService(BaseService):
     """Service for sending money to mobile wallets."""
@@ -31,7 +121,7 @@ class DisbursementService(BaseService):
     def __init__(self, http_client: HTTPClient, config: ZenoPayConfig):
         """Initialize DisbursementService with sync namespace."""
         super().__init__(http_client, config)
-        self.sync = DisbursementSyncMethods(http_client, config)
+        self.sync = DisbursementSyncMethods(self)
 
     async def disburse(self, disbursement_data: NewDisbursement) -> APIResponse[DisbursementSuccessResponse]:
         """Send money to mobile wallet (async).
@@ -43,3 +133,57 @@ class DisbursementService(BaseService):
             Disbursement response with transaction details and fees.
         """
         return await self.post_async("disbursement", disbursement_data, DisbursementSuccessResponse)
+
+    async def disburse_batch(
+        self,
+        disbursements: Union[Iterable[NewDisbursement], AsyncIterable[NewDisbursement]],
+        journal: DisbursementJournal,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        resubmit_in_doubt: bool = False,
+        on_result: Optional[Callable[[DisbursementBatchResult], None]] = None,
+    ) -> DisbursementBatchReport:
+        """Send many disbursements with bounded concurrency, journaling every transid (async).
+
+        Each transid is claimed in the journal before it is sent and its outcome is appended
+        afterwards, so a run interrupted by a crash can simply be restarted with the same
+        input and journal. Transids already acknowledged are never sent again. Transids
+        whose outcome is unknown (a crash mid-request, a timeout or a 5xx after sending, a
+        2xx response that failed to parse) stay ``PENDING`` and are skipped unless
+        ``resubmit_in_doubt`` is set; check them with the API first. Transids rejected with
+        a 4xx, or never sent, are sent again on the next run.
+
+        Args:
+            disbursements: Disbursements to send, as a sync or async iterable of any length.
+            journal: Journal recording each transid and its state.
+            concurrency: Maximum number of disbursements in flight.
+            rate_limit: Maximum number of disbursements started per second (optional).
+            resubmit_in_doubt: Whether to send again transids whose earlier outcome is unknown.
+            on_result: Called with the result of every sent disbursement.
+
+        Returns:
+            Report with counts, throughput and fee totals for this run.
+
+        Examples:
+            >>> with DisbursementJournal("payroll-2025-06.db") as journal:
+            ...     async with zenopay_client:
+            ...         report = await zenopay_client.disbursements.disburse_batch(payouts, journal, concurrency=20)
+            ...     print(f"{report.succeeded} paid, fees {report.total_fee}, {report.throughput:.1f}/s")
+        """
+
+        async def disburse_one(index: int, item: NewDisbursement) -> _Outcome:
+            blocking = journal.claim(item.transid, resubmit_in_doubt)
+            if blocking is not None:
+                return blocking
+            try:
+                result = DisbursementBatchResult(index=index, item=item, response=await self.disburse(item))
+            except ZenoPayError as e:
+                result = DisbursementBatchResult(index=index, item=item, error=e)
+            return _journal_result(journal, result)
+
+        report = DisbursementBatchReport()
+        started = time.perf_counter()
+        async for outcome in bounded_map(disburse_one, disbursements, concurrency, rate_limit):
+            _tally(report, outcome, on_result)
+        report.elapsed = time.perf_counter() - started
+        return report
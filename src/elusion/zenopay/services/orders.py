@@ -1,22 +1,33 @@
 """Order service for the ZenoPay SDK"""
 
-from typing import Any, Dict, Union
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Optional, Union
 
-from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.config import DEFAULT_BULK_CONCURRENCY, ZenoPayConfig
+from elusion.zenopay.exceptions import ZenoPayError
 from elusion.zenopay.http import HTTPClient
-from elusion.zenopay.models.common import APIResponse
+from elusion.zenopay.models.common import APIResponse, BatchResult
 from elusion.zenopay.models.order import (
     NewOrder,
     OrderResponse,
     OrderStatusResponse,
 )
-from elusion.zenopay.services.base import BaseService
+from elusion.zenopay.services.base import BaseService, SyncMethods
+from elusion.zenopay.services.status_cache import StatusCache
+from elusion.zenopay.utils.concurrency import bounded_map, bounded_map_sync
 
+OrderInput = Union[NewOrder, Dict[str, str]]
+OrderBatchResult = BatchResult[OrderResponse]
 
-class OrderSyncMethods(BaseService):
-    """Sync methods for OrderService - inherits from BaseService for direct access."""
 
-    def create(self, order_data: NewOrder) -> APIResponse[OrderResponse]:
+class OrderSyncMethods(SyncMethods["OrderService"]):
+    """Sync methods for OrderService, sharing its HTTP client, configuration and status cache."""
+
+    @property
+    def status_cache(self) -> Optional[StatusCache]:
+        """Status cache of the owning service."""
+        return self.service.status_cache
+
+    def create(self, order_data: OrderInput) -> APIResponse[OrderResponse]:
         """Create a new order and initiate USSD payment (sync).
 
         Args:
@@ -32,15 +43,54 @@ class OrderSyncMethods(BaseService):
         """
         return self.post_sync("create_order", order_data, OrderResponse)
 
+    def create_many(
+        self,
+        orders: Iterable[OrderInput],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+    ) -> Iterator[OrderBatchResult]:
+        """Create many orders on a thread pool with bounded concurrency (sync).
+
+        Args:
+            orders: Orders to create. Consumed lazily, so it may be a generator of any length.
+            concurrency: Maximum number of orders in flight, and the thread pool size.
+            rate_limit: Maximum number of orders started per second (optional).
+
+        Returns:
+            Iterator of per-order results in completion order.
+
+        Examples:
+            >>> with zenopay_client:
+            ...     for result in zenopay_client.orders.sync.create_many(orders, concurrency=20):
+            ...         if not result.success:
+            ...             print(f"Order {result.index} failed: {result.error}")
+        """
+
+        def create_one(index: int, order: OrderInput) -> OrderBatchResult:
+            try:
+                return OrderBatchResult(index=index, item=order, response=self.create(order))
+            except ZenoPayError as e:
+                return OrderBatchResult(index=index, item=order, error=e)
+
+        return bounded_map_sync(create_one, orders, concurrency, rate_limit)
+
     def check_status(self, order_id: str) -> APIResponse[OrderStatusResponse]:
         """Check the status of an existing order using GET request (sync).
 
+        Served from the status cache when ``ZenoPayConfig(status_cache=True)``.
+
         Args:
             order_id: The order ID to check status for.
 
         Returns:
             Order status response with payment details.
         """
+        if self.status_cache is not None:
+            return self.status_cache.get_or_fetch_sync(order_id, lambda: self._fetch_status(order_id))
+        return self._fetch_status(order_id)
+
+    def _fetch_status(self, order_id: str) -> APIResponse[OrderStatusResponse]:
+        """Request the status of an order from the API (sync)."""
         params: Dict[str, Any] = {
             "order_id": order_id,
         }
@@ -55,7 +105,10 @@ class OrderSyncMethods(BaseService):
             return False
 
     def wait_for_payment(self, order_id: str, timeout: int = 300, poll_interval: int = 10) -> APIResponse[OrderStatusResponse]:
-        """Wait for an order to be paid (sync)."""
+        """Wait for an order to be paid (sync).
+
+        Blocks the calling thread. To wait on many orders, use ``PaymentStatusPoller``.
+        """
         import time
 
         start_time = time.time()
@@ -80,9 +133,10 @@ class OrderService(BaseService):
     """Service for managing orders and payments."""
 
     def __init__(self, http_client: HTTPClient, config: ZenoPayConfig):
-        """Initialize OrderService with sync namespace."""
+        """Initialize OrderService with sync namespace and the optional status cache."""
         super().__init__(http_client, config)
-        self.sync = OrderSyncMethods(http_client, config)
+        self.status_cache = StatusCache(config.status_cache_ttl, config.status_cache_max_size) if config.status_cache else None
+        self.sync = OrderSyncMethods(self)
 
     async def create(self, order_data: Union[NewOrder, Dict[str, str]]) -> APIResponse[OrderResponse]:
         """Create a new order and initiate USSD payment (async).
@@ -95,15 +149,60 @@ class OrderService(BaseService):
         """
         return await self.post_async("create_order", order_data, OrderResponse)
 
+    def create_many(
+        self,
+        orders: Union[Iterable[OrderInput], AsyncIterable[OrderInput]],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+    ) -> AsyncIterator[OrderBatchResult]:
+        """Create many orders with bounded concurrency (async).
+
+        Orders are pulled from the input as slots free up and results are not retained,
+        so memory stays flat however long the input is. A failed order does not stop the
+        batch; its ``ZenoPayError`` is reported on the result instead.
+
+        Args:
+            orders: Orders to create, as a sync or async iterable of any length.
+            concurrency: Maximum number of orders in flight.
+            rate_limit: Maximum number of orders started per second (optional).
+
+        Returns:
+            Async iterator of per-order results in completion order.
+
+        Examples:
+            >>> async with zenopay_client:
+            ...     async for result in zenopay_client.orders.create_many(orders, concurrency=20, rate_limit=50):
+            ...         if result.success:
+            ...             print(f"Order {result.index}: {result.response.results.order_id}")
+        """
+
+        async def create_one(index: int, order: OrderInput) -> OrderBatchResult:
+            try:
+                return OrderBatchResult(index=index, item=order, response=await self.create(order))
+            except ZenoPayError as e:
+                return OrderBatchResult(index=index, item=order, error=e)
+
+        return bounded_map(create_one, orders, concurrency, rate_limit)
+
     async def check_status(self, order_id: str) -> APIResponse[OrderStatusResponse]:
         """Check the status of an existing order using GET request (async).
 
+        With ``ZenoPayConfig(status_cache=True)``, PENDING results are reused for
+        ``status_cache_ttl`` seconds, final results until evicted, and concurrent
+        checks of the same order share one request.
+
         Args:
             order_id: The order ID to check status for.
 
         Returns:
             Order status response with payment details.
         """
+        if self.status_cache is not None:
+            return await self.status_cache.get_or_fetch(order_id, lambda: self._fetch_status(order_id))
+        return await self._fetch_status(order_id)
+
+    async def _fetch_status(self, order_id: str) -> APIResponse[OrderStatusResponse]:
+        """Request the status of an order from the API (async)."""
         params: Dict[str, Any] = {
             "order_id": order_id,
         }
@@ -118,7 +217,10 @@ class OrderService(BaseService):
             return False
 
     async def wait_for_payment(self, order_id: str, timeout: int = 300, poll_interval: int = 10) -> APIResponse[OrderStatusResponse]:
-        """Wait for an order to be paid (async)."""
+        """Wait for an order to be paid (async).
+
+        Runs its own polling loop. To wait on many orders, use ``PaymentStatusPoller``.
+        """
         import asyncio
 
         start_time = asyncio.get_event_loop().time()
@@ -0,0 +1,134 @@
+"""Cached response parsers for the ZenoPay SDK services."""
+
+from typing import Any, Dict, Generic, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from elusion.zenopay.models.checkout import CheckoutResponse
+from elusion.zenopay.models.common import APIResponse
+from elusion.zenopay.models.disbursement import DisbursementSuccessResponse
+from elusion.zenopay.models.order import OrderResponse, OrderStatusResponse
+from elusion.zenopay.models.utility_payments import UtilityPaymentResponse
+
+T = TypeVar("T", bound=BaseModel)
+
+# Response models parsed by the built-in services; their parsers are built at import time.
+RESPONSE_MODELS = (
+    OrderResponse,
+    OrderStatusResponse,
+    DisbursementSuccessResponse,
+    UtilityPaymentResponse,
+    CheckoutResponse,
+)
+
+
+class _EnvelopeMessage(BaseModel):
+    """Envelope message of a response whose model has no ``message`` field."""
+
+    message: Any = None
+
+
+class ResponseParser(Generic[T]):
+    """Parses raw API responses into typed ``APIResponse`` objects.
+
+    The specialized ``APIResponse[T]`` class and the ``TypeAdapter`` for the model are
+    built once per model. Decoded responses are validated together with their envelope
+    in a single pydantic-core call, so the results are not validated twice. Raw bodies
+    are validated straight from bytes by pydantic-core's JSON parser.
+    """
+
+    def __init__(self, model_class: Type[T]) -> None:
+        """Initialize the parser.
+
+        Args:
+            model_class: Pydantic model class responses are parsed into.
+        """
+        self.model_class = model_class
+        self.response_class: Type[APIResponse[T]] = APIResponse[model_class]  # type: ignore[valid-type]
+        self.adapter: TypeAdapter[T] = TypeAdapter(model_class)
+        # The envelope message is read from the results when the model carries it.
+        self._message_in_results = "message" in model_class.model_fields
+
+    def parse(self, response_data: Dict[str, Any]) -> APIResponse[T]:
+        """Parse decoded response data.
+
+        Args:
+            response_data: Decoded response data from the API.
+
+        Returns:
+            Parsed response with typed results.
+
+        Raises:
+            pydantic.ValidationError: If the data is not an object or does not match the model.
+        """
+        message = response_data.get("message") if isinstance(response_data, dict) else None
+        return self.response_class.model_validate(
+            {
+                "success": True,
+                "results": response_data,
+                "message": None if message is None else str(message),
+                "error": None,
+            }
+        )
+
+    def parse_json(self, content: bytes) -> APIResponse[T]:
+        """Parse a raw response body without building an intermediate dict.
+
+        Args:
+            content: Raw response body from the API.
+
+        Returns:
+            Parsed response with typed results.
+
+        Raises:
+            pydantic.ValidationError: If the body does not match the model.
+        """
+        try:
+            results = self.adapter.validate_json(content)
+        except ValidationError as e:
+            if not _is_invalid_json(e):
+                raise
+            return self.parse(_plain_text_response(content))
+
+        if self._message_in_results:
+            message = getattr(results, "message", None)
+        else:
+            message = _EnvelopeMessage.model_validate_json(content).message
+            message = None if message is None else str(message)
+        return self.response_class(success=True, results=results, message=message, error=None)
+
+
+def _is_invalid_json(error: ValidationError) -> bool:
+    """Check if a validation error was caused by a body that is not JSON."""
+    return any(detail["type"] == "json_invalid" for detail in error.errors())
+
+
+def _plain_text_response(content: bytes) -> Dict[str, Any]:
+    """Build the success envelope used for plain-text response bodies."""
+    return {
+        "success": True,
+        "data": content.decode("utf-8", errors="replace"),
+        "message": "Request successful",
+    }
+
+
+_parsers: Dict[type, ResponseParser[Any]] = {}
+
+
+def get_response_parser(model_class: Type[T]) -> ResponseParser[T]:
+    """Get the cached parser for a response model, creating it on first use.
+
+    Args:
+        model_class: Pydantic model class responses are parsed into.
+
+    Returns:
+        Parser for the model.
+    """
+    parser = _parsers.get(model_class)
+    if parser is None:
+        parser = _parsers[model_class] = ResponseParser(model_class)
+    return parser
+
+
+for _model_class in RESPONSE_MODELS:
+    get_response_parser(_model_class)
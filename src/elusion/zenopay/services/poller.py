@@ -0,0 +1,383 @@
+"""Multiplexed payment status poller for the ZenoPay SDK."""
+
+import asyncio
+import concurrent.futures
+import copy
+import heapq
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from elusion.zenopay.config import (
+    DEFAULT_POLL_CONCURRENCY,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_MIN_INTERVAL,
+    DEFAULT_POLL_TIMEOUT,
+)
+from elusion.zenopay.exceptions import ZenoPayError
+from elusion.zenopay.models.order import OrderData, PaymentResolution
+from elusion.zenopay.models.payment import PaymentStatus
+from elusion.zenopay.models.webhook import WebhookEvent
+from elusion.zenopay.services.orders import OrderService
+from elusion.zenopay.services.webhooks import WebhookService
+
+logger = logging.getLogger(__name__)
+
+
+def _is_final(payment_status: str) -> bool:
+    """Check if a payment status string is COMPLETED, FAILED or CANCELLED."""
+    try:
+        return PaymentStatus.from_string(payment_status).is_final
+    except ValueError:
+        return False
+
+
+class _TrackedOrder:
+    """Polling state of a single order."""
+
+    __slots__ = ("order_id", "future", "started", "deadline", "due")
+
+    def __init__(self, order_id: str, future: "asyncio.Future[PaymentResolution]", started: float, deadline: float) -> None:
+        self.order_id = order_id
+        self.future = future
+        self.started = started
+        self.deadline = deadline
+        self.due = started
+
+
+class PaymentStatusPoller:
+    """Tracks many orders and polls their payment status on one shared schedule.
+
+    Replaces per-order ``wait_for_payment`` loops: a single background task keeps a heap
+    of due times, polls at most ``concurrency`` orders at once and resolves each order's
+    future when its ``payment_status`` becomes final. Young orders are polled every
+    ``min_interval`` seconds; older ones back off to ``age * backoff_factor`` seconds,
+    capped at ``max_interval``. When a ``WebhookService`` is given, a webhook with a final
+    status resolves the order immediately and polling for it stops.
+
+    Examples:
+        >>> async with zenopay_client:
+        ...     async with PaymentStatusPoller(zenopay_client.orders, zenopay_client.webhooks) as poller:
+        ...         resolution = await poller.wait(order_id)
+        ...         print(f"{order_id}: {resolution.payment_status} via {resolution.source}")
+
+        Sync applications run the poller on one background thread:
+        >>> poller = PaymentStatusPoller(zenopay_client.orders, zenopay_client.webhooks)
+        >>> poller.start_background()
+        >>> resolution = poller.submit(order_id).result()
+        >>> poller.stop_background()
+    """
+
+    def __init__(
+        self,
+        orders: OrderService,
+        webhooks: Optional[WebhookService] = None,
+        concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        min_interval: float = DEFAULT_POLL_MIN_INTERVAL,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+        backoff_factor: float = 0.1,
+        timeout: float = DEFAULT_POLL_TIMEOUT,
+    ) -> None:
+        """Initialize the poller.
+
+        Args:
+            orders: Order service used to check payment status.
+            webhooks: Webhook service whose events resolve tracked orders (optional).
+            concurrency: Maximum number of status checks in flight.
+            min_interval: Seconds between polls of a freshly tracked order.
+            max_interval: Upper bound in seconds between polls of any order.
+            backoff_factor: Fraction of an order's age used as its polling interval.
+            timeout: Default seconds after which a tracked order fails with ``TimeoutError``.
+
+        Raises:
+            ValueError: If concurrency is lower than 1 or an interval is not positive.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+
+        self.orders = orders
+        self._orders = orders  # Service polled with; a copy on a forked HTTP client in background mode
+        self.webhooks = webhooks
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+
+        self._tracked: Dict[str, _TrackedOrder] = {}
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._checks: Set["asyncio.Task[None]"] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    async def __aenter__(self) -> "PaymentStatusPoller":
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.stop()
+
+    @property
+    def pending(self) -> int:
+        """Number of orders still being tracked."""
+        return len(self._tracked)
+
+    async def start(self) -> None:
+        """Start the polling task on the running event loop."""
+        if self._runner is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._runner = self._loop.create_task(self._run())
+        if self.webhooks is not None:
+            self.webhooks.add_listener(self._on_webhook)
+
+    async def stop(self) -> None:
+        """Stop polling and cancel the futures of orders still being tracked."""
+        if self.webhooks is not None:
+            self.webhooks.remove_listener(self._on_webhook)
+
+        tasks = [task for task in (self._runner, *self._checks) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for tracked in self._tracked.values():
+            tracked.future.cancel()
+        self._tracked.clear()
+        self._schedule.clear()
+        self._runner = None
+        self._loop = None
+
+    def track(self, order_id: str, timeout: Optional[float] = None) -> "asyncio.Future[PaymentResolution]":
+        """Start tracking an order.
+
+        Must be called from the poller's event loop. Tracking an order that is already
+        tracked returns its existing future.
+
+        Args:
+            order_id: Order ID to track.
+            timeout: Seconds after which the future fails with ``TimeoutError``. Defaults to the poller's timeout.
+
+        Returns:
+            Future resolved with the order's ``PaymentResolution``.
+
+        Raises:
+            RuntimeError: If the poller has not been started.
+        """
+        if self._loop is None or self._wakeup is None:
+            raise RuntimeError("PaymentStatusPoller is not running; call start() or use 'async with'")
+
+        tracked = self._tracked.get(order_id)
+        if tracked is not None:
+            return tracked.future
+
+        now = self._loop.time()
+        tracked = _TrackedOrder(order_id, self._loop.create_future(), now, now + (timeout if timeout is not None else self.timeout))
+        self._tracked[order_id] = tracked
+        self._schedule_poll(tracked, now)
+        return tracked.future
+
+    async def wait(self, order_id: str, timeout: Optional[float] = None) -> PaymentResolution:
+        """Track an order and wait for its final payment status.
+
+        Args:
+            order_id: Order ID to track.
+            timeout: Seconds to wait. Defaults to the poller's timeout.
+
+        Returns:
+            The order's payment resolution.
+
+        Raises:
+            TimeoutError: If the order is still pending after ``timeout`` seconds.
+        """
+        # The future is shared by every waiter of the order; cancelling one must not cancel the rest.
+        return await asyncio.shield(self.track(order_id, timeout))
+
+    def untrack(self, order_id: str) -> None:
+        """Stop tracking an order and cancel its future.
+
+        Args:
+            order_id: Order ID to stop tracking.
+        """
+        tracked = self._tracked.pop(order_id, None)
+        if tracked is not None:
+            tracked.future.cancel()
+
+    def resolve(self, order_id: str, resolution: PaymentResolution) -> bool:
+        """Resolve a tracked order with a known final status and stop polling it.
+
+        Args:
+            order_id: Tracked order ID.
+            resolution: Final payment status of the order.
+
+        Returns:
+            True if the order was being tracked.
+        """
+        tracked = self._tracked.pop(order_id, None)
+        if tracked is None:
+            return False
+        if not tracked.future.done():
+            tracked.future.set_result(resolution)
+        return True
+
+    def start_background(self) -> None:
+        """Run the poller on a dedicated event loop thread, for sync applications.
+
+        One thread serves every tracked order. Use ``submit`` to track orders from any thread.
+        Status checks go through a fork of the order service's HTTP client, so the client
+        stays usable on the application's own event loop.
+        """
+        if self._thread is not None:
+            return
+
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+        orders = copy.copy(self.orders)
+        orders.http_client = self.orders.http_client.fork()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            self._orders = orders
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+            loop.run_until_complete(self.stop())
+            loop.run_until_complete(orders.http_client.close())
+            loop.close()
+            self._orders = self.orders
+
+        self._thread = threading.Thread(target=run, name="zenopay-poller", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop_background(self) -> None:
+        """Stop the background thread started with ``start_background``."""
+        loop = self._loop
+        if self._thread is None or loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, order_id: str, timeout: Optional[float] = None) -> "concurrent.futures.Future[PaymentResolution]":
+        """Track an order from any thread.
+
+        Args:
+            order_id: Order ID to track.
+            timeout: Seconds to wait. Defaults to the poller's timeout.
+
+        Returns:
+            Thread-safe future resolved with the order's ``PaymentResolution``.
+
+        Raises:
+            RuntimeError: If the poller has not been started.
+        """
+        if self._loop is None:
+            raise RuntimeError("PaymentStatusPoller is not running; call start_background() first")
+        return asyncio.run_coroutine_threadsafe(self.wait(order_id, timeout), self._loop)
+
+    def _interval(self, tracked: _TrackedOrder, now: float) -> float:
+        """Polling interval for an order, growing with its age."""
+        age = now - tracked.started
+        return min(self.max_interval, max(self.min_interval, age * self.backoff_factor))
+
+    def _schedule_poll(self, tracked: _TrackedOrder, due: float) -> None:
+        """Schedule the next poll of an order, never past its deadline."""
+        tracked.due = min(due, tracked.deadline)
+        self._sequence += 1
+        heapq.heappush(self._schedule, (tracked.due, self._sequence, tracked.order_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Poll due orders until stopped."""
+        assert self._loop is not None and self._wakeup is not None and self._slots is not None
+
+        while True:
+            now = self._loop.time()
+            while self._schedule and self._schedule[0][0] <= now:
+                due, _, order_id = heapq.heappop(self._schedule)
+                tracked = self._tracked.get(order_id)
+                if tracked is None or tracked.due != due:
+                    continue  # Resolved, untracked or rescheduled since this entry was pushed
+                if tracked.future.done():
+                    del self._tracked[order_id]
+                    continue
+                if now >= tracked.deadline:
+                    del self._tracked[order_id]
+                    tracked.future.set_exception(TimeoutError(f"Payment still pending for order {order_id} after timeout"))
+                    continue
+
+                await self._slots.acquire()
+                check = self._loop.create_task(self._poll(tracked))
+                self._checks.add(check)
+                check.add_done_callback(self._checks.discard)
+                now = self._loop.time()
+
+            self._wakeup.clear()
+            delay = self._schedule[0][0] - self._loop.time() if self._schedule else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, tracked: _TrackedOrder) -> None:
+        """Check the status of one order and resolve or reschedule it."""
+        assert self._loop is not None and self._slots is not None
+
+        order: Optional[OrderData] = None
+        try:
+            response = await self._orders.check_status(tracked.order_id)
+            order = response.results.data[0] if response.results.data else None
+        except ZenoPayError as e:
+            logger.warning("Status check failed for order %s: %s", tracked.order_id, e)
+        except Exception:
+            # Anything else, e.g. a malformed response, must not end polling of the order.
+            logger.exception("Unexpected error checking status of order %s", tracked.order_id)
+        finally:
+            self._slots.release()
+
+        if self._tracked.get(tracked.order_id) is not tracked:
+            return  # Resolved by a webhook or untracked while the check was in flight
+
+        if order is not None and _is_final(order.payment_status):
+            resolution = PaymentResolution(order_id=tracked.order_id, payment_status=order.payment_status, source="poll", order=order)
+            self.resolve(tracked.order_id, resolution)
+            return
+
+        now = self._loop.time()
+        self._schedule_poll(tracked, now + self._interval(tracked, now))
+
+    def _on_webhook(self, event: WebhookEvent) -> None:
+        """Resolve a tracked order from a webhook, from any thread."""
+        if self._loop is None or not _is_final(event.payload.payment_status):
+            return
+
+        try:
+            in_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            in_loop = False
+
+        if in_loop:
+            self._resolve_from_webhook(event)
+        else:
+            self._loop.call_soon_threadsafe(self._resolve_from_webhook, event)
+
+    def _resolve_from_webhook(self, event: WebhookEvent) -> None:
+        """Resolve a tracked order with a webhook event."""
+        order_id = event.payload.order_id
+        resolution = PaymentResolution(order_id=order_id, payment_status=event.payload.payment_status, source="webhook", event=event)
+        if self.resolve(order_id, resolution):
+            logger.info("Order %s resolved by webhook: %s", order_id, event.payload.payment_status)
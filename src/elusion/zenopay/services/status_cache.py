@@ -0,0 +1,172 @@
+"""Order status cache for the ZenoPay SDK."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple
+
+from elusion.zenopay.config import DEFAULT_STATUS_CACHE_MAX_SIZE, DEFAULT_STATUS_CACHE_TTL
+from elusion.zenopay.models.common import APIResponse, CacheStats
+from elusion.zenopay.models.order import OrderStatusResponse
+from elusion.zenopay.models.payment import PaymentStatus
+from elusion.zenopay.utils.concurrency import SingleFlight
+
+StatusResponse = APIResponse[OrderStatusResponse]
+
+
+def _is_final(response: StatusResponse) -> bool:
+    """Check if every order record in a status response has a final payment status."""
+    records = response.results.data
+    try:
+        return bool(records) and all(PaymentStatus.from_string(record.payment_status).is_final for record in records)
+    except ValueError:
+        return False
+
+
+class StatusCache:
+    """LRU cache of order status responses with coalesced lookups.
+
+    Non-final results (PENDING) expire after ``ttl`` seconds. Final results (COMPLETED,
+    FAILED, CANCELLED, see ``PaymentStatus.is_final``) never change, so they are kept
+    until evicted as least recently used. Concurrent lookups of the same order share a
+    single in-flight request. The cache is thread-safe and is shared by the async service
+    and its sync namespace.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_STATUS_CACHE_TTL, max_size: int = DEFAULT_STATUS_CACHE_MAX_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a non-final status is served from the cache.
+            max_size: Maximum number of cached orders.
+
+        Raises:
+            ValueError: If max_size is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Optional[float], StatusResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights: SingleFlight[str, StatusResponse] = SingleFlight(self._lock)
+        self._hits = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Number of cached orders, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._flights.calls,
+                coalesced=self._flights.coalesced,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def get(self, order_id: str) -> Optional[StatusResponse]:
+        """Get a fresh cached status without counting a hit or miss.
+
+        Args:
+            order_id: Order ID.
+
+        Returns:
+            Cached status response, or None if absent or expired.
+        """
+        with self._lock:
+            return self._lookup(order_id)
+
+    def put(self, order_id: str, response: StatusResponse) -> None:
+        """Cache a status response.
+
+        Args:
+            order_id: Order ID.
+            response: Status response for the order.
+        """
+        expires_at = None if _is_final(response) else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[order_id] = (expires_at, response)
+            self._entries.move_to_end(order_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, order_id: str) -> None:
+        """Drop the cached status of an order.
+
+        Args:
+            order_id: Order ID.
+        """
+        with self._lock:
+            self._entries.pop(order_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached status."""
+        with self._lock:
+            self._entries.clear()
+
+    async def get_or_fetch(self, order_id: str, fetch: Callable[[], Awaitable[StatusResponse]]) -> StatusResponse:
+        """Return the cached status or fetch it, sharing one request between concurrent callers.
+
+        Callers share the request per event loop. If the caller fetching the status is
+        cancelled, the others fetch it again rather than being cancelled with it.
+
+        Args:
+            order_id: Order ID.
+            fetch: Coroutine function performing the status request.
+
+        Returns:
+            Status response for the order.
+        """
+
+        async def fetch_and_put() -> StatusResponse:
+            response = await fetch()
+            self.put(order_id, response)
+            return response
+
+        return await self._flights.run(order_id, fetch_and_put, lambda: self._hit(order_id))
+
+    def get_or_fetch_sync(self, order_id: str, fetch: Callable[[], StatusResponse]) -> StatusResponse:
+        """Sync counterpart of ``get_or_fetch``, coalescing lookups across threads.
+
+        Args:
+            order_id: Order ID.
+            fetch: Function performing the status request.
+
+        Returns:
+            Status response for the order.
+        """
+
+        def fetch_and_put() -> StatusResponse:
+            response = fetch()
+            self.put(order_id, response)
+            return response
+
+        return self._flights.run_sync(order_id, fetch_and_put, lambda: self._hit(order_id))
+
+    def _hit(self, order_id: str) -> Optional[StatusResponse]:
+        """Return a fresh entry and count the hit. Caller holds the lock."""
+        cached = self._lookup(order_id)
+        if cached is not None:
+            self._hits += 1
+        return cached
+
+    def _lookup(self, order_id: str) -> Optional[StatusResponse]:
+        """Return a fresh entry and mark it recently used. Caller holds the lock."""
+        entry = self._entries.get(order_id)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[order_id]
+            return None
+
+        self._entries.move_to_end(order_id)
+        return response
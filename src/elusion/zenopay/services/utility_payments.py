@@ -7,11 +7,11 @@ from elusion.zenopay.models.utility_payments import (
     NewUtilityPayment,
     UtilityPaymentResponse,
 )
-from elusion.zenopay.services.base import BaseService
+from elusion.zenopay.services.base import BaseService, SyncMethods
 
 
-class UtilityPaymentsSyncMethods(BaseService):
-    """Sync methods for UtilityPaymentsService"""
+class UtilityPaymentsSyncMethods(SyncMethods["UtilityPaymentsService"]):
+    """Sync methods for UtilityPaymentsService, sharing its HTTP client and configuration."""
 
     def process_payment(self, payment_data: NewUtilityPayment) -> APIResponse[UtilityPaymentResponse]:
         """Process utility payment (sync).
@@ -31,7 +31,7 @@ class UtilityPaymentsService(BaseService):
     def __init__(self, http_client: HTTPClient, config: ZenoPayConfig):
         """Initialize UtilityPaymentsService with sync namespace."""
         super().__init__(http_client, config)
-        self.sync = UtilityPaymentsSyncMethods(http_client, config)
+        self.sync = UtilityPaymentsSyncMethods(self)
 
     async def process_payment(self, payment_data: NewUtilityPayment) -> APIResponse[UtilityPaymentResponse]:
         """Process utility payment (async).
@@ -1,12 +1,25 @@
 """Webhook service for the ZenoPay SDK."""
 
+import asyncio
 import json
 import logging
+import os
+import time
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from elusion.zenopay.exceptions import ZenoPayWebhookError
-from elusion.zenopay.models.webhook import WebhookEvent, WebhookResponse
+from pydantic import ValidationError
+
+from elusion.zenopay.exceptions import ZenoPayWebhookError, ZenoPayWebhookQueueFullError, ZenoPayWebhookSignatureError
+from elusion.zenopay.models.webhook import WebhookAuditRecord, WebhookEvent, WebhookResponse
+from elusion.zenopay.webhooks.audit import LoggerAuditSink, WebhookAuditSink
+from elusion.zenopay.webhooks.dedup import WebhookDedupStore, dedup_key
+from elusion.zenopay.webhooks.dispatch import AsyncWebhookDispatcher, WebhookDispatcher
+from elusion.zenopay.webhooks.handlers import HandlerRegistration, HandlerRegistry
+from elusion.zenopay.webhooks.signature import WebhookSignatureVerifier
+from elusion.zenopay.webhooks.parsing import ParsedWebhooks, WebhookRecord, parse_webhook_record
+from elusion.zenopay.webhooks.wal import WebhookLog
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +27,21 @@ logger = logging.getLogger(__name__)
 class WebhookService:
     """Service for handling ZenoPay webhooks."""
 
-    def __init__(self) -> None:
-        """Initialize the webhook service."""
-        self._handlers: Dict[str, Callable[[WebhookEvent], Any]] = {}
+    def __init__(self, executor: Optional[Executor] = None, secret: Optional[str] = None) -> None:
+        """Initialize the webhook service.
+
+        Args:
+            executor: Executor running sync handlers from ``handle_webhook_async``. Defaults to the loop's default executor.
+            secret: Shared secret for verifying webhook HMAC signatures. None disables verification.
+        """
+        self.executor = executor
+        self.verifier = WebhookSignatureVerifier(secret) if secret else None
+        self._handlers = HandlerRegistry()
+        self._listeners: List[Callable[[WebhookEvent], Any]] = []
+        self.audit_sinks: List[WebhookAuditSink] = [LoggerAuditSink()]
+        self.dispatcher: Optional[WebhookDispatcher] = None
+        self.dedup: Optional[WebhookDedupStore] = None
+        self.log: Optional[WebhookLog] = None
 
     def parse_webhook(self, raw_data: str, signature: Optional[str] = None) -> WebhookEvent:
         """Parse raw webhook data into a WebhookEvent.
@@ -42,19 +67,62 @@ class WebhookService:
             event.signature = signature
             event.timestamp = datetime.now().isoformat()
 
-            logger.info(f"Parsed webhook for order {event.payload.order_id}: {event.payload.payment_status}")
+            logger.info("Parsed webhook for order %s: %s", event.payload.order_id, event.payload.payment_status)
             return event
 
         except Exception as e:
-            logger.error(f"Failed to parse webhook: {e}")
+            logger.error("Failed to parse webhook: %s", e)
             raise ZenoPayWebhookError(f"Invalid webhook data: {e}", {"raw_data": raw_data})
 
-    def register_handler(self, event_type: str, handler: Callable[[WebhookEvent], Any]) -> None:
+    def parse_webhooks(self, records: Iterable[WebhookRecord]) -> ParsedWebhooks:
+        """Parse many raw webhook bodies, e.g. NDJSON lines, for replay or backfill.
+
+        Events are parsed lazily as the result is iterated, each record validated straight
+        from JSON text, and only a summary is logged. Invalid records are collected in the
+        result's ``errors`` instead of raised.
+
+        Args:
+            records: Raw JSON bodies as text or UTF-8 bytes, e.g. an open NDJSON file.
+
+        Returns:
+            Iterable of parsed events with per-record errors.
+
+        Examples:
+            >>> with open("webhooks.ndjson", "rb") as f:
+            ...     batch = webhook_service.parse_webhooks(f)
+            ...     for event in batch:
+            ...         webhook_service.handle_webhook(event)
+            >>> for failure in batch.errors:
+            ...     print(f"Line {failure.line}: {failure.error}")
+        """
+        return ParsedWebhooks(records)
+
+    def parse_webhook_file(self, path: Union[str, "os.PathLike[str]"]) -> ParsedWebhooks:
+        """Parse an NDJSON file of raw webhook bodies, one per line.
+
+        The file is opened when iteration starts and closed when it ends.
+
+        Args:
+            path: Path of the NDJSON file.
+
+        Returns:
+            Iterable of parsed events with per-record errors.
+        """
+        return ParsedWebhooks((), path=path)
+
+    def register_handler(self, event_type: str, handler: Callable[[WebhookEvent], Any], max_concurrency: Optional[int] = None) -> HandlerRegistration:
         """Register a handler for specific webhook events.
 
+        Several handlers can be registered for the same event type; they are all called,
+        in registration order. Handlers may be plain functions or coroutine functions.
+
         Args:
             event_type: Type of event to handle (e.g., "COMPLETED", "FAILED").
-            handler: Function to call when this event type is received.
+            handler: Function or coroutine function to call when this event type is received.
+            max_concurrency: Maximum number of concurrent calls of this handler (optional).
+
+        Returns:
+            The handler's registration.
 
         Examples:
             >>> def payment_completed_handler(event: WebhookEvent):
@@ -62,8 +130,162 @@ class WebhookService:
             ...     # Update database, send emails, etc.
             >>>
             >>> webhook_service.register_handler("COMPLETED", payment_completed_handler)
+            >>>
+            >>> async def send_receipt(event: WebhookEvent):
+            ...     await mailer.send(event.payload.order_id)
+            >>>
+            >>> webhook_service.register_handler("COMPLETED", send_receipt, max_concurrency=5)
+        """
+        return self._handlers.add(event_type, handler, max_concurrency)
+
+    def unregister_handler(self, event_type: str, handler: Callable[[WebhookEvent], Any]) -> bool:
+        """Unregister a handler.
+
+        Args:
+            event_type: Type of event the handler was registered for.
+            handler: Previously registered handler.
+
+        Returns:
+            True if the handler was registered.
+        """
+        return self._handlers.remove(event_type, handler)
+
+    def add_listener(self, listener: Callable[[WebhookEvent], Any]) -> None:
+        """Register a listener called for every handled webhook, whatever its status.
+
+        Listeners run after the status handler. A failing listener is logged and does
+        not affect the webhook response.
+
+        Args:
+            listener: Function to call with each handled webhook event.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[WebhookEvent], Any]) -> None:
+        """Unregister a listener added with ``add_listener``.
+
+        Args:
+            listener: Previously registered listener. Unknown listeners are ignored.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def use_secret(self, secret: Optional[str]) -> None:
+        """Verify webhook signatures with a shared secret.
+
+        ``process_webhook_request`` then answers requests whose HMAC-SHA256 signature does
+        not match the raw body with 401, without parsing them. Pass None to stop verifying.
+
+        Args:
+            secret: Shared webhook secret, or None.
+        """
+        self.verifier = WebhookSignatureVerifier(secret) if secret else None
+
+    def verify_signature(self, raw_data: Union[str, bytes], signature: Optional[str]) -> bool:
+        """Check a webhook signature against the raw body.
+
+        Args:
+            raw_data: Raw request body, as received.
+            signature: Webhook signature sent with the request.
+
+        Returns:
+            True if the signature matches, or if no secret is configured.
+        """
+        return self.verifier is None or self.verifier.verify(raw_data, signature)
+
+    def add_audit_sink(self, sink: WebhookAuditSink) -> None:
+        """Send webhook audit records to another sink.
+
+        Every handled, failed, queued and duplicate webhook produces a
+        ``WebhookAuditRecord``. By default ``audit_sinks`` holds a ``LoggerAuditSink``
+        writing to the ``elusion.zenopay.webhooks.audit`` logger at INFO; clear the list to
+        turn auditing off entirely.
+
+        Args:
+            sink: Audit sink, e.g. ``NDJSONAuditSink`` or ``CallbackAuditSink``.
+
+        Examples:
+            >>> webhook_service.add_audit_sink(NDJSONAuditSink("webhook-audit.ndjson"))
+        """
+        self.audit_sinks.append(sink)
+
+    def use_dispatcher(self, dispatcher: Optional[WebhookDispatcher]) -> None:
+        """Switch ``process_webhook_request`` to queued dispatch.
+
+        With a dispatcher, parsed events are enqueued and acknowledged right away while the
+        dispatcher's workers run the handlers. Pass None to handle events inline again.
+
+        Args:
+            dispatcher: Started dispatcher whose handler is ``handle_webhook``, or None.
+
+        Examples:
+            >>> dispatcher = ThreadedWebhookDispatcher(webhook_service.handle_webhook, workers=8, overflow="reject")
+            >>> dispatcher.start()
+            >>> webhook_service.use_dispatcher(dispatcher)
+        """
+        self.dispatcher = dispatcher
+
+    def use_dedup(self, store: Optional[WebhookDedupStore]) -> None:
+        """Drop redelivered webhooks in ``process_webhook_request``.
+
+        Events are keyed on ``(order_id, payment_status, reference)``. A redelivered event
+        is acknowledged without running the handlers again. If handling an event inline
+        fails, its key is released so that ZenoPay's next delivery is handled. Pass None to
+        stop deduplicating.
+
+        Args:
+            store: Deduplication store, e.g. ``MemoryDedupStore`` or ``SQLiteDedupStore``, or None.
+
+        Examples:
+            >>> webhook_service.use_dedup(SQLiteDedupStore("webhooks-seen.db"))
+            >>> print(webhook_service.dedup.stats.duplicates)
+        """
+        self.dedup = store
+
+    def use_log(self, log: Optional[WebhookLog]) -> None:
+        """Append every accepted webhook to a durable log before acknowledging it.
+
+        ``process_webhook_request`` only answers once the raw payload is on disk, and the
+        entry is marked done once every handler has succeeded. Entries left over by a crash,
+        or by handlers that failed after a dispatcher acknowledged the event, are handled by
+        ``replay_log``; ``log.stats.failed`` counts the failed ones. Pass None to stop logging.
+
+        Args:
+            log: Webhook write-ahead log, or None.
+
+        Examples:
+            >>> webhook_service.use_log(WebhookLog("/var/lib/myapp/webhooks"))
+            >>> webhook_service.replay_log()
+        """
+        self.log = log
+
+    def replay_log(self) -> int:
+        """Handle the log entries whose handlers had not run when the log was opened.
+
+        Call at startup, after registering handlers and before serving webhooks. Replayed
+        events are handled inline with ``handle_webhook``, bypassing the dispatcher and the
+        dedup store. Entries that no longer parse are skipped.
+
+        Returns:
+            Number of replayed events.
+        """
+        replayed = 0
+        for event in self._replayed_events():
+            self.handle_webhook(event)
+            replayed += 1
+        return replayed
+
+    async def replay_log_async(self) -> int:
+        """Async counterpart of ``replay_log``, handling events with ``handle_webhook_async``.
+
+        Returns:
+            Number of replayed events.
         """
-        self._handlers[event_type] = handler
+        replayed = 0
+        for event in self._replayed_events():
+            await self.handle_webhook_async(event)
+            replayed += 1
+        return replayed
 
     def handle_webhook(self, event: WebhookEvent) -> WebhookResponse:
         """Handle a parsed webhook event.
@@ -79,31 +301,50 @@ class WebhookService:
             >>> response = webhook_service.handle_webhook(event)
             >>> print(response.message)  # "Webhook received and processed"
         """
-        try:
-            event_type = event.payload.payment_status
+        registrations = self._lookup_handlers(event)
+        errors: List[BaseException] = []
+        for registration in registrations:
+            try:
+                registration.call(event)
+            except Exception as e:
+                errors.append(e)
 
-            if event_type in self._handlers:
-                self._handlers[event_type](event)
-            else:
-                logger.warning(f"No handler registered for event type: {event_type}")
+        return self._handled(event, errors)
 
-            self._log_webhook_event(event)
+    async def handle_webhook_async(self, event: WebhookEvent) -> WebhookResponse:
+        """Handle a parsed webhook event without blocking the event loop.
 
-            return WebhookResponse(
-                status="success",
-                message=f"Webhook received and processed for order {event.payload.order_id}",
-            )
+        Coroutine handlers run concurrently on the running loop; sync handlers run in the
+        service's executor. Every handler is called even if another one fails.
 
-        except Exception as e:
-            logger.error(f"Error handling webhook: {e}")
-            return WebhookResponse(status="error", message=f"Error processing webhook: {str(e)}")
+        Args:
+            event: Parsed webhook event.
 
-    def process_webhook_request(self, raw_data: str, signature: Optional[str] = None) -> WebhookResponse:
+        Returns:
+            Webhook response to send back to ZenoPay.
+
+        Examples:
+            >>> event = webhook_service.parse_webhook(raw_data)
+            >>> response = await webhook_service.handle_webhook_async(event)
+        """
+        registrations = self._lookup_handlers(event)
+        results = await asyncio.gather(*(registration.call_async(event, self.executor) for registration in registrations), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for error in errors:
+            if not isinstance(error, Exception):
+                raise error
+
+        return self._handled(event, errors)
+
+    def process_webhook_request(self, raw_data: Union[str, bytes], signature: Optional[str] = None) -> WebhookResponse:
         """Process a complete webhook request from raw data to response.
 
+        With a webhook secret configured, the signature is checked against the raw body
+        before anything is parsed, and mismatches are answered with 401.
+
         Args:
-            raw_data: Raw JSON string from the webhook request.
-            signature: Optional webhook signature.
+            raw_data: Raw request body, as received. Pass bytes to verify the signature over the exact bytes.
+            signature: Webhook signature sent with the request. Required when a secret is configured.
 
         Returns:
             Webhook response to send back to ZenoPay.
@@ -117,34 +358,274 @@ class WebhookService:
             ...     return {"status": response.status, "message": response.message}
         """
         try:
-            event = self.parse_webhook(raw_data, signature)
+            event = self._verified_event(raw_data, signature)
+        except Exception as e:
+            return self._failure_response(e)
+
+        if not self._claim(event):
+            return self._duplicate_response(event)
+
+        try:
+            if self.log is not None:
+                event.log_position = self.log.append(event.raw_data)
+
+            if self.dispatcher is not None:
+                self.dispatcher.submit(event)
+                return self._queued_response(event)
 
             response = self.handle_webhook(event)
+            if response.status_code >= 400:
+                self._release(event)
+                self._log_done(event)
+                return response
 
-            logger.info(f"Successfully processed webhook for order {event.payload.order_id}")
+            logger.info("Successfully processed webhook for order %s", event.payload.order_id)
             return response
 
-        except ZenoPayWebhookError as e:
-            logger.error(f"Webhook error: {e}")
-            return WebhookResponse(status="error", message=str(e))
         except Exception as e:
-            logger.error(f"Unexpected error processing webhook: {e}")
-            return WebhookResponse(status="error", message="Internal error processing webhook")
+            self._release(event)
+            self._log_done(event)
+            return self._failure_response(e)
 
-    def _log_webhook_event(self, event: WebhookEvent) -> None:
-        """Log webhook event for debugging and audit purposes.
+    async def process_webhook_request_async(self, raw_data: Union[str, bytes], signature: Optional[str] = None) -> WebhookResponse:
+        """Process a complete webhook request from raw data to response, for async frameworks.
+
+        With an ``AsyncWebhookDispatcher`` and the ``block`` policy, waits for room in the
+        queue instead of rejecting. Signatures are verified as in ``process_webhook_request``.
 
         Args:
-            event: The webhook event to log.
+            raw_data: Raw request body, as received. Pass bytes to verify the signature over the exact bytes.
+            signature: Webhook signature sent with the request. Required when a secret is configured.
+
+        Returns:
+            Webhook response to send back to ZenoPay.
+
+        Examples:
+            >>> @app.post("/zenopay/webhook")
+            ... async def webhook(request: Request):
+            ...     response = await webhook_service.process_webhook_request_async(
+            ...         await request.body(), request.headers.get("x-zenopay-signature")
+            ...     )
+            ...     return JSONResponse({"status": response.status}, status_code=response.status_code)
         """
-        log_data: Dict[str, Any] = {
-            "timestamp": event.timestamp,
-            "order_id": event.payload.order_id,
-            "payment_status": event.payload.payment_status,
-            "reference": event.payload.reference,
-        }
+        try:
+            event = self._verified_event(raw_data, signature)
+        except Exception as e:
+            return self._failure_response(e)
+
+        if not self._claim(event):
+            return self._duplicate_response(event)
+
+        try:
+            if self.log is not None:
+                event.log_position = await asyncio.get_running_loop().run_in_executor(self.executor, self.log.append, event.raw_data)
+
+            if isinstance(self.dispatcher, AsyncWebhookDispatcher):
+                await self.dispatcher.submit_async(event)
+                return self._queued_response(event)
+            if self.dispatcher is not None:
+                self.dispatcher.submit(event)
+                return self._queued_response(event)
+
+            response = await self.handle_webhook_async(event)
+            if response.status_code >= 400:
+                self._release(event)
+                self._log_done(event)
+                return response
+
+            logger.info("Successfully processed webhook for order %s", event.payload.order_id)
+            return response
 
-        logger.info(f"Webhook event logged: {json.dumps(log_data)}")
+        except Exception as e:
+            self._release(event)
+            self._log_done(event)
+            return self._failure_response(e)
+
+    def _verified_event(self, raw_data: Union[str, bytes], signature: Optional[str]) -> WebhookEvent:
+        """Verify a request body's signature, then parse it.
+
+        A bad signature is rejected before the body is decoded or parsed.
+
+        Args:
+            raw_data: Raw request body.
+            signature: Webhook signature sent with the request.
+
+        Returns:
+            Parsed WebhookEvent.
+
+        Raises:
+            ZenoPayWebhookSignatureError: If a secret is configured and the signature does not match.
+            ZenoPayWebhookError: If the webhook data is invalid.
+        """
+        if self.verifier is not None and not self.verifier.verify(raw_data, signature):
+            raise ZenoPayWebhookSignatureError()
+
+        if isinstance(raw_data, bytes):
+            try:
+                raw_data = raw_data.decode("utf-8")
+            except UnicodeDecodeError:
+                raise ZenoPayWebhookError("Invalid webhook data: body is not valid UTF-8")
+        return self.parse_webhook(raw_data, signature)
+
+    def _claim(self, event: WebhookEvent) -> bool:
+        """Check the event against the dedup store, recording it if new.
+
+        Args:
+            event: Parsed webhook event.
+
+        Returns:
+            False if the event is a redelivery that must not be handled again.
+        """
+        if self.dedup is None:
+            return True
+        return self.dedup.claim(dedup_key(event))
+
+    def _release(self, event: WebhookEvent) -> None:
+        """Forget a claimed event whose handling failed, so its redelivery is handled."""
+        if self.dedup is not None:
+            self.dedup.release(dedup_key(event))
+
+    def _log_done(self, event: WebhookEvent) -> None:
+        """Mark the event's log entry as done, once."""
+        if self.log is not None and event.log_position is not None:
+            self.log.mark_done(event.log_position)
+            event.log_position = None
+
+    def _log_failed(self, event: WebhookEvent) -> None:
+        """Keep the event's log entry for the next replay without holding back the checkpoint."""
+        if self.log is not None and event.log_position is not None:
+            self.log.mark_failed(event.log_position)
+
+    def _replayed_events(self) -> Iterator[WebhookEvent]:
+        """Parse the log entries left over by a crash, skipping unparseable ones."""
+        if self.log is None:
+            return
+        timestamp = datetime.now().isoformat()
+        for position, raw_data in self.log.replay():
+            try:
+                event = parse_webhook_record(raw_data, timestamp)
+            except ValidationError as e:
+                logger.error("Skipping unparseable webhook log entry at position %s: %s", position, e)
+                self.log.mark_done(position)
+                continue
+            event.log_position = position
+            yield event
+
+    def _duplicate_response(self, event: WebhookEvent) -> WebhookResponse:
+        """Build the acknowledgement for a redelivered event."""
+        self._audit("duplicate", event)
+        return WebhookResponse(status="success", message=f"Duplicate webhook ignored for order {event.payload.order_id}")
+
+    def _queued_response(self, event: WebhookEvent) -> WebhookResponse:
+        """Build the acknowledgement for an event handed to the dispatcher."""
+        self._audit("queued", event)
+        return WebhookResponse(status="success", message=f"Webhook received and queued for order {event.payload.order_id}")
+
+    @staticmethod
+    def _failure_response(error: Exception) -> WebhookResponse:
+        """Build the response for a webhook request that could not be processed.
+
+        Args:
+            error: Error raised while parsing, queueing or handling the webhook.
+
+        Returns:
+            Error response with the HTTP status code to answer with.
+        """
+        if isinstance(error, ZenoPayWebhookQueueFullError):
+            return WebhookResponse(status="error", message=str(error), status_code=503)
+        if isinstance(error, ZenoPayWebhookSignatureError):
+            logger.debug("Rejected webhook with an invalid signature")
+            return WebhookResponse(status="error", message=str(error), status_code=401)
+        if isinstance(error, ZenoPayWebhookError):
+            logger.error("Webhook error: %s", error)
+            return WebhookResponse(status="error", message=str(error), status_code=400)
+        logger.error("Unexpected error processing webhook: %s", error)
+        return WebhookResponse(status="error", message="Internal error processing webhook", status_code=500)
+
+    def _lookup_handlers(self, event: WebhookEvent) -> Tuple[HandlerRegistration, ...]:
+        """Get the handlers for an event's payment status, warning when there are none.
+
+        Args:
+            event: Parsed webhook event.
+
+        Returns:
+            Registered handlers.
+        """
+        event_type = event.payload.payment_status
+        registrations = self._handlers.get(event_type)
+        if not registrations:
+            logger.warning("No handler registered for event type: %s", event_type)
+        return registrations
+
+    def _handled(self, event: WebhookEvent, errors: List[BaseException]) -> WebhookResponse:
+        """Notify listeners and build the response once every handler has run.
+
+        Args:
+            event: The handled webhook event.
+            errors: Exceptions raised by handlers.
+
+        Returns:
+            Webhook response to send back to ZenoPay.
+        """
+        self._notify_listeners(event)
+
+        if errors:
+            # The log entry is kept for replay_log. After an inline failure the request
+            # handler releases the event instead, as ZenoPay will redeliver it.
+            self._log_failed(event)
+            for error in errors:
+                logger.error("Error handling webhook: %s", error)
+            self._audit("failed", event, str(errors[0]))
+            return WebhookResponse(status="error", message=f"Error processing webhook: {str(errors[0])}", status_code=500)
+
+        self._log_done(event)
+        self._audit("handled", event)
+        return WebhookResponse(
+            status="success",
+            message=f"Webhook received and processed for order {event.payload.order_id}",
+        )
+
+    def _notify_listeners(self, event: WebhookEvent) -> None:
+        """Call every registered listener with the event.
+
+        Args:
+            event: The handled webhook event.
+        """
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error("Webhook listener failed for order %s: %s", event.payload.order_id, e)
+
+    def _audit(self, stage: str, event: WebhookEvent, message: Optional[str] = None) -> None:
+        """Send an audit record to the enabled audit sinks.
+
+        The record is only built if a sink is enabled, so disabled auditing costs one
+        check per sink.
+
+        Args:
+            stage: What happened to the webhook: handled, failed, queued or duplicate.
+            event: The webhook event.
+            message: Error message for failed webhooks.
+        """
+        record: Optional[WebhookAuditRecord] = None
+        for sink in self.audit_sinks:
+            if not sink.enabled:
+                continue
+            if record is None:
+                payload = event.payload
+                record = WebhookAuditRecord(
+                    stage=stage,
+                    order_id=payload.order_id,
+                    payment_status=payload.payment_status,
+                    reference=payload.reference,
+                    recorded_at=time.time(),
+                    message=message,
+                )
+            try:
+                sink.emit(record)
+            except Exception as e:
+                logger.error("Webhook audit sink %r failed: %s", sink, e)
 
     def create_test_webhook(self, order_id: str, payment_status: str = "COMPLETED") -> WebhookEvent:
         """Create a test webhook event for development/testing.
@@ -171,18 +652,18 @@ class WebhookService:
         raw_data = json.dumps(test_payload)
         return self.parse_webhook(raw_data)
 
-    def on_payment_completed(self, handler: Callable[[WebhookEvent], Any]) -> None:
+    def on_payment_completed(self, handler: Callable[[WebhookEvent], Any], max_concurrency: Optional[int] = None) -> None:
         """Register handler for payment completed events."""
-        self.register_handler("COMPLETED", handler)
+        self.register_handler("COMPLETED", handler, max_concurrency)
 
-    def on_payment_failed(self, handler: Callable[[WebhookEvent], Any]) -> None:
+    def on_payment_failed(self, handler: Callable[[WebhookEvent], Any], max_concurrency: Optional[int] = None) -> None:
         """Register handler for payment failed events."""
-        self.register_handler("FAILED", handler)
+        self.register_handler("FAILED", handler, max_concurrency)
 
-    def on_payment_pending(self, handler: Callable[[WebhookEvent], Any]) -> None:
+    def on_payment_pending(self, handler: Callable[[WebhookEvent], Any], max_concurrency: Optional[int] = None) -> None:
         """Register handler for payment pending events."""
-        self.register_handler("PENDING", handler)
+        self.register_handler("PENDING", handler, max_concurrency)
 
-    def on_payment_cancelled(self, handler: Callable[[WebhookEvent], Any]) -> None:
+    def on_payment_cancelled(self, handler: Callable[[WebhookEvent], Any], max_concurrency: Optional[int] = None) -> None:
         """Register handler for payment cancelled events."""
-        self.register_handler("CANCELLED", handler)
+        self.register_handler("CANCELLED", handler, max_concurrency)
@@ -1,3 +1,4 @@
 from elusion.zenopay.utils.helpers import format_amount, parse_amount, generate_id, generate_short_id
+from elusion.zenopay.utils.journal import DisbursementJournal, JournalState
 
-__all__ = ["format_amount", "parse_amount", "generate_id", "generate_short_id"]
+__all__ = ["format_amount", "parse_amount", "generate_id", "generate_short_id", "DisbursementJournal", "JournalState"]
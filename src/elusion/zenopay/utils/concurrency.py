@@ -0,0 +1,321 @@
+"""Concurrency helpers for the ZenoPay SDK: bounded bulk operations and shared in-flight calls."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+I = TypeVar("I")  # noqa: E741
+K = TypeVar("K", bound=Hashable)
+R = TypeVar("R")
+
+
+class Pacer:
+    """Spaces out item starts to stay under a maximum rate."""
+
+    def __init__(self, rate_limit: Optional[float] = None) -> None:
+        """Initialize the pacer.
+
+        Args:
+            rate_limit: Maximum number of starts per second. None disables pacing.
+
+        Raises:
+            ValueError: If rate_limit is not positive.
+        """
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be greater than 0")
+
+        self._interval = 1.0 / rate_limit if rate_limit else 0.0
+        self._next_start = 0.0
+
+    def reserve(self) -> float:
+        """Reserve the next start slot.
+
+        Returns:
+            Seconds to wait before starting.
+        """
+        if not self._interval:
+            return 0.0
+
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        return start - now
+
+
+async def _iterate(items: Union[Iterable[I], AsyncIterable[I]]) -> AsyncIterator[I]:
+    """Iterate sync and async iterables alike."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def bounded_map(
+    func: Callable[[int, I], Awaitable[R]],
+    items: Union[Iterable[I], AsyncIterable[I]],
+    concurrency: int,
+    rate_limit: Optional[float] = None,
+) -> AsyncIterator[R]:
+    """Run a coroutine function over items with bounded concurrency.
+
+    Items are pulled from the input lazily and at most ``concurrency`` calls are in
+    flight at once, so memory stays flat however long the input is. Results are
+    yielded in completion order. Closing the iterator early cancels in-flight calls.
+
+    Args:
+        func: Coroutine function called with the item's index and the item.
+        items: Sync or async iterable of items.
+        concurrency: Maximum number of calls in flight.
+        rate_limit: Maximum number of calls started per second (optional).
+
+    Yields:
+        Results of ``func`` as they complete.
+
+    Raises:
+        ValueError: If concurrency is lower than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pacer = Pacer(rate_limit)
+    pending: Set["asyncio.Future[R]"] = set()
+
+    try:
+        index = 0
+        async for item in _iterate(items):
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+
+            delay = pacer.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+
+            pending.add(asyncio.ensure_future(func(index, item)))
+            index += 1
+
+            for task in [task for task in pending if task.done()]:
+                pending.discard(task)
+                yield task.result()
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def bounded_map_sync(
+    func: Callable[[int, I], R],
+    items: Iterable[I],
+    concurrency: int,
+    rate_limit: Optional[float] = None,
+) -> Iterator[R]:
+    """Run a function over items on a thread pool with bounded concurrency.
+
+    Thread pool counterpart of ``bounded_map``.
+
+    Args:
+        func: Function called with the item's index and the item.
+        items: Iterable of items.
+        concurrency: Maximum number of calls in flight, and the thread pool size.
+        rate_limit: Maximum number of calls started per second (optional).
+
+    Yields:
+        Results of ``func`` as they complete.
+
+    Raises:
+        ValueError: If concurrency is lower than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pacer = Pacer(rate_limit)
+    pending: Set["Future[R]"] = set()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="zenopay-bulk") as executor:
+        try:
+            for index, item in enumerate(items):
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+                delay = pacer.reserve()
+                if delay:
+                    time.sleep(delay)
+
+                pending.add(executor.submit(func, index, item))
+
+                for future in [future for future in pending if future.done()]:
+                    pending.discard(future)
+                    yield future.result()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class _SyncCall(Generic[R]):
+    """In-flight sync call that other threads can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[R] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[K, R]):
+    """Shares one in-flight call between concurrent callers of the same key.
+
+    The first caller of a key makes the call; callers arriving while it is in flight
+    wait for it and receive the same result, or the same exception. Nothing is kept
+    once the call finishes. Async callers share a call per event loop, and if the
+    caller making it is cancelled the others make it again rather than being cancelled
+    with it. Sync callers share a call across threads. Calls must not return None.
+    """
+
+    def __init__(self, lock: Optional[threading.Lock] = None) -> None:
+        """Initialize without calls in flight.
+
+        Args:
+            lock: Lock guarding the calls and counters. Pass the owner's lock so that
+                ``lookup`` functions and the owner's own counters share it.
+        """
+        self.lock = lock or threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+        self._async_calls: Dict[Tuple[int, K], "asyncio.Future[Optional[R]]"] = {}
+        self._sync_calls: Dict[K, _SyncCall[R]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently shared."""
+        with self.lock:
+            return len(self._async_calls) + len(self._sync_calls)
+
+    async def run(self, key: K, call: Callable[[], Awaitable[R]], lookup: Optional[Callable[[], Optional[R]]] = None) -> R:
+        """Make a call, or join the one already in flight for the key on this event loop.
+
+        Args:
+            key: Key identical calls share.
+            call: Coroutine function making the call.
+            lookup: Function returning a result that makes the call unnecessary, e.g. a
+                cache lookup, or None. Called with ``lock`` held before joining or starting a call.
+
+        Returns:
+            Result of the shared call, or of ``lookup``.
+        """
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        while True:
+            with self.lock:
+                if lookup is not None:
+                    found = lookup()
+                    if found is not None:
+                        return found
+
+                future = self._async_calls.get(call_key)
+                if future is None:
+                    self.calls += 1
+                    future = loop.create_future()
+                    self._async_calls[call_key] = future
+                    leader = True
+                else:
+                    self.coalesced += 1
+                    leader = False
+
+            if leader:
+                break
+            result = await asyncio.shield(future)
+            if result is not None:
+                return result
+            # The caller making the call was cancelled; make it again.
+
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.set_result(None)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved when no other caller is waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self._async_calls[call_key]
+
+    def run_sync(self, key: K, call: Callable[[], R], lookup: Optional[Callable[[], Optional[R]]] = None) -> R:
+        """Sync counterpart of ``run``, sharing calls across threads.
+
+        Args:
+            key: Key identical calls share.
+            call: Function making the call.
+            lookup: Function returning a result that makes the call unnecessary, or None.
+
+        Returns:
+            Result of the shared call, or of ``lookup``.
+        """
+        with self.lock:
+            if lookup is not None:
+                found = lookup()
+                if found is not None:
+                    return found
+
+            shared = self._sync_calls.get(key)
+            if shared is None:
+                self.calls += 1
+                shared = self._sync_calls[key] = _SyncCall()
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            shared.done.wait()
+            if shared.error is not None:
+                raise shared.error
+            assert shared.result is not None
+            return shared.result
+
+        try:
+            shared.result = call()
+            return shared.result
+        except BaseException as e:
+            shared.error = e
+            raise
+        finally:
+            with self.lock:
+                del self._sync_calls[key]
+            shared.done.set()
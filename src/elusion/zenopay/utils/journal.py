@@ -0,0 +1,182 @@
+"""Append-only idempotency journal for disbursement batches."""
+
+import os
+import sqlite3
+import threading
+import time
+from enum import Enum
+from typing import Any, List, Optional, Set, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    transid TEXT NOT NULL,
+    state TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    fee INTEGER,
+    total_deducted INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_transid ON entries (transid, seq);
+"""
+
+_LATEST_STATE = "SELECT state FROM entries WHERE transid = ? ORDER BY seq DESC LIMIT 1"
+
+_LATEST_IN_STATE = """
+SELECT e.transid FROM entries e
+WHERE e.state = ? AND e.seq = (SELECT MAX(seq) FROM entries WHERE transid = e.transid)
+ORDER BY e.seq
+"""
+
+
+class JournalState(str, Enum):
+    """State of a transaction ID in the disbursement journal."""
+
+    PENDING = "PENDING"  # Claimed for submission; outcome not yet known
+    SUCCEEDED = "SUCCEEDED"  # Acknowledged by the API; never submitted again
+    FAILED = "FAILED"  # Definitely rejected by the API; safe to submit again
+
+    def __str__(self) -> str:
+        """String representation of the journal state."""
+        return self.value
+
+
+class DisbursementJournal:
+    """SQLite-backed, append-only record of disbursement transaction IDs and their states.
+
+    Every state change appends a row; the latest row per ``transid`` is its current state.
+    A ``PENDING`` row is committed before a disbursement is sent, so after a crash the
+    journal tells which payouts were acknowledged, which were rejected and which are in
+    doubt. Writes are committed in WAL mode and synced to disk before they return, so they
+    survive a process crash or a power loss. The journal is safe to share between threads.
+
+    Examples:
+        >>> with DisbursementJournal("payouts.db") as journal:
+        ...     report = client.disbursements.sync.disburse_batch(payouts, journal)
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Open or create a journal.
+
+        Args:
+            path: Path to the SQLite database file. Use ":memory:" for a throwaway journal.
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._active: Set[str] = set()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "DisbursementJournal":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def state(self, transid: str) -> Optional[JournalState]:
+        """Get the current state of a transaction ID.
+
+        Args:
+            transid: Disbursement transaction ID.
+
+        Returns:
+            Latest recorded state, or None if the transaction ID was never journaled.
+        """
+        with self._lock:
+            return self._state(transid)
+
+    def claim(self, transid: str, resubmit_in_doubt: bool = False) -> Optional[JournalState]:
+        """Atomically claim a transaction ID for submission.
+
+        A transaction ID can be claimed when it is new, was rejected, or is in doubt and
+        ``resubmit_in_doubt`` is set. Claiming appends a ``PENDING`` entry. A transaction ID
+        already claimed by this journal and not yet finished is never claimed twice.
+
+        Args:
+            transid: Disbursement transaction ID.
+            resubmit_in_doubt: Whether to claim transaction IDs left ``PENDING`` by an earlier run.
+
+        Returns:
+            None if the transaction ID was claimed, otherwise the state that prevents submission.
+        """
+        with self._lock:
+            if transid in self._active:
+                return JournalState.PENDING
+
+            state = self._state(transid)
+            if state is JournalState.SUCCEEDED or (state is JournalState.PENDING and not resubmit_in_doubt):
+                return state
+
+            self._append(transid, JournalState.PENDING)
+            self._active.add(transid)
+            return None
+
+    def record(
+        self,
+        transid: str,
+        state: JournalState,
+        fee: Optional[int] = None,
+        total_deducted: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Append the outcome of a submitted transaction ID.
+
+        Args:
+            transid: Disbursement transaction ID.
+            state: Outcome state.
+            fee: Fee charged, for acknowledged disbursements.
+            total_deducted: Total deducted from the wallet, for acknowledged disbursements.
+            error: Error message, for failed or in-doubt disbursements.
+        """
+        with self._lock:
+            self._append(transid, state, fee, total_deducted, error)
+            self._active.discard(transid)
+
+    def in_doubt(self) -> List[str]:
+        """List transaction IDs whose outcome is unknown.
+
+        Returns:
+            Transaction IDs whose latest state is ``PENDING``, in claim order.
+        """
+        return self._transids_in(JournalState.PENDING)
+
+    def failed(self) -> List[str]:
+        """List transaction IDs that were rejected and not yet resubmitted successfully.
+
+        Returns:
+            Transaction IDs whose latest state is ``FAILED``, in order.
+        """
+        return self._transids_in(JournalState.FAILED)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _transids_in(self, state: JournalState) -> List[str]:
+        """List transaction IDs whose latest state is ``state``."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(_LATEST_IN_STATE, (state.value,))]
+
+    def _state(self, transid: str) -> Optional[JournalState]:
+        """Read the latest state of a transaction ID. Caller holds the lock."""
+        row = self._conn.execute(_LATEST_STATE, (transid,)).fetchone()
+        return JournalState(row[0]) if row else None
+
+    def _append(
+        self,
+        transid: str,
+        state: JournalState,
+        fee: Optional[int] = None,
+        total_deducted: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Append a journal entry. Caller holds the lock."""
+        self._conn.execute(
+            "INSERT INTO entries (transid, state, recorded_at, fee, total_deducted, error) VALUES (?, ?, ?, ?, ?, ?)",
+            (transid, state.value, time.time(), fee, total_deducted, error),
+        )
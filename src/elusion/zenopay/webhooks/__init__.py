@@ -0,0 +1,39 @@
+"""Webhook receiving infrastructure for the ZenoPay SDK."""
+
+from elusion.zenopay.webhooks.audit import CallbackAuditSink, LoggerAuditSink, NDJSONAuditSink, WebhookAuditSink
+from elusion.zenopay.webhooks.dedup import MemoryDedupStore, SQLiteDedupStore, WebhookDedupStore, dedup_key
+from elusion.zenopay.webhooks.dispatch import (
+    AsyncWebhookDispatcher,
+    OverflowPolicy,
+    SpillFile,
+    ThreadedWebhookDispatcher,
+    WebhookDispatcher,
+)
+from elusion.zenopay.webhooks.handlers import HandlerRegistration, HandlerRegistry, WebhookHandler
+from elusion.zenopay.webhooks.parsing import ParsedWebhooks, WebhookRecord, parse_webhook_record
+from elusion.zenopay.webhooks.signature import WebhookSignatureVerifier
+from elusion.zenopay.webhooks.wal import WebhookLog
+
+__all__ = [
+    "AsyncWebhookDispatcher",
+    "CallbackAuditSink",
+    "HandlerRegistration",
+    "HandlerRegistry",
+    "LoggerAuditSink",
+    "MemoryDedupStore",
+    "NDJSONAuditSink",
+    "OverflowPolicy",
+    "ParsedWebhooks",
+    "SQLiteDedupStore",
+    "SpillFile",
+    "ThreadedWebhookDispatcher",
+    "WebhookAuditSink",
+    "WebhookDedupStore",
+    "WebhookDispatcher",
+    "WebhookHandler",
+    "WebhookLog",
+    "WebhookRecord",
+    "WebhookSignatureVerifier",
+    "dedup_key",
+    "parse_webhook_record",
+]
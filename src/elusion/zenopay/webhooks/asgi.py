@@ -0,0 +1,144 @@
+"""Dependency-free ASGI application receiving ZenoPay webhooks."""
+
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional, Tuple
+
+from elusion.zenopay.services.webhooks import WebhookService
+from elusion.zenopay.webhooks.dispatch import AsyncWebhookDispatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WEBHOOK_PATH = "/zenopay/webhook"
+DEFAULT_MAX_BODY_SIZE = 64 * 1024
+DEFAULT_SIGNATURE_HEADER = "x-zenopay-signature"
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class WebhookASGIApp:
+    """ASGI application that feeds webhook requests to a ``WebhookService``.
+
+    Accepts ``POST`` requests on ``path``, reads the body as bytes up to ``max_body_size``
+    and passes it with the ``signature_header`` to ``process_webhook_request_async``, which
+    verifies the signature over the exact bytes before parsing. Coroutine handlers run on
+    the event loop, sync handlers in an executor, and with an ``AsyncWebhookDispatcher``
+    the request is acknowledged as soon as the event is queued. The JSON response carries
+    the ``WebhookResponse`` status and message with its ``status_code``.
+
+    On lifespan startup, the service's ``AsyncWebhookDispatcher`` is started and entries
+    left in its ``WebhookLog`` are replayed; on shutdown the dispatcher is drained.
+
+    Examples:
+        >>> from elusion.zenopay.webhooks.asgi import WebhookASGIApp
+        >>> app = WebhookASGIApp(client.webhooks)
+        >>> # uvicorn myapp:app --workers 4
+    """
+
+    def __init__(
+        self,
+        service: WebhookService,
+        path: Optional[str] = DEFAULT_WEBHOOK_PATH,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        signature_header: str = DEFAULT_SIGNATURE_HEADER,
+    ) -> None:
+        """Initialize the application.
+
+        Args:
+            service: Webhook service with handlers registered.
+            path: Path webhooks are posted to. None accepts any path, e.g. when mounted under a router.
+            max_body_size: Maximum accepted body size in bytes; larger bodies get 413.
+            signature_header: Request header carrying the webhook signature, checked when the service has a secret.
+        """
+        self.service = service
+        self.path = path
+        self.max_body_size = max_body_size
+        self._signature_header = signature_header.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        if self.path is not None and scope["path"] != self.path:
+            await self._respond(send, 404, {"status": "error", "message": "Not found"})
+            return
+        if scope["method"] != "POST":
+            await self._respond(send, 405, {"status": "error", "message": "Method not allowed"}, [(b"allow", b"POST")])
+            return
+
+        body = await self._read_body(receive)
+        if body is None:
+            await self._respond(send, 413, {"status": "error", "message": "Request body too large"})
+            return
+
+        response = await self.service.process_webhook_request_async(body, self._signature(scope))
+        await self._respond(send, response.status_code, response.model_dump())
+
+    def _signature(self, scope: Scope) -> Optional[str]:
+        """Get the signature header of a request."""
+        for name, value in scope["headers"]:
+            if name == self._signature_header:
+                return bytes(value).decode("latin-1")
+        return None
+
+    async def _read_body(self, receive: Receive) -> Optional[bytes]:
+        """Read the request body, or return None once it exceeds max_body_size."""
+        chunks: List[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Start and stop the service's async dispatcher with the server."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    if isinstance(self.service.dispatcher, AsyncWebhookDispatcher):
+                        await self.service.dispatcher.start()
+                    if self.service.log is not None:
+                        await self.service.replay_log_async()
+                except Exception as e:
+                    logger.error("Webhook app startup failed: %s", e)
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if isinstance(self.service.dispatcher, AsyncWebhookDispatcher):
+                    await self.service.dispatcher.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _respond(send: Send, status: int, content: Dict[str, Any], headers: Optional[List[Tuple[bytes, bytes]]] = None) -> None:
+        """Send a JSON response."""
+        body = json.dumps(content).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("ascii")),
+                    *(headers or []),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
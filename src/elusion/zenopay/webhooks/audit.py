@@ -0,0 +1,139 @@
+"""Structured audit logging of received webhooks."""
+
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Union
+
+from elusion.zenopay.models.webhook import WebhookAuditRecord
+
+AUDIT_LOGGER_NAME = "elusion.zenopay.webhooks.audit"
+
+
+class WebhookAuditSink(ABC):
+    """Base class for destinations of webhook audit records.
+
+    ``WebhookService`` only builds a record when at least one sink is ``enabled``, so a
+    disabled sink costs a single attribute check per webhook.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the sink currently wants records."""
+        return True
+
+    @abstractmethod
+    def emit(self, record: WebhookAuditRecord) -> None:
+        """Write a record.
+
+        Args:
+            record: Audit record.
+        """
+
+    def close(self) -> None:
+        """Release the sink's resources."""
+
+
+class LoggerAuditSink(WebhookAuditSink):
+    """Writes audit records to a standard library logger.
+
+    Enabled only while the logger is enabled for ``level``. Messages use ``%``-style
+    arguments, so they are formatted by the logging handler, not on the webhook path,
+    and the record is attached as ``extra={"webhook_audit": record}`` for structured
+    formatters.
+
+    Examples:
+        >>> client.webhooks.add_audit_sink(LoggerAuditSink(level=logging.DEBUG))
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO) -> None:
+        """Initialize the sink.
+
+        Args:
+            logger: Logger to write to. Defaults to the ``elusion.zenopay.webhooks.audit`` logger.
+            level: Log level of the records.
+        """
+        self.logger = logger or logging.getLogger(AUDIT_LOGGER_NAME)
+        self.level = level
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the logger is enabled for the sink's level."""
+        return self.logger.isEnabledFor(self.level)
+
+    def emit(self, record: WebhookAuditRecord) -> None:
+        """Log a record."""
+        self.logger.log(
+            self.level,
+            "Webhook %s for order %s: %s (reference %s)",
+            record.stage,
+            record.order_id,
+            record.payment_status,
+            record.reference,
+            extra={"webhook_audit": record},
+        )
+
+
+class NDJSONAuditSink(WebhookAuditSink):
+    """Appends audit records to a file, one JSON object per line.
+
+    Examples:
+        >>> client.webhooks.add_audit_sink(NDJSONAuditSink("webhook-audit.ndjson"))
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Open the audit file for appending.
+
+        Args:
+            path: Path of the NDJSON file.
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def __enter__(self) -> "NDJSONAuditSink":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the file is open."""
+        return not self._file.closed
+
+    def emit(self, record: WebhookAuditRecord) -> None:
+        """Append a record and flush it to the operating system."""
+        line = record.model_dump_json() + "\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+                self._file.flush()
+
+    def close(self) -> None:
+        """Close the audit file."""
+        with self._lock:
+            self._file.close()
+
+
+class CallbackAuditSink(WebhookAuditSink):
+    """Passes audit records to a callback, e.g. to ship them to a metrics or SIEM system.
+
+    Examples:
+        >>> client.webhooks.add_audit_sink(CallbackAuditSink(audit_queue.put_nowait))
+    """
+
+    def __init__(self, callback: Callable[[WebhookAuditRecord], Any]) -> None:
+        """Initialize the sink.
+
+        Args:
+            callback: Called with every audit record.
+        """
+        self.callback = callback
+
+    def emit(self, record: WebhookAuditRecord) -> None:
+        """Call the callback with a record."""
+        self.callback(record)
@@ -0,0 +1,301 @@
+"""Deduplication of redelivered webhook events."""
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Union
+
+from elusion.zenopay.models.webhook import DedupStats, WebhookEvent
+
+DEFAULT_DEDUP_TTL = 86400.0
+DEFAULT_DEDUP_MAX_SIZE = 100000
+
+DedupKey = Tuple[str, str, str]
+
+
+def dedup_key(event: WebhookEvent) -> DedupKey:
+    """Build the deduplication key of a webhook event.
+
+    Args:
+        event: Parsed webhook event.
+
+    Returns:
+        The ``(order_id, payment_status, reference)`` triple; a missing reference is "".
+    """
+    payload = event.payload
+    return payload.order_id, payload.payment_status, payload.reference or ""
+
+
+class WebhookDedupStore(ABC):
+    """Base class for stores remembering which webhook events were already accepted.
+
+    ZenoPay redelivers a webhook until it is acknowledged, so the same
+    ``(order_id, payment_status, reference)`` can arrive several times. ``claim`` records a
+    key and reports whether it is new in a single step, so concurrent copies of one event
+    cannot both be handled. Subclasses provide the storage; stores are thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self._lock = threading.Lock()
+        self._checked = 0
+        self._duplicates = 0
+        self._released = 0
+        self._evictions = 0
+
+    def __enter__(self) -> "WebhookDedupStore":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of remembered keys."""
+
+    @abstractmethod
+    def seen(self, key: DedupKey) -> bool:
+        """Check if a key is remembered and not expired, without recording it.
+
+        Args:
+            key: Deduplication key, see ``dedup_key``.
+
+        Returns:
+            True if an event with this key was already claimed.
+        """
+
+    @property
+    def stats(self) -> DedupStats:
+        """Snapshot of the deduplication counters."""
+        size = len(self)
+        with self._lock:
+            return DedupStats(
+                checked=self._checked,
+                duplicates=self._duplicates,
+                released=self._released,
+                evictions=self._evictions,
+                size=size,
+            )
+
+    def claim(self, key: DedupKey) -> bool:
+        """Record a key unless it is already remembered.
+
+        Args:
+            key: Deduplication key, see ``dedup_key``.
+
+        Returns:
+            True if the key is new and the event should be handled, False for a duplicate.
+        """
+        with self._lock:
+            new = self._add(key)
+            self._checked += 1
+            if not new:
+                self._duplicates += 1
+            return new
+
+    def release(self, key: DedupKey) -> None:
+        """Forget a key so that the next delivery of the event is handled again.
+
+        Called when handling a claimed event failed.
+
+        Args:
+            key: Deduplication key, see ``dedup_key``.
+        """
+        with self._lock:
+            if self._discard(key):
+                self._released += 1
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every key."""
+
+    def close(self) -> None:
+        """Release the store's resources."""
+
+    @abstractmethod
+    def _add(self, key: DedupKey) -> bool:
+        """Record a key if it is not remembered. Caller holds the lock."""
+
+    @abstractmethod
+    def _discard(self, key: DedupKey) -> bool:
+        """Forget a key, returning whether it was remembered. Caller holds the lock."""
+
+
+class MemoryDedupStore(WebhookDedupStore):
+    """In-memory LRU store with an optional time-to-live.
+
+    Keys live in an ordered dict, so lookups, inserts and evictions are O(1). The store
+    holds at most ``max_size`` keys, evicting the least recently seen one first, and
+    forgets keys after ``ttl`` seconds. It does not survive restarts; use
+    ``SQLiteDedupStore`` for that.
+
+    Examples:
+        >>> client.webhooks.use_dedup(MemoryDedupStore(max_size=50000, ttl=3600))
+    """
+
+    def __init__(self, max_size: int = DEFAULT_DEDUP_MAX_SIZE, ttl: Optional[float] = DEFAULT_DEDUP_TTL) -> None:
+        """Initialize the store.
+
+        Args:
+            max_size: Maximum number of remembered keys.
+            ttl: Seconds a key is remembered. None keeps keys until evicted.
+
+        Raises:
+            ValueError: If max_size is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._keys: "OrderedDict[DedupKey, Optional[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of remembered keys, including expired ones not yet dropped."""
+        return len(self._keys)
+
+    def seen(self, key: DedupKey) -> bool:
+        """Check if a key is remembered and not expired, without recording it."""
+        with self._lock:
+            if key not in self._keys:
+                return False
+            expires_at = self._keys[key]
+            return expires_at is None or expires_at > time.monotonic()
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._keys.clear()
+
+    def _add(self, key: DedupKey) -> bool:
+        """Record a key if it is not remembered. Caller holds the lock."""
+        now = time.monotonic()
+        if key in self._keys:
+            expires_at = self._keys[key]
+            if expires_at is None or expires_at > now:
+                self._keys.move_to_end(key)
+                return False
+
+        self._keys[key] = now + self.ttl if self.ttl is not None else None
+        self._keys.move_to_end(key)
+        self._prune(now)
+        return True
+
+    def _discard(self, key: DedupKey) -> bool:
+        """Forget a key, returning whether it was remembered. Caller holds the lock."""
+        return self._keys.pop(key, False) is not False
+
+    def _prune(self, now: float) -> None:
+        """Drop expired keys at the least recently seen end, then evict down to max_size."""
+        while self._keys:
+            oldest, expires_at = next(iter(self._keys.items()))
+            if expires_at is None or expires_at > now:
+                break
+            del self._keys[oldest]
+
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+            self._evictions += 1
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    order_id TEXT NOT NULL,
+    payment_status TEXT NOT NULL,
+    reference TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (order_id, payment_status, reference)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS seen_by_time ON seen (seen_at);
+"""
+
+# Inserts a new key, or takes over an expired one; rowcount is 0 only for a live duplicate.
+_CLAIM = """
+INSERT INTO seen (order_id, payment_status, reference, seen_at) VALUES (?, ?, ?, ?)
+ON CONFLICT (order_id, payment_status, reference) DO UPDATE SET seen_at = excluded.seen_at
+WHERE seen.seen_at <= ?
+"""
+
+_PURGE_EVERY = 1000
+
+
+class SQLiteDedupStore(WebhookDedupStore):
+    """SQLite-backed store that survives restarts.
+
+    Each key is a primary-key row, so a claim is a single indexed upsert and the store has
+    no size limit. Keys expire after ``ttl`` seconds of wall-clock time; expired rows are
+    purged every 1000 claims.
+    Writes are committed in WAL mode, and several processes may share the file.
+
+    Examples:
+        >>> with SQLiteDedupStore("webhooks-seen.db") as store:
+        ...     client.webhooks.use_dedup(store)
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], ttl: Optional[float] = DEFAULT_DEDUP_TTL) -> None:
+        """Open or create a store.
+
+        Args:
+            path: Path to the SQLite database file. Use ":memory:" for a throwaway store.
+            ttl: Seconds a key is remembered. None keeps keys forever.
+        """
+        super().__init__()
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self._claims = 0
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        """Number of remembered keys, including expired ones not yet purged."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0])
+
+    def seen(self, key: DedupKey) -> bool:
+        """Check if a key is remembered and not expired, without recording it."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen WHERE order_id = ? AND payment_status = ? AND reference = ? AND seen_at > ?",
+                (*key, self._cutoff()),
+            ).fetchone()
+            return row is not None
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._conn.execute("DELETE FROM seen")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _add(self, key: DedupKey) -> bool:
+        """Record a key if it is not remembered. Caller holds the lock."""
+        now = time.time()
+        cutoff = self._cutoff(now)
+        new = self._conn.execute(_CLAIM, (*key, now, cutoff)).rowcount > 0
+
+        self._claims += 1
+        if self.ttl is not None and self._claims % _PURGE_EVERY == 0:
+            self._conn.execute("DELETE FROM seen WHERE seen_at <= ?", (cutoff,))
+        return new
+
+    def _discard(self, key: DedupKey) -> bool:
+        """Forget a key, returning whether it was remembered. Caller holds the lock."""
+        cursor = self._conn.execute("DELETE FROM seen WHERE order_id = ? AND payment_status = ? AND reference = ?", key)
+        return cursor.rowcount > 0
+
+    def _cutoff(self, now: Optional[float] = None) -> float:
+        """Timestamp at or before which a key has expired."""
+        if self.ttl is None:
+            return float("-inf")
+        return (time.time() if now is None else now) - self.ttl
@@ -0,0 +1,519 @@
+"""Queued webhook dispatch with a worker pool and backpressure."""
+
+import asyncio
+import collections
+import inspect
+import json
+import logging
+import os
+import queue
+import threading
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Callable, Deque, List, Optional, Union
+
+from elusion.zenopay.exceptions import ZenoPayWebhookError, ZenoPayWebhookQueueFullError
+from elusion.zenopay.models.webhook import DispatchMetrics, WebhookEvent, WebhookResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISPATCH_WORKERS = 4
+DEFAULT_DISPATCH_QUEUE_SIZE = 1000
+
+WebhookHandler = Callable[[WebhookEvent], Any]
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with a webhook event when the dispatch queue is full."""
+
+    BLOCK = "block"  # Wait for room in the queue
+    REJECT = "reject"  # Raise ZenoPayWebhookQueueFullError, answered with 503 so ZenoPay redelivers
+    SPILL = "spill"  # Append the event to a spill file, dispatched once the queue has room
+
+    def __str__(self) -> str:
+        """String representation of the overflow policy."""
+        return self.value
+
+
+class SpillFile:
+    """Append-only NDJSON file holding events that did not fit in the dispatch queue.
+
+    Appends are fsynced, so a spilled event survives a crash once ``append`` returns.
+    Taken events stay in the file until every spilled event has been taken, and are
+    dispatched again if the process restarts before then.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Open or create a spill file, resuming events spilled by an earlier process.
+
+        Args:
+            path: Path of the spill file.
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._offset = 0
+        self._pending = 0
+        self._restored: Deque[WebhookEvent] = collections.deque()
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                self._pending = sum(1 for line in f if line.strip())
+
+    def __len__(self) -> int:
+        """Number of spilled events not yet taken."""
+        return self._pending
+
+    def append(self, event: WebhookEvent) -> None:
+        """Spill an event.
+
+        Args:
+            event: Parsed webhook event.
+        """
+        record = json.dumps(
+            {"raw_data": event.raw_data, "signature": event.signature, "timestamp": event.timestamp, "log_position": event.log_position}
+        )
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(record + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending += 1
+
+    def restore(self, events: List[WebhookEvent]) -> None:
+        """Put taken events back in front of the remaining ones, e.g. when the queue filled up again.
+
+        Args:
+            events: Events returned by ``take``, in the same order.
+        """
+        if not events:
+            return
+        with self._lock:
+            self._restored.extendleft(reversed(events))
+            self._pending += len(events)
+
+    def take(self, limit: int) -> List[WebhookEvent]:
+        """Take up to ``limit`` spilled events, oldest first.
+
+        The file is truncated once every spilled event has been taken.
+
+        Args:
+            limit: Maximum number of events to take.
+
+        Returns:
+            Spilled events.
+        """
+        events: List[WebhookEvent] = []
+        with self._lock:
+            if not self._pending or limit <= 0:
+                return events
+
+            while self._restored and len(events) < limit:
+                events.append(self._restored.popleft())
+
+            with open(self.path, "r", encoding="utf-8") as f:
+                f.seek(self._offset)
+                while len(events) < limit:
+                    line = f.readline()
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    event = WebhookEvent.from_raw_data(record["raw_data"])
+                    event.signature = record["signature"]
+                    event.timestamp = record["timestamp"]
+                    event.log_position = record.get("log_position")
+                    events.append(event)
+                self._offset = f.tell()
+
+            self._pending -= len(events)
+            if not self._pending:
+                open(self.path, "w").close()
+                self._offset = 0
+        return events
+
+
+class WebhookDispatcher(ABC):
+    """Base class for queued webhook dispatchers.
+
+    Accepting an event only enqueues it, so the webhook can be acknowledged right away
+    while a pool of workers runs the handler. Subclasses provide the queue and workers.
+    """
+
+    def __init__(
+        self,
+        handler: WebhookHandler,
+        workers: int = DEFAULT_DISPATCH_WORKERS,
+        max_queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        spill_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            handler: Called with every dispatched event, e.g. ``WebhookService.handle_webhook``. The event
+                fails if the handler raises or returns a ``WebhookResponse`` with an error status code.
+            workers: Number of workers processing events.
+            max_queue_size: Maximum number of queued events.
+            overflow: Policy applied when the queue is full.
+            spill_path: Spill file path. Required with the ``spill`` policy.
+
+        Raises:
+            ValueError: If workers or max_queue_size is lower than 1, or the spill path is missing.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
+        self.handler = handler
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.overflow = OverflowPolicy(overflow)
+        if self.overflow is OverflowPolicy.SPILL and spill_path is None:
+            raise ValueError("spill_path is required with the spill overflow policy")
+        self.spill = SpillFile(spill_path) if spill_path is not None else None
+
+        self._metrics_lock = threading.Lock()
+        self._max_depth = 0
+        self._enqueued = 0
+        self._processed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._spilled = 0
+
+    @property
+    def metrics(self) -> DispatchMetrics:
+        """Snapshot of queue depth and event counters."""
+        with self._metrics_lock:
+            return DispatchMetrics(
+                queue_depth=self.queue_depth,
+                max_queue_depth=self._max_depth,
+                capacity=self.max_queue_size,
+                spill_depth=len(self.spill) if self.spill is not None else 0,
+                enqueued=self._enqueued,
+                processed=self._processed,
+                failed=self._failed,
+                rejected=self._rejected,
+                spilled=self._spilled,
+            )
+
+    @property
+    @abstractmethod
+    def queue_depth(self) -> int:
+        """Number of events waiting in the queue."""
+
+    @abstractmethod
+    def submit(self, event: WebhookEvent) -> None:
+        """Enqueue an event for dispatch.
+
+        Args:
+            event: Parsed webhook event.
+
+        Raises:
+            ZenoPayWebhookQueueFullError: If the queue is full and the event is rejected.
+        """
+
+    def _accepted(self) -> None:
+        """Count an enqueued event and track the queue high-water mark."""
+        with self._metrics_lock:
+            self._enqueued += 1
+            self._max_depth = max(self._max_depth, self.queue_depth)
+
+    def _overflowed(self, event: WebhookEvent) -> None:
+        """Spill or reject an event that did not fit in the queue."""
+        if self.spill is not None and self.overflow is OverflowPolicy.SPILL:
+            self.spill.append(event)
+            with self._metrics_lock:
+                self._spilled += 1
+            return
+
+        with self._metrics_lock:
+            self._rejected += 1
+        logger.warning("Webhook queue full, rejecting event for order %s", event.payload.order_id)
+        raise ZenoPayWebhookQueueFullError(queue_size=self.max_queue_size)
+
+    def _done(self, event: WebhookEvent, error: Optional[BaseException]) -> None:
+        """Count a finished event."""
+        with self._metrics_lock:
+            if error is None:
+                self._processed += 1
+            else:
+                self._failed += 1
+        if error is not None:
+            logger.error("Webhook handler failed for order %s: %s", event.payload.order_id, error)
+
+    @staticmethod
+    def _returned_error(result: Any) -> Optional[BaseException]:
+        """Get the failure reported by a handler that answers with a ``WebhookResponse`` instead of raising."""
+        if isinstance(result, WebhookResponse) and result.status_code >= 400:
+            return ZenoPayWebhookError(result.message)
+        return None
+
+    def _unspill(self, room: int) -> List[WebhookEvent]:
+        """Take spilled events that fit in ``room`` free queue slots."""
+        if self.spill is None or not len(self.spill):
+            return []
+        return self.spill.take(room)
+
+
+class AsyncWebhookDispatcher(WebhookDispatcher):
+    """Dispatches webhook events to a pool of asyncio tasks.
+
+    Coroutine handlers are awaited on the event loop; sync handlers run in the loop's
+    default executor so they never block it.
+
+    Examples:
+        >>> dispatcher = AsyncWebhookDispatcher(webhook_service.handle_webhook, workers=8, overflow="reject")
+        >>> await dispatcher.start()
+        >>> webhook_service.use_dispatcher(dispatcher)
+    """
+
+    def __init__(
+        self,
+        handler: WebhookHandler,
+        workers: int = DEFAULT_DISPATCH_WORKERS,
+        max_queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        spill_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ) -> None:
+        """Initialize the dispatcher. See ``WebhookDispatcher`` for the arguments."""
+        super().__init__(handler, workers, max_queue_size, overflow, spill_path)
+        self._queue: Optional["asyncio.Queue[WebhookEvent]"] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    async def __aenter__(self) -> "AsyncWebhookDispatcher":
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.stop()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting in the queue."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(self.max_queue_size)
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the workers.
+
+        Args:
+            drain: Whether to process queued and spilled events before stopping.
+        """
+        if self._queue is None:
+            return
+        if drain:
+            await self._queue.join()
+            while self._refill():
+                await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(self, event: WebhookEvent) -> None:
+        """Enqueue an event without waiting. Must be called from the event loop thread.
+
+        With the ``block`` policy a full queue rejects the event here; use ``submit_async``
+        to wait for room instead.
+
+        Args:
+            event: Parsed webhook event.
+
+        Raises:
+            RuntimeError: If the dispatcher has not been started.
+            ZenoPayWebhookQueueFullError: If the queue is full and the event is rejected.
+        """
+        if self._queue is None:
+            raise RuntimeError("Dispatcher is not running; call start() first")
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._overflowed(event)
+            return
+        self._accepted()
+
+    async def submit_async(self, event: WebhookEvent) -> None:
+        """Enqueue an event, waiting for room with the ``block`` policy.
+
+        Args:
+            event: Parsed webhook event.
+
+        Raises:
+            RuntimeError: If the dispatcher has not been started.
+            ZenoPayWebhookQueueFullError: If the queue is full and the event is rejected.
+        """
+        if self._queue is None:
+            raise RuntimeError("Dispatcher is not running; call start() first")
+        if self.overflow is OverflowPolicy.BLOCK:
+            await self._queue.put(event)
+            self._accepted()
+        else:
+            self.submit(event)
+
+    def _refill(self) -> int:
+        """Move spilled events into free queue slots."""
+        assert self._queue is not None
+        events = self._unspill(self.max_queue_size - self._queue.qsize())
+        for event in events:
+            self._queue.put_nowait(event)
+        return len(events)
+
+    async def _work(self) -> None:
+        """Process queued events until cancelled."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._queue.empty():
+                self._refill()
+            event = await self._queue.get()
+            error: Optional[BaseException] = None
+            try:
+                if inspect.iscoroutinefunction(self.handler):
+                    result = await self.handler(event)
+                else:
+                    result = await loop.run_in_executor(None, self.handler, event)
+                error = self._returned_error(result)
+            except Exception as e:
+                error = e
+            finally:
+                self._done(event, error)
+                self._queue.task_done()
+
+
+class ThreadedWebhookDispatcher(WebhookDispatcher):
+    """Dispatches webhook events to a pool of worker threads, for sync web servers.
+
+    Examples:
+        >>> dispatcher = ThreadedWebhookDispatcher(webhook_service.handle_webhook, workers=8, overflow="spill",
+        ...                                        spill_path="webhooks.spill")
+        >>> dispatcher.start()
+        >>> webhook_service.use_dispatcher(dispatcher)
+    """
+
+    def __init__(
+        self,
+        handler: WebhookHandler,
+        workers: int = DEFAULT_DISPATCH_WORKERS,
+        max_queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        spill_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        block_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize the dispatcher. See ``WebhookDispatcher`` for the other arguments.
+
+        Args:
+            block_timeout: With the ``block`` policy, seconds to wait for room before rejecting. None waits forever.
+        """
+        super().__init__(handler, workers, max_queue_size, overflow, spill_path)
+        self.block_timeout = block_timeout
+        self._queue: "queue.Queue[Optional[WebhookEvent]]" = queue.Queue(max_queue_size)
+        self._threads: List[threading.Thread] = []
+        self._refill_lock = threading.Lock()
+
+    def __enter__(self) -> "ThreadedWebhookDispatcher":
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.stop()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting in the queue."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        if self._threads:
+            return
+        self._threads = [threading.Thread(target=self._work, name=f"zenopay-webhook-{i}", daemon=True) for i in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, drain: bool = True) -> None:
+        """Stop the worker threads.
+
+        Args:
+            drain: Whether to process queued and spilled events before stopping.
+        """
+        if not self._threads:
+            return
+        if drain:
+            self._queue.join()
+            while self._refill():
+                self._queue.join()
+        else:
+            while True:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    break
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, event: WebhookEvent) -> None:
+        """Enqueue an event, waiting up to ``block_timeout`` for room with the ``block`` policy.
+
+        Args:
+            event: Parsed webhook event.
+
+        Raises:
+            ZenoPayWebhookQueueFullError: If the queue is full and the event is rejected.
+        """
+        try:
+            if self.overflow is OverflowPolicy.BLOCK:
+                self._queue.put(event, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(event)
+        except queue.Full:
+            self._overflowed(event)
+            return
+        self._accepted()
+
+    def _refill(self) -> int:
+        """Move spilled events into free queue slots, in the order they were spilled."""
+        with self._refill_lock:
+            events = self._unspill(self.max_queue_size - self._queue.qsize())
+            for moved, event in enumerate(events):
+                try:
+                    self._queue.put_nowait(event)
+                except queue.Full:
+                    # A submit took the slot first; the rest go back in front of the spill file.
+                    assert self.spill is not None
+                    self.spill.restore(events[moved:])
+                    return moved
+            return len(events)
+
+    def _work(self) -> None:
+        """Process queued events until a stop sentinel arrives."""
+        while True:
+            if self._queue.empty():
+                self._refill()
+            event = self._queue.get()
+            if event is None:
+                self._queue.task_done()
+                return
+            error: Optional[BaseException] = None
+            try:
+                error = self._returned_error(self.handler(event))
+            except Exception as e:
+                error = e
+            finally:
+                self._done(event, error)
+                self._queue.task_done()
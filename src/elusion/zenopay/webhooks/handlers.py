@@ -0,0 +1,159 @@
+"""Webhook handler registry supporting several sync and coroutine handlers per status."""
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from elusion.zenopay.models.webhook import WebhookEvent
+
+WebhookHandler = Callable[[WebhookEvent], Any]
+
+
+class HandlerRegistration:
+    """A registered handler and its concurrency limit."""
+
+    __slots__ = ("handler", "is_async", "max_concurrency", "_thread_limit", "_async_limit", "_async_limit_loop")
+
+    def __init__(self, handler: WebhookHandler, max_concurrency: Optional[int] = None) -> None:
+        """Initialize the registration.
+
+        Args:
+            handler: Sync function or coroutine function called with the webhook event.
+            max_concurrency: Maximum number of concurrent calls of this handler. None means unlimited.
+
+        Raises:
+            ValueError: If max_concurrency is lower than 1.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.handler = handler
+        self.is_async = inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(getattr(handler, "__call__", None))
+        self.max_concurrency = max_concurrency
+        self._thread_limit = threading.BoundedSemaphore(max_concurrency) if max_concurrency and not self.is_async else None
+        self._async_limit: Optional[asyncio.Semaphore] = None
+        self._async_limit_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def call(self, event: WebhookEvent) -> None:
+        """Call the handler from sync code.
+
+        Coroutine handlers run to completion on a temporary event loop.
+
+        Args:
+            event: Webhook event.
+
+        Raises:
+            RuntimeError: If the handler is a coroutine function and an event loop is
+                running in this thread. Use ``handle_webhook_async`` there instead.
+        """
+        if self.is_async:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self.call_async(event))
+                return
+            raise RuntimeError(
+                f"Coroutine handler {self.handler!r} cannot be called from sync code while an event loop is running; "
+                "use handle_webhook_async or process_webhook_request_async instead"
+            )
+
+        if self._thread_limit is None:
+            self.handler(event)
+            return
+        with self._thread_limit:
+            self.handler(event)
+
+    async def call_async(self, event: WebhookEvent, executor: Optional[Executor] = None) -> None:
+        """Call the handler from async code.
+
+        Coroutine handlers are awaited on the running loop; sync handlers run in ``executor``.
+
+        Args:
+            event: Webhook event.
+            executor: Executor for sync handlers. None uses the loop's default executor.
+        """
+        if not self.is_async:
+            await asyncio.get_running_loop().run_in_executor(executor, self.call, event)
+            return
+
+        limit = self._loop_limit()
+        if limit is None:
+            await self.handler(event)
+            return
+        async with limit:
+            await self.handler(event)
+
+    def _loop_limit(self) -> Optional[asyncio.Semaphore]:
+        """Semaphore limiting coroutine calls on the running loop."""
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._async_limit is None or self._async_limit_loop is not loop:
+            self._async_limit = asyncio.Semaphore(self.max_concurrency)
+            self._async_limit_loop = loop
+        return self._async_limit
+
+
+class HandlerRegistry:
+    """Handlers registered per payment status, called in registration order.
+
+    Lookups return immutable tuples and registration replaces them, so dispatch never
+    needs a lock even while handlers are added from another thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._handlers: Dict[str, Tuple[HandlerRegistration, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, event_type: object) -> bool:
+        """Check if any handler is registered for a status."""
+        return event_type in self._handlers
+
+    def add(self, event_type: str, handler: WebhookHandler, max_concurrency: Optional[int] = None) -> HandlerRegistration:
+        """Register a handler for a status.
+
+        Args:
+            event_type: Payment status to handle (e.g., "COMPLETED").
+            handler: Sync function or coroutine function called with the webhook event.
+            max_concurrency: Maximum number of concurrent calls of this handler (optional).
+
+        Returns:
+            The handler's registration.
+        """
+        registration = HandlerRegistration(handler, max_concurrency)
+        with self._lock:
+            self._handlers[event_type] = self._handlers.get(event_type, ()) + (registration,)
+        return registration
+
+    def remove(self, event_type: str, handler: WebhookHandler) -> bool:
+        """Unregister a handler.
+
+        Args:
+            event_type: Payment status the handler was registered for.
+            handler: Previously registered handler.
+
+        Returns:
+            True if the handler was registered.
+        """
+        with self._lock:
+            registrations = self._handlers.get(event_type, ())
+            remaining = tuple(registration for registration in registrations if registration.handler != handler)
+            if remaining:
+                self._handlers[event_type] = remaining
+            else:
+                self._handlers.pop(event_type, None)
+            return len(remaining) != len(registrations)
+
+    def get(self, event_type: str) -> Tuple[HandlerRegistration, ...]:
+        """Get the handlers registered for a status.
+
+        Args:
+            event_type: Payment status.
+
+        Returns:
+            Registrations in registration order.
+        """
+        return self._handlers.get(event_type, ())
@@ -0,0 +1,89 @@
+"""Streaming batch parsing of stored webhook payloads."""
+
+import logging
+import os
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Union
+
+from pydantic import ValidationError
+
+from elusion.zenopay.models.webhook import WebhookEvent, WebhookParseFailure, WebhookPayload
+
+logger = logging.getLogger(__name__)
+
+WebhookRecord = Union[str, bytes]
+
+
+def parse_webhook_record(record: WebhookRecord, timestamp: Optional[str] = None) -> WebhookEvent:
+    """Parse one raw webhook body without logging.
+
+    Validates the JSON text directly with pydantic-core instead of going through
+    ``json.loads`` and a dict.
+
+    Args:
+        record: Raw JSON body, as text or UTF-8 bytes.
+        timestamp: Timestamp to set on the event.
+
+    Returns:
+        Parsed WebhookEvent.
+
+    Raises:
+        ValidationError: If the record is not valid JSON or not a valid webhook payload.
+    """
+    payload = WebhookPayload.model_validate_json(record)
+    raw_data = record.decode("utf-8") if isinstance(record, bytes) else record
+    return WebhookEvent.model_construct(payload=payload, raw_data=raw_data, timestamp=timestamp, signature=None, log_position=None)
+
+
+class ParsedWebhooks:
+    """Lazily parsed webhook events from NDJSON records.
+
+    Records are parsed as the iterator is consumed, so memory stays flat however many
+    there are. Blank records are skipped. Records that fail to parse are collected in
+    ``errors`` instead of raised; ``errors`` and ``parsed`` are complete once iteration
+    has finished.
+
+    Examples:
+        >>> batch = webhook_service.parse_webhook_file("webhooks-2025-08-01.ndjson")
+        >>> for event in batch:
+        ...     webhook_service.handle_webhook(event)
+        >>> print(f"{batch.parsed} parsed, {len(batch.errors)} failed")
+    """
+
+    def __init__(self, records: Iterable[WebhookRecord], path: Optional[Union[str, "os.PathLike[str]"]] = None) -> None:
+        """Initialize the batch.
+
+        Args:
+            records: Raw webhook bodies, e.g. the lines of an NDJSON file.
+            path: NDJSON file to read instead of ``records``. Opened when iteration starts.
+        """
+        self.path = os.fspath(path) if path is not None else None
+        self.records = records
+        self.errors: List[WebhookParseFailure] = []
+        self.parsed = 0
+
+    def __iter__(self) -> Iterator[WebhookEvent]:
+        """Parse and yield events in input order."""
+        if self.path is None:
+            yield from self._parse(self.records)
+            return
+        with open(self.path, "rb") as f:
+            yield from self._parse(f)
+
+    def _parse(self, records: Iterable[WebhookRecord]) -> Iterator[WebhookEvent]:
+        """Parse records, collecting failures."""
+        timestamp = datetime.now().isoformat()
+        for line, record in enumerate(records, start=1):
+            try:
+                raw_data = (record.decode("utf-8") if isinstance(record, bytes) else record).rstrip("\r\n")
+                if not raw_data.strip():
+                    continue
+                event = parse_webhook_record(raw_data, timestamp)
+            except (ValidationError, UnicodeDecodeError) as e:
+                text = record.decode("utf-8", "replace") if isinstance(record, bytes) else record
+                self.errors.append(WebhookParseFailure(line=line, raw_data=text.rstrip("\r\n"), error=str(e)))
+                continue
+            self.parsed += 1
+            yield event
+
+        logger.info("Parsed %d webhooks in batch, %d failed", self.parsed, len(self.errors))
@@ -0,0 +1,69 @@
+"""HMAC signature verification of webhook bodies."""
+
+import hashlib
+import hmac
+from typing import Optional, Union
+
+SIGNATURE_PREFIX = "sha256="
+
+
+class WebhookSignatureVerifier:
+    """Verifies HMAC-SHA256 signatures of raw webhook bodies in constant time.
+
+    The keyed HMAC object is built once and copied for every body, so the key schedule
+    is not recomputed per request. Signatures are lowercase or uppercase hex digests,
+    optionally prefixed with ``sha256=``. A signature of the wrong length is rejected
+    before any hashing.
+
+    Examples:
+        >>> verifier = WebhookSignatureVerifier("whsec_...")
+        >>> verifier.verify(request_body, request.headers.get("x-zenopay-signature"))
+        True
+    """
+
+    def __init__(self, secret: Union[str, bytes]) -> None:
+        """Initialize the verifier.
+
+        Args:
+            secret: Shared webhook secret.
+
+        Raises:
+            ValueError: If the secret is empty.
+        """
+        if not secret:
+            raise ValueError("secret must not be empty")
+
+        key = secret.encode("utf-8") if isinstance(secret, str) else secret
+        self._hmac = hmac.new(key, digestmod=hashlib.sha256)
+        self._hex_length = self._hmac.digest_size * 2
+
+    def sign(self, body: Union[str, bytes]) -> str:
+        """Compute the signature of a body.
+
+        Args:
+            body: Raw webhook body.
+
+        Returns:
+            Hex HMAC-SHA256 digest of the body.
+        """
+        mac = self._hmac.copy()
+        mac.update(body.encode("utf-8") if isinstance(body, str) else body)
+        return mac.hexdigest()
+
+    def verify(self, body: Union[str, bytes], signature: Optional[str]) -> bool:
+        """Check a signature against a body.
+
+        Args:
+            body: Raw webhook body, exactly as received.
+            signature: Signature sent with the webhook.
+
+        Returns:
+            True if the signature matches the body.
+        """
+        if not signature:
+            return False
+        if signature.startswith(SIGNATURE_PREFIX):
+            signature = signature[len(SIGNATURE_PREFIX) :]
+        if len(signature) != self._hex_length:
+            return False
+        return hmac.compare_digest(self.sign(body).encode("ascii"), signature.lower().encode("utf-8"))
@@ -0,0 +1,388 @@
+"""Durable write-ahead log of received webhook payloads."""
+
+import collections
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Deque, Iterator, List, Set, Tuple, Union
+
+from elusion.zenopay.models.webhook import WebhookLogStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_SEGMENT_SIZE = 64 * 1024 * 1024
+DEFAULT_LOG_CHECKPOINT_INTERVAL = 1.0
+
+# Record header: payload length and CRC-32 of the payload, little-endian.
+_HEADER = struct.Struct("<II")
+_SEGMENT_SUFFIX = ".log"
+_CHECKPOINT = "checkpoint"
+
+
+def _segment_name(base: int) -> str:
+    """File name of the segment starting at log position ``base``."""
+    return f"{base:020d}{_SEGMENT_SUFFIX}"
+
+
+def _read_records(path: str, start: int = 0) -> Iterator[Tuple[int, int, bytes]]:
+    """Read the valid records of a segment file.
+
+    Stops at the first torn or corrupt record, which can only be the tail of the last
+    segment after a crash.
+
+    Args:
+        path: Segment file path.
+        start: Byte offset of the first record to read.
+
+    Yields:
+        Tuples of (record offset, next record offset, payload).
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        offset = start
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            length, crc = _HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return
+            end = offset + _HEADER.size + length
+            yield offset, end, payload
+            offset = end
+
+
+class WebhookLog:
+    """Segmented, CRC-framed append-only log of webhook payloads with group commit.
+
+    ``append`` writes a payload and returns once it is on disk, so a webhook can be
+    acknowledged without being lost if the process crashes before its handlers finish.
+    Appends from concurrent threads share fsyncs: while one fsync runs, later appends
+    queue up and the next fsync makes all of them durable at once, so the fsync cost per
+    webhook drops as the request rate grows.
+
+    Each entry is identified by its log position. ``mark_done`` records that an entry's
+    handlers have run; the checkpoint is the position of the oldest entry not yet done
+    and is persisted at most every ``checkpoint_interval`` seconds. ``mark_failed``
+    records that they failed: the entry no longer holds the checkpoint back, but its
+    position is persisted with the checkpoint and its segment is kept. Other segments
+    entirely before the checkpoint are deleted. After a restart, ``replay`` yields the
+    failed entries and the entries from the checkpoint on, so delivery to handlers is
+    at-least-once.
+
+    Examples:
+        >>> log = WebhookLog("/var/lib/myapp/webhooks")
+        >>> client.webhooks.use_log(log)
+        >>> client.webhooks.replay_log()  # Handle entries left over by a crash
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        segment_size: int = DEFAULT_LOG_SEGMENT_SIZE,
+        checkpoint_interval: float = DEFAULT_LOG_CHECKPOINT_INTERVAL,
+    ) -> None:
+        """Open or create a log, recovering from an earlier crash.
+
+        Args:
+            directory: Directory holding the segment and checkpoint files. Created if missing.
+            segment_size: Size in bytes after which a new segment file is started.
+            checkpoint_interval: Minimum seconds between checkpoint writes.
+
+        Raises:
+            ValueError: If segment_size is lower than 1.
+        """
+        if segment_size < 1:
+            raise ValueError("segment_size must be at least 1")
+
+        self.directory = os.fspath(directory)
+        self.segment_size = segment_size
+        self.checkpoint_interval = checkpoint_interval
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()  # Guards writes, the pending queue and the checkpoint
+        self._fsync_lock = threading.Lock()  # Held while fsyncing or closing a segment file
+        self._synced_cond = threading.Condition()
+        self._syncing = False
+        self._synced = 0
+        self._pending: Deque[int] = collections.deque()
+        self._done: Set[int] = set()
+        self._failed: Set[int] = set()
+        self._appended = 0
+        self._fsyncs = 0
+        self._last_checkpoint_write = 0.0
+
+        self._segments = self._list_segments()
+        self._checkpoint, failed = self._read_checkpoint()
+        if self._segments:
+            self._checkpoint = max(self._checkpoint, self._segments[0])
+        self._end = self._recover()
+        self._synced = self._end
+        self._recovered_end = self._end
+        self._recovered = sorted(set(self._unprocessed()).union(position for position in failed if position < self._end))
+        self._pending.extend(self._recovered)
+        if self._recovered:
+            # Failed entries are pending again, so the checkpoint waits for them until replayed.
+            self._checkpoint = min(self._checkpoint, self._recovered[0])
+        self._file = self._open_segment(self._segments[-1])
+
+    def __enter__(self) -> "WebhookLog":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    @property
+    def checkpoint(self) -> int:
+        """Position of the oldest entry whose handlers have not run, failed entries aside."""
+        return self._checkpoint
+
+    @property
+    def stats(self) -> WebhookLogStats:
+        """Snapshot of the log counters."""
+        with self._lock:
+            return WebhookLogStats(
+                appended=self._appended,
+                fsyncs=self._fsyncs,
+                pending=len(self._pending),
+                failed=len(self._failed),
+                segments=len(self._segments),
+                checkpoint=self._checkpoint,
+                end=self._end,
+            )
+
+    def append(self, raw_data: str) -> int:
+        """Append a payload and wait until it is durable.
+
+        Args:
+            raw_data: Raw webhook body.
+
+        Returns:
+            Log position of the entry, to pass to ``mark_done``.
+        """
+        payload = raw_data.encode("utf-8")
+        record = _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        with self._lock:
+            if self._end > self._segments[-1] and self._end - self._segments[-1] + len(record) > self.segment_size:
+                self._roll()
+            position = self._end
+            self._file.write(record)
+            self._end += len(record)
+            self._pending.append(position)
+            self._appended += 1
+
+        self._sync(position + len(record))
+        return position
+
+    def mark_done(self, position: int) -> None:
+        """Record that an entry's handlers have run.
+
+        Args:
+            position: Log position returned by ``append`` or ``replay``.
+        """
+        with self._lock:
+            if position in self._failed:
+                self._failed.discard(position)
+                self._maybe_write_checkpoint()
+            elif position >= self._checkpoint:
+                self._complete(position)
+
+    def mark_failed(self, position: int) -> None:
+        """Record that an entry's handlers failed, keeping it for the next ``replay``.
+
+        The entry stops holding back the checkpoint, so a failure does not keep every later
+        segment on disk. Passing the entry to ``mark_done`` later, e.g. after a successful
+        replay, forgets it.
+
+        Args:
+            position: Log position returned by ``append`` or ``replay``.
+        """
+        with self._lock:
+            if position in self._failed or position < self._checkpoint:
+                return
+            self._failed.add(position)
+            self._complete(position)
+
+    def replay(self) -> Iterator[Tuple[int, str]]:
+        """Iterate over the entries whose handlers had not run or had failed when the log was opened.
+
+        These entries are pending from the moment the log is opened, so the checkpoint does
+        not move past them until each one is passed to ``mark_done``.
+
+        Yields:
+            Tuples of (log position, raw webhook body).
+        """
+        with self._lock:
+            segments = self._segment_paths()
+        if self._recovered:
+            logger.info("Replaying %d webhook log entries from position %d", len(self._recovered), self._recovered[0])
+
+        wanted = set(self._recovered)
+        start = self._recovered[0] if self._recovered else self._recovered_end
+        for base, path in segments:
+            if start >= self._recovered_end:
+                return
+            if not os.path.exists(path) or base + os.path.getsize(path) <= start:
+                continue
+            for offset, end, payload in _read_records(path, max(start - base, 0)):
+                if base + offset >= self._recovered_end:
+                    return
+                if base + offset in wanted:
+                    yield base + offset, payload.decode("utf-8")
+                start = base + end
+
+    def close(self) -> None:
+        """Flush the log, persist the checkpoint and close the current segment."""
+        with self._lock:
+            with self._fsync_lock:
+                if not self._file.closed:
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                    self._file.close()
+            self._write_checkpoint()
+
+    def _sync(self, target: int) -> None:
+        """Wait until the log is durable up to ``target``, fsyncing for a group of writers.
+
+        The first waiter becomes the leader and fsyncs everything written so far, including
+        records appended by threads that queued up during the previous fsync.
+        """
+        with self._synced_cond:
+            while self._synced < target:
+                if not self._syncing:
+                    self._syncing = True
+                    break
+                self._synced_cond.wait()
+            else:
+                return
+
+        written = 0
+        try:
+            with self._lock:
+                self._file.flush()
+                file = self._file
+                written = self._end
+            with self._fsync_lock:
+                synced = not file.closed  # A closed segment was fsynced when it was rolled
+                if synced:
+                    os.fsync(file.fileno())
+            if synced:
+                with self._lock:
+                    self._fsyncs += 1
+        finally:
+            with self._synced_cond:
+                self._syncing = False
+                self._synced = max(self._synced, written)
+                self._synced_cond.notify_all()
+
+    def _complete(self, position: int) -> None:
+        """Stop waiting for a pending entry and advance the checkpoint. Caller holds the lock."""
+        self._done.add(position)
+        advanced = False
+        while self._pending and self._pending[0] in self._done:
+            self._done.discard(self._pending.popleft())
+            advanced = True
+        if advanced:
+            self._checkpoint = self._pending[0] if self._pending else self._end
+            self._maybe_write_checkpoint()
+
+    def _roll(self) -> None:
+        """Make the current segment durable and start a new one. Caller holds the lock."""
+        with self._fsync_lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._fsyncs += 1
+            self._file.close()
+        self._segments.append(self._end)
+        self._file = self._open_segment(self._end)
+        self._fsync_directory()
+
+    def _open_segment(self, base: int) -> Any:
+        """Open a segment file for appending."""
+        return open(os.path.join(self.directory, _segment_name(base)), "ab")
+
+    def _list_segments(self) -> List[int]:
+        """Base positions of the segment files on disk, oldest first."""
+        bases = sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(_SEGMENT_SUFFIX) and name[: -len(_SEGMENT_SUFFIX)].isdigit()
+        )
+        return bases or [0]
+
+    def _segment_paths(self) -> List[Tuple[int, str]]:
+        """Base positions and paths of the segment files, oldest first."""
+        return [(base, os.path.join(self.directory, _segment_name(base))) for base in self._segments]
+
+    def _recover(self) -> int:
+        """Truncate a torn record at the tail of the last segment and return the log end."""
+        base, path = self._segment_paths()[-1]
+        if not os.path.exists(path):
+            return base
+
+        valid_end = 0
+        for _, end, _ in _read_records(path):
+            valid_end = end
+        if valid_end < os.path.getsize(path):
+            logger.warning("Truncating torn webhook log record in %s at offset %d", path, valid_end)
+            with open(path, "r+b") as f:
+                f.truncate(valid_end)
+                os.fsync(f.fileno())
+        return base + valid_end
+
+    def _unprocessed(self) -> List[int]:
+        """Positions of the entries from the checkpoint to the end of the log."""
+        positions: List[int] = []
+        for base, path in self._segment_paths():
+            if not os.path.exists(path) or base + os.path.getsize(path) <= self._checkpoint:
+                continue
+            positions.extend(base + offset for offset, _, _ in _read_records(path, max(self._checkpoint - base, 0)))
+        return positions
+
+    def _read_checkpoint(self) -> Tuple[int, List[int]]:
+        """Read the persisted checkpoint, 0 if there is none, and the positions of failed entries."""
+        try:
+            with open(os.path.join(self.directory, _CHECKPOINT), "r", encoding="utf-8") as f:
+                lines = f.read().split()
+            return (int(lines[0]) if lines else 0), [int(line) for line in lines[1:]]
+        except (FileNotFoundError, ValueError):
+            return 0, []
+
+    def _maybe_write_checkpoint(self) -> None:
+        """Persist the checkpoint unless it was written less than ``checkpoint_interval`` ago. Caller holds the lock."""
+        if time.monotonic() - self._last_checkpoint_write >= self.checkpoint_interval:
+            self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        """Persist the checkpoint and failed entries, and delete the segments no longer needed. Caller holds the lock."""
+        path = os.path.join(self.directory, _CHECKPOINT)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write("\n".join(str(position) for position in [self._checkpoint, *sorted(self._failed)]))
+        os.replace(path + ".tmp", path)
+        self._last_checkpoint_write = time.monotonic()
+
+        # A segment can go once it ends before the checkpoint and holds no failed entry.
+        kept: List[int] = []
+        for base, end in zip(self._segments, self._segments[1:]):
+            if end <= self._checkpoint and not any(base <= position < end for position in self._failed):
+                os.remove(os.path.join(self.directory, _segment_name(base)))
+            else:
+                kept.append(base)
+        self._segments = kept + self._segments[-1:]
+
+    def _fsync_directory(self) -> None:
+        """Make a new segment file's directory entry durable, where the platform allows it."""
+        if os.name != "posix":
+            return
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -190,6 +190,48 @@ class OrderFixtures:
         }
 
 
+def order_status_data(order_id: str, payment_status: str = "PENDING") -> Dict[str, Any]:
+    """Mock order status API response for a single order."""
+    return {
+        "reference": "0936183435",
+        "resultcode": "000",
+        "result": "SUCCESS",
+        "message": "Order fetch successful",
+        "data": [
+            {
+                "order_id": order_id,
+                "creation_date": "2025-05-19 08:40:33",
+                "amount": "1000",
+                "payment_status": payment_status,
+                "transid": "CEJ3I3SETSN",
+                "channel": "MPESA-TZ",
+                "reference": "0936183435",
+                "msisdn": "255744963858",
+            }
+        ],
+    }
+
+
+def disbursement_data(transid: str, amount: int = 3000, fee: int = 1500) -> Dict[str, Any]:
+    """Mock disbursement API response for a single payout."""
+    return {
+        "status": "success",
+        "message": "Wallet Cashin processed successfully.",
+        "fee": fee,
+        "amount_sent_to_customer": amount,
+        "total_deducted": amount + fee,
+        "new_balance": "62984034.00",
+        "zenopay_response": {
+            "reference": "0949694808",
+            "transid": transid,
+            "resultcode": "000",
+            "result": "SUCCESS",
+            "message": "Wallet Cashin processed successfully.",
+            "data": [],
+        },
+    }
+
+
 class MockHandlers:
     """Mock handler functions for testing."""
 
@@ -0,0 +1,754 @@
+"""Tests for ZenoPay HTTPClient."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.exceptions import (
+    ZenoPayCircuitOpenError,
+    ZenoPayError,
+    ZenoPayNetworkError,
+    ZenoPayRateLimitError,
+    ZenoPayServerError,
+    ZenoPayValidationError,
+)
+from elusion.zenopay.http import CircuitBreaker, HTTPClient, MetricsRegistry, RateLimiter, RequestTiming, RetryPolicy, TokenBucket
+from elusion.zenopay.http.metrics import MAX_TRACKED_MICROS, bucket_index, bucket_upper_bound
+from elusion.zenopay.http.pipeline import PreparedRequest, Sleep, drive_sync
+
+BASE_URL = "https://zenoapi.test"
+STATUS_URL = f"{BASE_URL}/api/payments/order-status"
+DISBURSE_URL = f"{BASE_URL}/api/payments/walletcashin/process/"
+
+
+def make_client(**config_kwargs) -> HTTPClient:
+    """Create an HTTP client with fast retries."""
+    config_kwargs.setdefault("retry_delay", 0.001)
+    return HTTPClient(ZenoPayConfig(api_key="test_api_key", base_url=BASE_URL, **config_kwargs))
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy classification and backoff."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.policy = RetryPolicy(max_retries=3, retry_delay=1.0, retry_max_delay=4.0)
+
+    def test_rate_limit_is_always_retryable(self):
+        """Test 429 errors are retried even for non-idempotent requests."""
+        assert self.policy.is_retryable(ZenoPayRateLimitError(), idempotent=False)
+
+    def test_server_error_requires_idempotency(self):
+        """Test 5xx errors are only retried for idempotent requests."""
+        assert self.policy.is_retryable(ZenoPayServerError(), idempotent=True)
+        assert not self.policy.is_retryable(ZenoPayServerError(), idempotent=False)
+
+    def test_validation_error_is_never_retryable(self):
+        """Test 4xx validation errors are never retried."""
+        assert not self.policy.is_retryable(ZenoPayValidationError("bad"), idempotent=True)
+
+    def test_connect_error_is_retryable_for_post(self):
+        """Test errors raised before the request was sent are retried for POST."""
+        error = ZenoPayNetworkError("refused", httpx.ConnectError("refused"))
+        assert self.policy.is_retryable(error, idempotent=False)
+
+        error = ZenoPayNetworkError("reset", httpx.ReadError("reset"))
+        assert not self.policy.is_retryable(error, idempotent=False)
+
+    def test_delay_is_capped_and_respects_retry_after(self):
+        """Test backoff stays within bounds and honours retry_after."""
+        for attempt in range(6):
+            assert 0 < self.policy.get_delay(ZenoPayServerError(), attempt) <= 4.0
+
+        assert self.policy.get_delay(ZenoPayRateLimitError(retry_after=10), 0) >= 10
+
+    def test_zero_max_retries_disables_retries(self):
+        """Test max_retries=0 is honoured by the configuration."""
+        config = ZenoPayConfig(api_key="test_api_key", max_retries=0)
+        assert RetryPolicy.from_config(config).max_retries == 0
+
+
+class TestHTTPClientRetries:
+    """Test HTTPClient retry behaviour."""
+
+    @respx.mock
+    def test_get_retries_server_errors(self):
+        """Test an idempotent GET is retried after 5xx responses."""
+        route = respx.get(STATUS_URL).mock(side_effect=[httpx.Response(503), httpx.Response(502), httpx.Response(200, json={"ok": True})])
+
+        with make_client() as client:
+            assert client.get_sync(STATUS_URL) == {"ok": True}
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_retries_stop_at_max_retries(self):
+        """Test the last error is raised once retries are exhausted."""
+        route = respx.get(STATUS_URL).mock(return_value=httpx.Response(500))
+
+        with make_client(max_retries=2) as client:
+            with pytest.raises(ZenoPayServerError):
+                client.get_sync(STATUS_URL)
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_validation_errors_are_not_retried(self):
+        """Test 4xx responses raise immediately with the API error type."""
+        route = respx.get(STATUS_URL).mock(return_value=httpx.Response(400, json={"message": "bad order"}))
+
+        with make_client() as client:
+            with pytest.raises(ZenoPayValidationError, match="bad order"):
+                client.get_sync(STATUS_URL)
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_post_is_not_retried_after_server_error(self):
+        """Test a disbursement POST is never resent after an ambiguous 5xx."""
+        route = respx.post(DISBURSE_URL).mock(return_value=httpx.Response(502))
+
+        with make_client() as client:
+            with pytest.raises(ZenoPayServerError):
+                client.post_sync(DISBURSE_URL, json={"transid": "tx-1"})
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_post_is_retried_after_rate_limit(self):
+        """Test a POST rejected with 429 is retried using the Retry-After header."""
+        route = respx.post(DISBURSE_URL).mock(
+            side_effect=[httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json={"status": "success"})]
+        )
+
+        with make_client() as client:
+            assert client.post_sync(DISBURSE_URL, json={"transid": "tx-1"}) == {"status": "success"}
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_post_is_retried_after_connect_error(self):
+        """Test a POST that never reached the server is retried."""
+        route = respx.post(DISBURSE_URL).mock(side_effect=[httpx.ConnectError("refused"), httpx.Response(200, json={"ok": True})])
+
+        with make_client() as client:
+            assert client.post_sync(DISBURSE_URL, json={"transid": "tx-1"}) == {"ok": True}
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_get_retries_network_errors(self):
+        """Test the async client retries read errors on idempotent requests."""
+        route = respx.get(STATUS_URL).mock(side_effect=[httpx.ReadError("reset"), httpx.Response(200, json={"ok": True})])
+
+        async with make_client() as client:
+            assert await client.get(STATUS_URL) == {"ok": True}
+        assert route.call_count == 2
+
+
+class TestHTTPClientPool:
+    """Test connection pool configuration."""
+
+    def test_pool_limits_from_config(self):
+        """Test pool limits and keep-alive expiry come from the configuration."""
+        client = make_client(max_connections=200, max_keepalive_connections=50, keepalive_expiry=15.0)
+
+        limits = client._build_limits()
+        assert limits.max_connections == 200
+        assert limits.max_keepalive_connections == 50
+        assert limits.keepalive_expiry == 15.0
+
+    def test_per_phase_timeouts_applied_to_sync_client(self):
+        """Test per-phase timeouts fall back to the overall timeout."""
+        client = make_client(timeout=10.0, connect_timeout=2.0, pool_timeout=1.0)
+
+        with client:
+            assert client._sync_client is not None
+            timeout = client._sync_client.timeout
+        assert timeout.connect == 2.0
+        assert timeout.read == 10.0
+        assert timeout.write == 10.0
+        assert timeout.pool == 1.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_warm_connections_on_enter(self):
+        """Test entering the async context pre-warms the configured connections."""
+        route = respx.head(BASE_URL).mock(return_value=httpx.Response(200))
+
+        async with make_client(warm_connections=4):
+            pass
+        assert route.call_count == 4
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_warm_up_ignores_failures(self):
+        """Test warm-up is best effort."""
+        respx.head(BASE_URL).mock(side_effect=httpx.ConnectError("refused"))
+
+        async with make_client() as client:
+            assert await client.warm_up(3) == 0
+
+    def test_http2_option(self):
+        """Test HTTP/2 is passed through to the httpx clients."""
+        assert make_client()._client_options()["http2"] is False
+        assert make_client(http2=True)._client_options()["http2"] is True
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """Test a clear error is raised when HTTP/2 is enabled without h2 installed."""
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+        with pytest.raises(ImportError, match="zenopay-sdk\\[http2\\]"):
+            make_client(http2=True)._client_options()
+
+
+class TestRequestBuilding:
+    """Test request headers and body serialization."""
+
+    @respx.mock
+    def test_default_headers_sent_once_and_extra_headers_merged(self):
+        """Test client headers are used and per-request headers are merged over them."""
+        route = respx.get(STATUS_URL).mock(return_value=httpx.Response(200, json={}))
+
+        with make_client() as client:
+            client.get_sync(STATUS_URL, headers={"X-Request-Id": "abc"})
+
+        request = route.calls.last.request
+        assert request.headers["x-api-key"] == "test_api_key"
+        assert request.headers["x-request-id"] == "abc"
+
+    def test_clean_params_does_not_copy_string_params(self):
+        """Test already-clean params are passed through without a copy."""
+        client = make_client()
+        params = {"order_id": "abc"}
+
+        assert client._clean_params(params) is params
+        assert client._clean_params({"order_id": "abc", "page": 2, "skip": None}) == {"order_id": "abc", "page": "2"}
+
+    @respx.mock
+    def test_order_model_serialized_to_json_body(self):
+        """Test validated models are sent as a JSON body of only the fields that were set."""
+        from elusion.zenopay.models.order import NewOrder
+        from elusion.zenopay.services import OrderService
+
+        route = respx.post(f"{BASE_URL}/api/payments/mobile_money_tanzania").mock(
+            return_value=httpx.Response(200, json={"status": "success", "message": "ok", "resultcode": "000", "order_id": "o-1"})
+        )
+        client = make_client()
+        orders = OrderService(client, client.config)
+        order = NewOrder(order_id="o-1", buyer_email="Test@Example.com", buyer_name="Test", buyer_phone="0700000000", amount=1000)
+
+        with client:
+            orders.sync.create(order)
+
+        request = route.calls.last.request
+        assert request.headers["content-type"] == "application/json"
+        assert json.loads(request.content) == {
+            "order_id": "o-1",
+            "buyer_email": "test@example.com",
+            "buyer_name": "Test",
+            "buyer_phone": "0700000000",
+            "amount": 1000,
+        }
+
+
+class TestRequestPipeline:
+    """Test the transport-agnostic request pipeline shared by both modes."""
+
+    def test_exchange_yields_sends_and_backoffs(self):
+        """Test the retry pipeline is driven step by step without any transport."""
+        client = make_client()
+        pipeline = client.exchange(client.prepare("GET", STATUS_URL, params={"order_id": "o-1", "page": 2}))
+
+        request = next(pipeline)
+        assert isinstance(request, PreparedRequest)
+        assert request.idempotent and request.params == {"order_id": "o-1", "page": "2"}
+
+        assert isinstance(pipeline.send(httpx.Response(503, request=httpx.Request("GET", STATUS_URL))), Sleep)
+        assert next(pipeline) is request
+        assert isinstance(pipeline.throw(httpx.ReadError("reset")), Sleep)
+        assert next(pipeline) is request
+
+        ok = httpx.Response(200, json={"ok": True})
+        with pytest.raises(StopIteration) as stop:
+            pipeline.send(ok)
+        assert stop.value.value is ok
+
+    def test_drivers_compose_pipelines(self):
+        """Test pipelines compose with ``yield from`` and errors from the transport are mapped."""
+        client = make_client(max_retries=0)
+
+        def status_code():
+            response = yield from client.exchange(client.prepare("POST", DISBURSE_URL))
+            return response.status_code
+
+        assert drive_sync(status_code(), lambda request: httpx.Response(201)) == 201
+
+        def refuse(request):
+            raise httpx.ConnectError("refused")
+
+        with pytest.raises(ZenoPayNetworkError, match="refused"):
+            drive_sync(status_code(), refuse)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_and_sync_behave_the_same(self):
+        """Test both drivers retry, classify and decode identically."""
+        route = respx.get(STATUS_URL).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"ok": True}), httpx.Response(503), httpx.Response(200, json={"ok": True})]
+        )
+
+        client = make_client()
+        async with client:
+            async_result = await client.get(STATUS_URL)
+        with client:
+            sync_result = client.get_sync(STATUS_URL)
+
+        assert async_result == sync_result == {"ok": True}
+        assert route.call_count == 4
+
+
+class TestRequestHooks:
+    """Test request lifecycle hooks."""
+
+    @respx.mock
+    def test_hooks_receive_endpoint_sizes_and_timings(self):
+        """Test hooks see every attempt with its endpoint, status, sizes and timings."""
+        respx.get(STATUS_URL).mock(side_effect=[httpx.Response(503), httpx.Response(200, json={"ok": True})])
+        calls = []
+        client = make_client()
+        client.on_request(lambda event: calls.append(("request", event.endpoint, event.attempt)))
+        client.on_response(lambda event: calls.append(("response", event.status_code, event.bytes_received, event.timing.total > 0)))
+        client.on_error(lambda event: calls.append(("error", type(event.error).__name__)))
+        client.on_retry(lambda event: calls.append(("retry", event.retry_delay is not None)))
+
+        with client:
+            client.get_sync(STATUS_URL)
+
+        assert calls == [
+            ("request", "order_status", 0),
+            ("response", 503, 0, True),
+            ("error", "ZenoPayServerError"),
+            ("retry", True),
+            ("request", "order_status", 1),
+            ("response", 200, len(b'{"ok":true}'), True),
+        ]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_hooks_and_bytes_sent(self):
+        """Test the async client calls the same hooks and reports the request body size."""
+        respx.post(DISBURSE_URL).mock(return_value=httpx.Response(200, json={}))
+        events = []
+        client = make_client()
+        client.on_response(events.append)
+
+        async with client:
+            await client.post(DISBURSE_URL, content=b'{"transid":"tx-1"}')
+
+        assert [(event.endpoint, event.bytes_sent) for event in events] == [("disbursement", 18)]
+
+    @respx.mock
+    def test_failing_hook_does_not_fail_request(self, caplog):
+        """Test an exception in a hook is logged and the request still succeeds."""
+        respx.get(STATUS_URL).mock(return_value=httpx.Response(200, json={"ok": True}))
+        client = make_client()
+
+        @client.on_request
+        def broken(event):
+            raise RuntimeError("boom")
+
+        with client:
+            assert client.get_sync(STATUS_URL) == {"ok": True}
+        assert "boom" in caplog.text
+
+        assert client.remove_hook(broken)
+        assert not client.hooks
+
+    @respx.mock
+    def test_no_trace_without_hooks(self):
+        """Test requests carry no trace extension or timing work while no hook is registered."""
+        route = respx.get(STATUS_URL).mock(return_value=httpx.Response(200, json={}))
+        client = make_client()
+
+        with client:
+            client.get_sync(STATUS_URL)
+            assert "trace" not in route.calls.last.request.extensions
+
+            client.on_response(lambda event: None)
+            client.get_sync(STATUS_URL)
+            assert "trace" in route.calls.last.request.extensions
+
+    def test_timing_from_trace_events(self):
+        """Test connect and first-byte times are taken from httpcore trace events."""
+        timing = RequestTiming()
+        timing.trace("connection.connect_tcp.started", {})
+        timing.trace("connection.start_tls.complete", {})
+        timing.trace("http11.send_request_headers.started", {})
+        timing.trace("http11.receive_response_headers.complete", {})
+        timing.finish()
+
+        assert 0 < timing.pool_wait
+        assert 0 < timing.connect <= timing.ttfb <= timing.total
+        assert timing.epoch_ns(timing.total) > timing.started_ns
+
+
+class TestRequestMetrics:
+    """Test the per-endpoint metrics registry."""
+
+    @respx.mock
+    def test_calls_errors_retries_and_latency_per_endpoint(self):
+        """Test calls are counted per endpoint with errors by exception class."""
+        respx.get(STATUS_URL).mock(side_effect=[httpx.Response(503), httpx.Response(200, json={}), httpx.Response(404, json={})])
+        respx.post(DISBURSE_URL).mock(return_value=httpx.Response(502))
+        client = make_client()
+        in_flight = []
+        client.on_request(lambda event: in_flight.append(client.metrics.snapshot()[event.endpoint]["in_flight"]))
+
+        with client:
+            client.get_sync(STATUS_URL)
+            with pytest.raises(ZenoPayError):
+                client.get_sync(STATUS_URL)
+            with pytest.raises(ZenoPayServerError):
+                client.post_sync(DISBURSE_URL)
+
+        snapshot = client.metrics.snapshot()
+        assert in_flight == [1, 1, 1, 1]
+        assert snapshot["order_status"]["calls"] == 2
+        assert snapshot["order_status"]["retries"] == 1
+        assert snapshot["order_status"]["errors"] == {"ZenoPayNotFoundError": 1}
+        assert snapshot["order_status"]["in_flight"] == 0
+        assert snapshot["order_status"]["latency"]["count"] == 2
+        assert 0 < snapshot["order_status"]["latency"]["p50"] <= snapshot["order_status"]["latency"]["max"]
+        assert snapshot["disbursement"]["errors"] == {"ZenoPayServerError": 1}
+
+    def test_threads_record_into_merged_shards(self):
+        """Test counts recorded from many threads are merged without loss."""
+        registry = MetricsRegistry()
+
+        def record():
+            for _ in range(1000):
+                shard = registry.shard("checkout")
+                shard.started += 1
+                shard.record(0.002)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = registry.snapshot()["checkout"]
+        assert snapshot["calls"] == 8000
+        assert snapshot["in_flight"] == 0
+        assert 0.002 <= snapshot["latency"]["p99"] <= 0.002 * 1.125
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cancelled_request_is_settled_before_cancellation_propagates(self):
+        """Test a cancelled run settles in-flight and cancelled counts even if the pipeline is still referenced."""
+
+        async def respond(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={})
+
+        respx.get(STATUS_URL).mock(side_effect=respond)
+        client = make_client()
+
+        async with client:
+            pipeline = client.exchange(client.prepare("GET", STATUS_URL))
+            task = asyncio.ensure_future(client.run(pipeline))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            snapshot = client.metrics.snapshot()["order_status"]
+            assert snapshot["in_flight"] == 0
+            assert pipeline.gi_frame is None
+
+    def test_exited_threads_are_folded_into_one_shard(self):
+        """Test shards of exited threads are folded together instead of accumulating."""
+        registry = MetricsRegistry()
+        registry.shard("checkout").record(0.001)
+
+        def record():
+            shard = registry.shard("checkout")
+            shard.started += 1
+            shard.record(0.002, ZenoPayNetworkError("reset"))
+
+        for _ in range(50):
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join()
+
+        snapshot = registry.snapshot()["checkout"]
+        assert len(registry._shards["checkout"]) == 2
+        assert snapshot["calls"] == 51
+        assert snapshot["errors"] == {"ZenoPayNetworkError": 50}
+        assert snapshot["latency"]["count"] == 51
+
+    def test_histogram_resolution(self):
+        """Test every latency lands in a bucket whose upper bound is within 12.5%."""
+        for micros in (0, 1, 15, 16, 17, 100, 999, 4096, 123456, 10**7, MAX_TRACKED_MICROS):
+            upper = bucket_upper_bound(bucket_index(micros))
+            assert micros <= upper <= max(micros * 1.125, micros + 1)
+
+    def test_prometheus_export(self):
+        """Test the Prometheus text format with cumulative histogram buckets."""
+        registry = MetricsRegistry()
+        shard = registry.shard("create_order")
+        for elapsed in (0.003, 0.02, 0.2):
+            shard.started += 1
+            shard.record(elapsed)
+        shard.started += 1
+        shard.record(0.5, ZenoPayNetworkError("reset"))
+
+        text = registry.to_prometheus()
+
+        assert "# TYPE zenopay_request_duration_seconds histogram" in text
+        assert 'zenopay_requests_total{endpoint="create_order"} 4' in text
+        assert 'zenopay_request_errors_total{endpoint="create_order",error="ZenoPayNetworkError"} 1' in text
+        assert 'zenopay_request_duration_seconds_bucket{endpoint="create_order",le="0.005"} 1' in text
+        assert 'zenopay_request_duration_seconds_bucket{endpoint="create_order",le="0.25"} 3' in text
+        assert 'zenopay_request_duration_seconds_bucket{endpoint="create_order",le="+Inf"} 4' in text
+        assert text.endswith("\n")
+
+    def test_metrics_can_be_disabled(self):
+        """Test ZenoPayConfig(metrics=False) removes the registry."""
+        assert make_client(metrics=False).metrics is None
+
+
+class TestRateLimiter:
+    """Test client-side rate limiting with adaptive token buckets."""
+
+    def test_bucket_allows_burst_then_paces(self):
+        """Test a full bucket sends its burst back to back, then waits for refills."""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert 0.05 < bucket.acquire() <= 0.1
+
+    def test_rate_adapts_to_rate_limit_responses(self):
+        """Test a 429 halves the rate once per cooldown and successes recover it up to max_rate."""
+        bucket = TokenBucket(rate=8, burst=8, max_rate=9)
+
+        bucket.on_rate_limited(0.5)
+        bucket.on_rate_limited(0.5)
+        assert bucket.rate == 4
+        assert bucket.throttled == 2
+        assert 0.4 < bucket.acquire() <= 0.5
+
+        for _ in range(100):
+            bucket.on_success()
+        assert bucket.rate == 9
+
+    def test_exchange_waits_for_a_token_before_each_attempt(self):
+        """Test the pipeline sleeps while the endpoint's bucket is empty, without sending."""
+        client = make_client(rate_limit=10, rate_limit_burst=1)
+        assert next(client.exchange(client.prepare("GET", STATUS_URL))).url == STATUS_URL
+
+        pipeline = client.exchange(client.prepare("GET", STATUS_URL))
+        step = next(pipeline)
+        assert isinstance(step, Sleep) and 0 < step.delay <= 0.1
+
+        other = next(client.exchange(client.prepare("POST", DISBURSE_URL)))
+        assert isinstance(other, PreparedRequest)
+
+    @respx.mock
+    def test_rate_limit_response_slows_the_shared_bucket(self):
+        """Test a 429 seen through one service slows the endpoint's bucket for all of them."""
+        respx.post(DISBURSE_URL).mock(
+            side_effect=[httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json={"status": "success"})]
+        )
+        client = make_client(rate_limit=100, rate_limit_max=200)
+
+        with client:
+            client.post_sync(DISBURSE_URL, json={"transid": "tx-1"})
+
+        snapshot = client.rate_limiter.snapshot()
+        assert snapshot["disbursement"]["throttled"] == 1
+        assert 50 < snapshot["disbursement"]["rate"] < 100
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_requests_are_paced(self):
+        """Test async requests beyond the burst are spread out at the configured rate."""
+        respx.get(STATUS_URL).mock(return_value=httpx.Response(200, json={}))
+        client = make_client(rate_limit=50, rate_limit_burst=1)
+
+        started = time.monotonic()
+        async with client:
+            await asyncio.gather(*(client.get(STATUS_URL) for _ in range(4)))
+
+        assert time.monotonic() - started >= 0.05
+
+    def test_rate_limiting_is_off_by_default(self):
+        """Test no limiter is created unless rate_limit is configured."""
+        client = make_client()
+        assert client.rate_limiter is None
+        client.use_rate_limiter(RateLimiter(rate=5))
+        assert client.rate_limiter.bucket(None) is client.rate_limiter.bucket("other")
+
+
+class TestCircuitBreaker:
+    """Test per-endpoint circuit breaking."""
+
+    @respx.mock
+    def test_circuit_opens_and_fails_fast(self):
+        """Test an endpoint failing past the threshold stops being called while other endpoints still are."""
+        status = respx.get(STATUS_URL).mock(return_value=httpx.Response(503))
+        disburse = respx.post(DISBURSE_URL).mock(return_value=httpx.Response(200, json={}))
+        client = make_client(max_retries=0, circuit_breaker_failure_rate=0.5, circuit_breaker_min_calls=2)
+        events = []
+        client.on_circuit_change(events.append)
+
+        with client:
+            for _ in range(2):
+                with pytest.raises(ZenoPayServerError):
+                    client.get_sync(STATUS_URL)
+            with pytest.raises(ZenoPayCircuitOpenError) as error:
+                client.get_sync(STATUS_URL)
+            client.post_sync(DISBURSE_URL)
+
+        assert status.call_count == 2 and disburse.call_count == 1
+        assert error.value.endpoint == "order_status" and 0 < error.value.retry_after <= 30
+        assert [(event.endpoint, event.previous, event.state, event.failure_rate) for event in events] == [("order_status", "closed", "open", 1.0)]
+        assert client.circuit_breaker.snapshot()["disbursement"]["state"] == "closed"
+        assert client.metrics.snapshot()["order_status"]["errors"]["ZenoPayCircuitOpenError"] == 1
+
+    def test_half_open_lets_one_probe_through(self):
+        """Test an open circuit half-opens after the reset timeout and closes after a successful probe."""
+        breaker = CircuitBreaker(failure_rate=0.5, min_calls=1, window=4, reset_timeout=0.01)
+        states = []
+        breaker.on_state_change(lambda event: states.append(event.state))
+        circuit = breaker.circuit("checkout")
+
+        circuit.record(True, circuit.allow())
+        with pytest.raises(ZenoPayCircuitOpenError):
+            circuit.allow()
+        time.sleep(0.02)
+        probe = circuit.allow()
+        with pytest.raises(ZenoPayCircuitOpenError, match="probe in flight"):
+            circuit.allow()
+        circuit.record(False, probe)
+        circuit.allow()
+
+        assert states == ["open", "half_open", "closed"]
+        assert breaker.snapshot()["checkout"] == {"state": "closed", "failure_rate": 0.0, "calls": 0}
+
+    def test_outcomes_of_earlier_generations_are_ignored(self):
+        """Test attempts admitted before the circuit opened, or superseded probes, do not move it."""
+        breaker = CircuitBreaker(failure_rate=0.5, min_calls=1, window=4, reset_timeout=0.01)
+        states = []
+        breaker.on_state_change(lambda event: states.append(event.state))
+        circuit = breaker.circuit("checkout")
+
+        slow = circuit.allow()
+        circuit.record(True, circuit.allow())
+        time.sleep(0.02)
+        abandoned = circuit.allow()
+        circuit.record(False, slow)
+        time.sleep(0.02)
+        probe = circuit.allow()
+        circuit.record(False, abandoned)
+        assert circuit.state == "half_open"
+
+        circuit.record(True, probe)
+        circuit.record(False, probe)
+        assert states == ["open", "half_open", "open"]
+        assert circuit.state == "open"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_client_errors_do_not_open_the_circuit(self):
+        """Test 4xx responses count as successes, on the async path too."""
+        route = respx.get(STATUS_URL).mock(side_effect=[httpx.Response(404, json={})] * 3 + [httpx.Response(504)] * 3)
+        client = make_client(max_retries=0, circuit_breaker_failure_rate=0.5, circuit_breaker_min_calls=4)
+
+        async with client:
+            for _ in range(3):
+                with pytest.raises(ZenoPayError):
+                    await client.get(STATUS_URL)
+            for _ in range(2):
+                with pytest.raises(ZenoPayServerError):
+                    await client.get(STATUS_URL)
+            assert client.circuit_breaker.snapshot()["order_status"]["state"] == "closed"
+            with pytest.raises(ZenoPayServerError):
+                await client.get(STATUS_URL)
+            with pytest.raises(ZenoPayCircuitOpenError):
+                await client.get(STATUS_URL)
+
+        assert route.call_count == 6
+
+    def test_circuit_breaking_is_off_by_default(self):
+        """Test no breaker is created unless a failure rate is configured."""
+        client = make_client()
+        assert client.circuit_breaker is None
+        with pytest.raises(ValueError):
+            client.on_circuit_change(print)
+
+
+class TestRequestCoalescing:
+    """Test coalescing of identical in-flight GET requests."""
+
+    @respx.mock
+    def test_sync_threads_share_one_request(self):
+        """Test concurrent identical GETs from many threads send a single upstream request."""
+        client = make_client(coalesce_requests=True)
+
+        def respond(request):
+            deadline = time.monotonic() + 2
+            while client.coalescer.coalesced < 7 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            return httpx.Response(200, json={"order_id": "o-1"})
+
+        route = respx.get(STATUS_URL).mock(side_effect=respond)
+        results = []
+        with client:
+            threads = [threading.Thread(target=lambda: results.append(client.get_sync(STATUS_URL, params={"order_id": "o-1"}))) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert route.call_count == 1
+        assert results == [{"order_id": "o-1"}] * 8
+        assert client.coalescer.in_flight == 0
+        assert client.metrics.snapshot()["order_status"]["calls"] == 8
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_callers_share_result_and_errors(self):
+        """Test async callers share the response of one request, including a failed one."""
+
+        async def respond(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(503 if request.url.params["order_id"] == "bad" else 200, json={"order_id": request.url.params["order_id"]})
+
+        route = respx.get(STATUS_URL).mock(side_effect=respond)
+        client = make_client(coalesce_requests=True, max_retries=0)
+
+        async with client:
+            results = await asyncio.gather(
+                *(client.get(STATUS_URL, params={"order_id": order_id}) for order_id in ("o-1", "o-1", "o-2", "bad", "bad")),
+                return_exceptions=True,
+            )
+
+        assert results[:3] == [{"order_id": "o-1"}, {"order_id": "o-1"}, {"order_id": "o-2"}]
+        assert all(isinstance(result, ZenoPayServerError) for result in results[3:])
+        assert route.call_count == 3
+        assert client.coalescer.coalesced == 2
+
+    def test_only_plain_idempotent_gets_are_coalesced(self):
+        """Test POSTs and GETs with extra options get no key."""
+        client = make_client(coalesce_requests=True)
+        key = client.coalescer.key
+
+        assert key(client.prepare("GET", STATUS_URL, params={"b": 1, "a": 2})) == key(client.prepare("GET", STATUS_URL, params={"a": 2, "b": 1}))
+        assert key(client.prepare("GET", STATUS_URL, params={"a": 1})) != key(client.prepare("GET", STATUS_URL, params={"a": 2}))
+        assert key(client.prepare("POST", DISBURSE_URL)) is None
+        assert key(client.prepare("GET", STATUS_URL, timeout=1.0)) is None
+        assert make_client().coalescer is None
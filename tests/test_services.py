@@ -0,0 +1,795 @@
+"""Tests for the ZenoPay service layer."""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import respx
+from pydantic import ValidationError
+
+from elusion.zenopay import ZenoPay
+from elusion.zenopay.config import ZenoPayConfig
+from elusion.zenopay.exceptions import ZenoPayError, ZenoPayNotFoundError, ZenoPayValidationError
+from elusion.zenopay.http import HTTPClient, OpenTelemetryTracer, Span, Tracer
+from elusion.zenopay.models.checkout import CheckoutResponse
+from elusion.zenopay.models.disbursement import NewDisbursement
+from elusion.zenopay.models.order import OrderResponse, OrderStatusResponse
+from elusion.zenopay.services.parsing import _plain_text_response, get_response_parser
+from elusion.zenopay.services.poller import PaymentStatusPoller, _TrackedOrder
+from elusion.zenopay.services.status_cache import StatusCache
+from elusion.zenopay.utils.concurrency import Pacer
+from elusion.zenopay.utils.journal import DisbursementJournal, JournalState
+
+from tests.fixtures.mock_data import disbursement_data, order_status_data
+
+BASE_URL = "https://zenoapi.test"
+
+
+class TestResponseParsing:
+    """Test cached response parsers."""
+
+    def test_parsers_are_cached_per_model(self):
+        """Test the specialized response type is built once per model."""
+        parser = get_response_parser(OrderResponse)
+        assert get_response_parser(OrderResponse) is parser
+
+        response = parser.parse({"status": "success", "message": "ok", "resultcode": "000", "order_id": "o-1"})
+        assert isinstance(response, parser.response_class)
+        assert response.results.order_id == "o-1"
+        assert response.message == "ok"
+
+    def test_parse_json_validates_raw_bytes(self):
+        """Test raw bodies are validated directly and keep the envelope message."""
+        parser = get_response_parser(OrderResponse)
+
+        response = parser.parse_json(b'{"status":"success","message":"ok","resultcode":"000","order_id":"o-1"}')
+        assert response.results.order_id == "o-1"
+        assert response.message == "ok"
+
+    def test_parse_json_plain_text_body(self):
+        """Test plain-text success bodies still use the legacy success envelope."""
+        parser = get_response_parser(CheckoutResponse)
+
+        with pytest.raises(ValidationError) as exc_info:
+            parser.parse_json(b"Request accepted")
+        assert exc_info.value.errors()[0]["type"] == "missing"
+
+        assert _plain_text_response(b"Request accepted")["data"] == "Request accepted"
+
+    def test_parse_json_models_without_message_field(self):
+        """Test models without a message field are validated from bytes and keep the envelope message."""
+        parser = get_response_parser(CheckoutResponse)
+
+        response = parser.parse_json(b'{"payment_link":"https://pay.test/l","tx_ref":"TX-1","message":"Checkout created"}')
+        assert response.results.tx_ref == "TX-1"
+        assert response.message == "Checkout created"
+
+    def test_non_object_bodies_fail_validation(self):
+        """Test JSON bodies that are not objects raise a validation error instead of AttributeError."""
+        parser = get_response_parser(CheckoutResponse)
+
+        with pytest.raises(ValidationError):
+            parser.parse_json(b'["TX-1"]')
+        with pytest.raises(ValidationError):
+            parser.parse(["TX-1"])  # type: ignore[arg-type]
+
+    @respx.mock
+    def test_non_object_success_body_raises_zenopay_validation_error(self):
+        """Test a non-object 2xx body surfaces as ZenoPayValidationError from the service."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(return_value=httpx.Response(200, json=["o-1"]))
+        client = ZenoPay(api_key="test-key", base_url=BASE_URL)
+
+        with client, pytest.raises(ZenoPayValidationError):
+            client.orders.sync.check_status("o-1")
+
+
+class TestServiceRequests:
+    """Test services end to end against a mocked API."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.client = ZenoPay(api_key="test_api_key", base_url=BASE_URL)
+
+    @respx.mock
+    def test_check_status_parses_raw_body(self):
+        """Test status checks are parsed from the raw response body."""
+        respx.get(f"{BASE_URL}/api/payments/order-status", params={"order_id": "o-1"}).mock(
+            return_value=httpx.Response(200, content=json.dumps(order_status_data("o-1", "COMPLETED")).encode())
+        )
+
+        with self.client:
+            response = self.client.orders.sync.check_status("o-1")
+
+        assert response.success
+        assert response.message == "Order fetch successful"
+        assert response.results.data[0].payment_status == "COMPLETED"
+
+    @respx.mock
+    def test_error_responses_still_raise_api_errors(self):
+        """Test non-2xx responses keep their extracted error message."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(
+            return_value=httpx.Response(404, json={"status": "error", "message": "Order not found"})
+        )
+
+        with self.client:
+            with pytest.raises(ZenoPayNotFoundError, match="Order not found"):
+                self.client.orders.sync.check_status("missing")
+
+    @respx.mock
+    def test_request_hooks_see_endpoint_names(self):
+        """Test hooks registered on the client report the service's endpoint name."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(return_value=httpx.Response(200, json=order_status_data("o-1", "COMPLETED")))
+        events = []
+        self.client.on_response(events.append)
+
+        with self.client:
+            self.client.orders.sync.check_status("o-1")
+
+        assert [(event.endpoint, event.status_code) for event in events] == [("order_status", 200)]
+
+    def test_sync_namespace_shares_service_state(self):
+        """Test the sync namespace reads its HTTP client, configuration and cache from the service."""
+        orders = self.client.orders
+        replacement = HTTPClient(self.client.config)
+
+        orders.http_client = replacement
+        orders.status_cache = StatusCache()
+
+        assert orders.sync.http_client is replacement
+        assert orders.sync.config is orders.config
+        assert orders.sync.status_cache is orders.status_cache
+
+    @respx.mock
+    def test_invalid_body_raises_validation_error(self):
+        """Test a body that does not match the model raises ZenoPayValidationError."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(return_value=httpx.Response(200, text="not json"))
+
+        with self.client:
+            with pytest.raises(ZenoPayValidationError):
+                self.client.orders.sync.check_status("o-1")
+
+
+class RecordedSpan(Span):
+    """Span remembering its name, attributes, parent and error."""
+
+    def __init__(self, tracer: "RecordingTracer", name: str, attributes, parent) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.error = None
+        self.ended = False
+        tracer.spans.append(self)
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, error):
+        self.error = error
+
+    def child(self, name, attributes=None, start_time_ns=None):
+        return RecordedSpan(self.tracer, name, attributes, self)
+
+    def end(self, end_time_ns=None):
+        self.ended = True
+
+
+class RecordingTracer(Tracer):
+    """Tracer keeping every span in memory."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.spans = []
+
+    def start_span(self, name, attributes=None):
+        return RecordedSpan(self, name, attributes, None)
+
+
+class TestTracing:
+    """Test tracing spans around service calls."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.client = ZenoPay(api_key="test_api_key", base_url=BASE_URL)
+        self.tracer = RecordingTracer()
+        self.client.use_tracer(self.tracer)
+
+    @respx.mock
+    def test_call_span_with_children(self):
+        """Test a call produces a span with serialize, network and parse children and its attributes."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json=order_status_data("o-1", "COMPLETED"))]
+        )
+
+        with self.client:
+            self.client.orders.sync.check_status("o-1")
+
+        root = self.tracer.spans[0]
+        assert root.name == "zenopay.order_status"
+        assert root.attributes == {"zenopay.endpoint": "order_status", "http.method": "GET", "http.status_code": 200, "zenopay.resultcode": "000"}
+        assert [(span.name, span.attributes.get("http.status_code")) for span in self.tracer.spans[1:]] == [
+            ("serialize", None),
+            ("network", 503),
+            ("network", 200),
+            ("parse", None),
+        ]
+        assert self.tracer.spans[2].error is not None
+        assert all(span.ended for span in self.tracer.spans)
+        assert all(span.parent is root for span in self.tracer.spans[1:])
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_call_records_exception(self):
+        """Test an API error is recorded on the call span with its status."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(return_value=httpx.Response(404, json={"message": "Order not found"}))
+
+        async with self.client:
+            with pytest.raises(ZenoPayNotFoundError):
+                await self.client.orders.check_status("missing")
+
+        root = self.tracer.spans[0]
+        assert isinstance(root.error, ZenoPayNotFoundError)
+        assert root.attributes["http.status_code"] == 404
+        assert root.ended
+
+    def test_tracing_off_by_default(self):
+        """Test the default tracer is the disabled no-op tracer."""
+        client = ZenoPay(api_key="test_api_key")
+        assert not client.http_client.tracer.enabled
+
+        self.client.use_tracer(None)
+        assert not self.client.http_client.tracer.enabled
+
+    @respx.mock
+    def test_opentelemetry_tracer(self):
+        """Test spans are exported through OpenTelemetry with parent links."""
+        sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        provider = sdk_trace.TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        self.client.use_tracer(OpenTelemetryTracer(provider.get_tracer("test")))
+        respx.post(f"{BASE_URL}/api/payments/checkout/").mock(return_value=httpx.Response(500, json={"message": "down"}))
+
+        with self.client:
+            with pytest.raises(ZenoPayError):
+                self.client.checkout.sync.create(
+                    {"buyer_email": "a@b.co", "buyer_name": "A", "buyer_phone": "0700000000", "amount": 1000, "currency": "TZS"}
+                )
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        root = spans["zenopay.checkout"]
+        assert set(spans) == {"zenopay.checkout", "serialize", "network"}
+        assert all(span.parent.span_id == root.context.span_id for span in spans.values() if span is not root)
+        assert not root.status.is_ok
+        assert root.attributes["http.status_code"] == 500
+
+
+def order_payload(order_id: str) -> dict:
+    """Build a minimal order creation payload."""
+    return {
+        "order_id": order_id,
+        "buyer_email": "buyer@example.com",
+        "buyer_name": "Test Buyer",
+        "buyer_phone": "0744963858",
+        "amount": 1000,
+    }
+
+
+class TestBulkOrders:
+    """Test bulk order creation with bounded concurrency."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.client = ZenoPay(api_key="test_api_key", base_url=BASE_URL, max_retries=0)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def order_response(self, request: httpx.Request) -> httpx.Response:
+        """Answer order creation, rejecting orders whose id starts with 'bad'."""
+        order_id = json.loads(request.content)["order_id"]
+        if order_id.startswith("bad"):
+            return httpx.Response(400, json={"status": "error", "message": "Invalid phone"})
+        return httpx.Response(200, json={"status": "success", "message": "ok", "resultcode": "000", "order_id": order_id})
+
+    async def slow_order_response(self, request: httpx.Request) -> httpx.Response:
+        """Answer order creation after a short delay, tracking requests in flight."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.order_response(request)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_create_many_bounds_concurrency_and_reports_errors(self):
+        """Test orders run at most `concurrency` at a time and failures do not stop the batch."""
+        respx.post(f"{BASE_URL}/api/payments/mobile_money_tanzania").mock(side_effect=self.slow_order_response)
+        orders = (order_payload("bad-3" if i == 3 else f"o-{i}") for i in range(20))
+
+        async with self.client:
+            results = [result async for result in self.client.orders.create_many(orders, concurrency=4)]
+
+        assert sorted(result.index for result in results) == list(range(20))
+        assert self.max_in_flight == 4
+
+        failed = [result for result in results if not result.success]
+        assert [result.index for result in failed] == [3]
+        assert isinstance(failed[0].error, ZenoPayValidationError)
+        assert failed[0].item["order_id"] == "bad-3"
+
+        succeeded = {result.index: result for result in results if result.success}
+        assert succeeded[7].response.results.order_id == "o-7"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_create_many_accepts_async_iterables(self):
+        """Test orders can be streamed from an async generator."""
+        respx.post(f"{BASE_URL}/api/payments/mobile_money_tanzania").mock(side_effect=self.order_response)
+
+        async def orders():
+            for i in range(5):
+                yield order_payload(f"o-{i}")
+
+        async with self.client:
+            results = [result async for result in self.client.orders.create_many(orders(), concurrency=2)]
+
+        assert sorted(result.response.results.order_id for result in results) == [f"o-{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_create_many_rejects_invalid_concurrency(self):
+        """Test concurrency below 1 is rejected."""
+        with pytest.raises(ValueError, match="concurrency"):
+            async for _ in self.client.orders.create_many([order_payload("o-1")], concurrency=0):
+                pass
+
+    @respx.mock
+    def test_create_many_sync(self):
+        """Test the thread pool counterpart reports every order."""
+        respx.post(f"{BASE_URL}/api/payments/mobile_money_tanzania").mock(side_effect=self.order_response)
+        orders = (order_payload("bad-0" if i == 0 else f"o-{i}") for i in range(10))
+
+        with self.client:
+            results = list(self.client.orders.sync.create_many(orders, concurrency=3))
+
+        assert sorted(result.index for result in results) == list(range(10))
+        assert [result.index for result in results if not result.success] == [0]
+
+    def test_pacer_spaces_out_starts(self):
+        """Test the rate limit spreads starts evenly."""
+        pacer = Pacer(rate_limit=10)
+
+        delays = [pacer.reserve() for _ in range(3)]
+        assert delays[0] == 0
+        assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+
+def payout(transid: str) -> NewDisbursement:
+    """Build a disbursement for a test wallet."""
+    return NewDisbursement(transid=transid, utilityref="0744963858", amount=3000, pin="0000")
+
+
+class TestDisbursementBatch:
+    """Test journaled batch disbursements."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.client = ZenoPay(api_key="test_api_key", base_url=BASE_URL, max_retries=0)
+        self.journal = DisbursementJournal(":memory:")
+        self.sent = []
+
+    def teardown_method(self):
+        """Close the journal after each test."""
+        self.journal.close()
+
+    def disbursement_response(self, request: httpx.Request) -> httpx.Response:
+        """Answer disbursements: 'bad' transids are rejected, 'slow' ones time out after sending."""
+        transid = json.loads(request.content)["transid"]
+        self.sent.append(transid)
+        if transid.startswith("bad"):
+            return httpx.Response(400, json={"status": "error", "message": "Invalid wallet"})
+        if transid.startswith("slow"):
+            raise httpx.ReadTimeout("read timed out", request=request)
+        return httpx.Response(200, json=disbursement_data(transid))
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_disburse_batch_journals_and_aggregates(self):
+        """Test outcomes are journaled and fee totals are aggregated."""
+        respx.post(f"{BASE_URL}/api/payments/walletcashin/process/").mock(side_effect=self.disbursement_response)
+        payouts = [payout(f"t-{i}") for i in range(5)] + [payout("bad-1"), payout("slow-1")]
+        results = []
+
+        async with self.client:
+            report = await self.client.disbursements.disburse_batch(payouts, self.journal, concurrency=3, on_result=results.append)
+
+        assert (report.succeeded, report.failed, report.in_doubt, report.skipped) == (5, 1, 1, 0)
+        assert report.total_fee == 5 * 1500
+        assert report.total_deducted == 5 * 4500
+        assert report.total_amount_sent == 5 * 3000
+        assert report.throughput > 0
+        assert len(results) == 7
+
+        assert self.journal.state("t-0") is JournalState.SUCCEEDED
+        assert self.journal.failed() == ["bad-1"]
+        assert self.journal.in_doubt() == ["slow-1"]
+
+    @respx.mock
+    def test_resume_never_resubmits_acknowledged_transids(self):
+        """Test a rerun skips acknowledged and in-doubt transids but retries rejected ones."""
+        respx.post(f"{BASE_URL}/api/payments/walletcashin/process/").mock(side_effect=self.disbursement_response)
+        payouts = [payout("t-1"), payout("t-2"), payout("bad-1"), payout("slow-1")]
+
+        with self.client:
+            self.client.disbursements.sync.disburse_batch(payouts, self.journal, concurrency=2)
+            self.sent.clear()
+            report = self.client.disbursements.sync.disburse_batch(payouts, self.journal, concurrency=2)
+
+        assert self.sent == ["bad-1"]
+        assert (report.succeeded, report.failed, report.skipped) == (0, 1, 3)
+
+    @respx.mock
+    def test_resubmit_in_doubt(self, tmp_path):
+        """Test transids left in doubt by a crashed run are only sent again when asked to."""
+        respx.post(f"{BASE_URL}/api/payments/walletcashin/process/").mock(return_value=httpx.Response(200, json=disbursement_data("t-1")))
+        with DisbursementJournal(tmp_path / "payouts.db") as crashed:
+            crashed.claim("t-1")
+        self.journal.close()
+        self.journal = DisbursementJournal(tmp_path / "payouts.db")
+
+        with self.client:
+            skipped = self.client.disbursements.sync.disburse_batch([payout("t-1")], self.journal)
+            resubmitted = self.client.disbursements.sync.disburse_batch([payout("t-1")], self.journal, resubmit_in_doubt=True)
+
+        assert skipped.skipped == 1
+        assert resubmitted.succeeded == 1
+        assert self.journal.state("t-1") is JournalState.SUCCEEDED
+
+    @respx.mock
+    def test_unparseable_success_response_is_in_doubt(self):
+        """Test a 2xx whose body fails validation is never sent again, unlike a 4xx rejection."""
+        route = respx.post(f"{BASE_URL}/api/payments/walletcashin/process/").mock(
+            return_value=httpx.Response(200, json={**disbursement_data("t-1"), "new_balance": 5.0})
+        )
+
+        with self.client:
+            first = self.client.disbursements.sync.disburse_batch([payout("t-1")], self.journal)
+            second = self.client.disbursements.sync.disburse_batch([payout("t-1")], self.journal)
+
+        assert route.call_count == 1
+        assert (first.in_doubt, first.failed, second.skipped) == (1, 0, 1)
+        assert self.journal.in_doubt() == ["t-1"]
+
+    def test_duplicate_transids_in_flight_are_claimed_once(self):
+        """Test a transid cannot be claimed twice before its outcome is recorded."""
+        assert self.journal.claim("t-1", resubmit_in_doubt=True) is None
+        assert self.journal.claim("t-1", resubmit_in_doubt=True) is JournalState.PENDING
+
+        self.journal.record("t-1", JournalState.FAILED, error="rejected")
+        assert self.journal.claim("t-1") is None
+
+    def test_journal_survives_reopen(self, tmp_path):
+        """Test journaled states are read back after reopening the file."""
+        path = tmp_path / "payouts.db"
+        with DisbursementJournal(path) as journal:
+            journal.claim("t-1")
+            journal.record("t-1", JournalState.SUCCEEDED, fee=1500, total_deducted=4500)
+            journal.claim("t-2")
+
+        with DisbursementJournal(path) as journal:
+            assert journal.state("t-1") is JournalState.SUCCEEDED
+            assert journal.in_doubt() == ["t-2"]
+
+
+class TestPaymentStatusPoller:
+    """Test the multiplexed payment status poller."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.client = ZenoPay(api_key="test_api_key", base_url=BASE_URL, max_retries=0)
+        self.polls = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def status_response(self, request: httpx.Request) -> httpx.Response:
+        """Answer status checks: 'paid' orders complete on the second poll, 'failed' ones fail, others stay pending."""
+        order_id = request.url.params["order_id"]
+        self.polls[order_id] = self.polls.get(order_id, 0) + 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.005)
+        self.in_flight -= 1
+
+        status = "PENDING"
+        if order_id.startswith("paid") and self.polls[order_id] >= 2:
+            status = "COMPLETED"
+        elif order_id.startswith("failed"):
+            status = "FAILED"
+        return httpx.Response(200, json=order_status_data(order_id, status))
+
+    def make_poller(self, **kwargs) -> PaymentStatusPoller:
+        """Create a poller with test-friendly intervals."""
+        options = {"concurrency": 3, "min_interval": 0.01, "max_interval": 0.05, "timeout": 2.0}
+        options.update(kwargs)
+        return PaymentStatusPoller(self.client.orders, self.client.webhooks, **options)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_resolves_many_orders_with_bounded_concurrency(self):
+        """Test orders share one schedule and resolve once their status is final."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+        order_ids = [f"paid-{i}" for i in range(10)] + ["failed-1"]
+
+        async with self.client:
+            async with self.make_poller() as poller:
+                resolutions = await asyncio.gather(*(poller.wait(order_id) for order_id in order_ids))
+                assert poller.pending == 0
+
+        assert [resolution.order_id for resolution in resolutions] == order_ids
+        assert all(resolution.is_paid and resolution.source == "poll" for resolution in resolutions[:10])
+        assert resolutions[-1].payment_status == "FAILED"
+        assert resolutions[0].order.transid == "CEJ3I3SETSN"
+        assert self.polls["failed-1"] == 1
+        assert self.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_webhook_resolves_and_stops_polling(self):
+        """Test a final-status webhook resolves the order and polling stops."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+
+        async with self.client:
+            async with self.make_poller() as poller:
+                future = poller.track("pending-1")
+                await asyncio.sleep(0.03)
+
+                self.client.webhooks.handle_webhook(self.client.webhooks.create_test_webhook("pending-1", "COMPLETED"))
+                resolution = await future
+                polls = self.polls["pending-1"]
+                await asyncio.sleep(0.05)
+
+        assert resolution.source == "webhook"
+        assert resolution.event.payload.order_id == "pending-1"
+        assert self.polls["pending-1"] == polls
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_unexpected_errors_are_rescheduled(self, monkeypatch):
+        """Test a poll failing with a non-SDK error is logged and the order is still polled."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+        check_status = self.client.orders.check_status
+        calls = []
+
+        async def flaky_check_status(order_id):
+            calls.append(order_id)
+            if len(calls) == 1:
+                raise RuntimeError("unexpected payload")
+            return await check_status(order_id)
+
+        monkeypatch.setattr(self.client.orders, "check_status", flaky_check_status)
+
+        async with self.client:
+            async with self.make_poller() as poller:
+                resolution = await asyncio.wait_for(poller.wait("paid-1"), 1.0)
+
+        assert resolution.is_paid
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cancelled_waiter_does_not_cancel_other_waiters(self):
+        """Test cancelling one wait() leaves the order tracked for the other waiters."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+
+        async with self.client:
+            async with self.make_poller() as poller:
+                first = asyncio.ensure_future(poller.wait("paid-1"))
+                second = asyncio.ensure_future(poller.wait("paid-1"))
+                await asyncio.sleep(0)
+                first.cancel()
+                resolution = await asyncio.wait_for(second, 1.0)
+
+        assert first.cancelled()
+        assert resolution.is_paid
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_timeout(self):
+        """Test orders still pending at their deadline fail with TimeoutError."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+
+        async with self.client:
+            async with self.make_poller() as poller:
+                with pytest.raises(TimeoutError):
+                    await poller.wait("pending-1", timeout=0.05)
+
+    def test_interval_grows_with_age(self):
+        """Test older orders are polled less often, within the configured bounds."""
+        poller = self.make_poller(min_interval=5, max_interval=60, backoff_factor=0.1)
+        tracked = _TrackedOrder("o-1", None, started=0.0, deadline=300.0)
+
+        assert poller._interval(tracked, now=10) == 5
+        assert poller._interval(tracked, now=200) == 20
+        assert poller._interval(tracked, now=1000) == 60
+
+    @respx.mock
+    def test_background_thread_for_sync_callers(self):
+        """Test sync callers track orders through thread-safe futures."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+        poller = self.make_poller()
+
+        poller.start_background()
+        try:
+            futures = [poller.submit(f"paid-{i}") for i in range(3)]
+            resolutions = [future.result(timeout=2) for future in futures]
+        finally:
+            poller.stop_background()
+
+        assert all(resolution.is_paid for resolution in resolutions)
+
+    @respx.mock
+    def test_background_thread_leaves_the_clients_pool_open(self):
+        """Test stopping the background thread does not close the async client of the order service."""
+        respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+        asyncio.run(self.client.http_client._ensure_client())
+        async_client = self.client.http_client._client
+        assert async_client is not None
+        poller = self.make_poller()
+
+        poller.start_background()
+        try:
+            assert poller.submit("paid-1").result(timeout=2).is_paid
+        finally:
+            poller.stop_background()
+
+        assert self.client.http_client._client is async_client
+        assert not async_client.is_closed
+
+
+class TestStatusCache:
+    """Test the optional order status cache."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        config = ZenoPayConfig(api_key="test_api_key", base_url=BASE_URL, max_retries=0, status_cache=True, status_cache_max_size=2)
+        self.client = ZenoPay(config=config)
+        self.statuses = {}
+        self.missing = set()
+
+    def status_response(self, request: httpx.Request) -> httpx.Response:
+        """Answer status checks with the order's current status after a short delay."""
+        time.sleep(0.01)
+        order_id = request.url.params["order_id"]
+        return httpx.Response(200, json=order_status_data(order_id, self.statuses.get(order_id, "PENDING")))
+
+    async def async_status_response(self, request: httpx.Request) -> httpx.Response:
+        """Answer status checks after yielding to the event loop, so lookups overlap."""
+        await asyncio.sleep(0.01)
+        order_id = request.url.params["order_id"]
+        if order_id in self.missing:
+            self.missing.discard(order_id)
+            return httpx.Response(404, json={"message": "Order not found"})
+        return httpx.Response(200, json=order_status_data(order_id, self.statuses.get(order_id, "PENDING")))
+
+    def test_disabled_by_default(self):
+        """Test no cache is created unless enabled."""
+        assert ZenoPay(api_key="test_api_key").orders.status_cache is None
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_lookups_coalesce(self):
+        """Test concurrent checks of one order share a request and later checks hit the cache."""
+        route = respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.async_status_response)
+
+        async with self.client:
+            responses = await asyncio.gather(*(self.client.orders.check_status("o-1") for _ in range(5)))
+            await self.client.orders.check_status("o-1")
+
+        assert route.call_count == 1
+        assert all(response is responses[0] for response in responses)
+        stats = self.client.orders.status_cache.stats
+        assert (stats.misses, stats.coalesced, stats.hits) == (1, 4, 1)
+        assert stats.hit_rate == pytest.approx(5 / 6)
+
+    @respx.mock
+    def test_pending_expires_and_final_is_pinned(self):
+        """Test PENDING results expire after the TTL while final results are kept."""
+        route = respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+        self.client.orders.status_cache.ttl = 0
+
+        with self.client:
+            self.client.orders.sync.check_status("o-1")
+            self.statuses["o-1"] = "COMPLETED"
+            assert self.client.orders.sync.check_status("o-1").results.data[0].payment_status == "COMPLETED"
+            self.client.orders.sync.check_status("o-1")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_lru_eviction(self):
+        """Test the least recently used order is evicted first."""
+        route = respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+        self.statuses.update({"o-1": "COMPLETED", "o-2": "FAILED", "o-3": "CANCELLED"})
+
+        with self.client:
+            for order_id in ("o-1", "o-2", "o-1", "o-3", "o-1", "o-2"):
+                self.client.orders.sync.check_status(order_id)
+
+        assert route.call_count == 4
+        assert self.client.orders.status_cache.stats.evictions == 2
+
+    @respx.mock
+    def test_sync_lookups_coalesce_across_threads(self):
+        """Test the sync namespace shares the cache and coalesces lookups from worker threads."""
+        route = respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.status_response)
+
+        with self.client:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                list(executor.map(lambda _: self.client.orders.sync.check_status("o-1"), range(5)))
+
+        assert route.call_count == 1
+        stats = self.client.orders.status_cache.stats
+        assert stats.misses == 1
+        assert stats.hits + stats.coalesced == 4
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test a lookup waiting on a cancelled caller's request fetches the status itself."""
+        route = respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.async_status_response)
+
+        async with self.client:
+            leader = asyncio.ensure_future(self.client.orders.check_status("o-1"))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(self.client.orders.check_status("o-1"))
+            await asyncio.sleep(0.005)
+            leader.cancel()
+            response = await follower
+
+        assert leader.cancelled()
+        assert response.results.data[0].order_id == "o-1"
+        assert route.called
+        stats = self.client.orders.status_cache.stats
+        assert (stats.misses, stats.coalesced) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_lookups_coalesce_per_event_loop(self):
+        """Test a lookup from another event loop does not wait on this loop's request."""
+        cache = StatusCache()
+        parser = get_response_parser(OrderStatusResponse)
+
+        async def fetch(order_id: str, delay: float):
+            await asyncio.sleep(delay)
+            return parser.parse(order_status_data(order_id, "PENDING"))
+
+        def other_loop():
+            return asyncio.run(cache.get_or_fetch("o-1", lambda: fetch("o-1", 0)))
+
+        leader = asyncio.ensure_future(cache.get_or_fetch("o-1", lambda: fetch("o-1", 0.1)))
+        await asyncio.sleep(0)
+        other = await asyncio.get_running_loop().run_in_executor(None, other_loop)
+        await leader
+
+        assert other.results.data[0].order_id == "o-1"
+        assert cache.stats.misses == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_errors_are_shared_but_not_cached(self):
+        """Test a failed lookup raises for every waiting caller and is retried next time."""
+        self.missing.add("missing-1")
+        route = respx.get(f"{BASE_URL}/api/payments/order-status").mock(side_effect=self.async_status_response)
+
+        async with self.client:
+            results = await asyncio.gather(*(self.client.orders.check_status("missing-1") for _ in range(3)), return_exceptions=True)
+            response = await self.client.orders.check_status("missing-1")
+
+        assert all(isinstance(result, ZenoPayNotFoundError) for result in results)
+        assert response.results.data[0].order_id == "missing-1"
+        assert route.call_count == 2
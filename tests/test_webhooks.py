@@ -1,12 +1,35 @@
 """Tests for ZenoPay WebhookService."""
 
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
+import httpx
 import pytest
 from unittest.mock import Mock, patch
 
 from elusion.zenopay.services import WebhookService
 from elusion.zenopay.models.webhook import WebhookEvent, WebhookResponse
-from elusion.zenopay.exceptions import ZenoPayWebhookError
+from elusion.zenopay.exceptions import ZenoPayWebhookError, ZenoPayWebhookQueueFullError
+from elusion.zenopay.webhooks import (
+    AsyncWebhookDispatcher,
+    CallbackAuditSink,
+    MemoryDedupStore,
+    NDJSONAuditSink,
+    SQLiteDedupStore,
+    ThreadedWebhookDispatcher,
+    WebhookAuditSink,
+    WebhookDedupStore,
+    WebhookDispatcher,
+    WebhookLog,
+    WebhookSignatureVerifier,
+)
+from elusion.zenopay.webhooks.asgi import WebhookASGIApp
 
 from tests.fixtures.mock_data import webhook_json_fixtures, mock_handlers
 
@@ -190,29 +213,66 @@ class TestWebhookService:
 
         assert test_event.payload.payment_status == "COMPLETED"
 
-    def test_multiple_handlers_replacement(self):
-        """Test that registering multiple handlers replaces previous ones."""
+    def test_multiple_handlers_per_status(self):
+        """Test that every handler registered for a status is called."""
         handler1 = Mock()
         handler2 = Mock()
 
         self.service.register_handler("COMPLETED", handler1)
-        self.service.register_handler("COMPLETED", handler2)  # Should replace handler1
+        self.service.register_handler("COMPLETED", handler2)
 
         event = self.service.parse_webhook(webhook_json_fixtures.valid_completed_json())
         self.service.handle_webhook(event)
 
-        handler1.assert_not_called()
+        handler1.assert_called_once_with(event)
         handler2.assert_called_once_with(event)
 
+    def test_failing_handler_does_not_skip_others(self):
+        """Test a failing handler is reported without preventing the other handlers from running."""
+        handler = Mock()
+        self.service.on_payment_completed(mock_handlers.error_handler)
+        self.service.on_payment_completed(handler)
+
+        event = self.service.parse_webhook(webhook_json_fixtures.valid_completed_json())
+        response = self.service.handle_webhook(event)
+
+        handler.assert_called_once_with(event)
+        assert response.status == "error"
+        assert response.status_code == 500
+
+    def test_unregister_handler(self):
+        """Test unregistering a handler."""
+        handler = Mock()
+        self.service.register_handler("COMPLETED", handler)
+
+        assert self.service.unregister_handler("COMPLETED", handler)
+        assert not self.service.unregister_handler("COMPLETED", handler)
+
+        self.service.handle_webhook(self.service.parse_webhook(webhook_json_fixtures.valid_completed_json()))
+        handler.assert_not_called()
+
+    def test_coroutine_handler_from_sync_code(self):
+        """Test coroutine handlers are awaited when called from sync code."""
+        handled: List[str] = []
+
+        async def handler(event: WebhookEvent):
+            await asyncio.sleep(0)
+            handled.append(event.payload.order_id)
+
+        self.service.on_payment_completed(handler)
+        self.service.process_webhook_request(webhook_json_fixtures.valid_completed_json())
+
+        assert handled == ["ZP-20250616-123456-test-01"]
+
     @patch("elusion.zenopay.services.webhooks.logger")
     def test_logging_webhook_parsing(self, mock_logger: Mock):
         """Test that webhook parsing is logged."""
         self.service.parse_webhook(webhook_json_fixtures.valid_completed_json())
 
         mock_logger.info.assert_called()
-        call_args = mock_logger.info.call_args[0][0]
-        assert "ZP-20250616-123456-test-01" in call_args
-        assert "COMPLETED" in call_args
+        message, *args = mock_logger.info.call_args[0]
+        assert "ZP-20250616-123456-test-01" in message % tuple(args)
+        assert "COMPLETED" in message % tuple(args)
 
     @patch("elusion.zenopay.services.webhooks.logger")
     def test_logging_webhook_processing(self, mock_logger: Mock):
@@ -306,5 +366,892 @@ class TestWebhookIntegration:
         assert results[0]["reference"] == "REF123456789"
 
 
+def webhook_json(order_id: str, payment_status: str = "COMPLETED") -> str:
+    """Build a minimal webhook body."""
+    return json.dumps({"order_id": order_id, "payment_status": payment_status, "reference": f"REF-{order_id}"})
+
+
+class TestWebhookDispatch:
+    """Test queued webhook dispatch."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.service = WebhookService()
+        self.release = threading.Event()
+        self.handled: List[str] = []
+        self.service.on_payment_completed(self.blocking_handler)
+
+    def blocking_handler(self, event: WebhookEvent):
+        """Handler that waits until the test releases it."""
+        self.release.wait(timeout=5)
+        self.handled.append(event.payload.order_id)
+
+    def test_acknowledges_before_handler_finishes(self):
+        """Test webhooks are acknowledged while the handler is still running."""
+        with ThreadedWebhookDispatcher(self.service.handle_webhook, workers=2) as dispatcher:
+            self.service.use_dispatcher(dispatcher)
+            responses = [self.service.process_webhook_request(webhook_json(f"o-{i}")) for i in range(3)]
+
+            assert all(response.status == "success" and response.status_code == 200 for response in responses)
+            assert "queued" in responses[0].message
+            assert self.handled == []
+            self.release.set()
+
+        assert sorted(self.handled) == ["o-0", "o-1", "o-2"]
+        assert dispatcher.metrics.processed == 3
+
+    def test_failed_handlers_are_counted_as_failed(self):
+        """Test a handler failure caught by handle_webhook still counts as a failed event."""
+        service = WebhookService()
+        service.on_payment_completed(Mock(side_effect=RuntimeError("boom")))
+
+        with ThreadedWebhookDispatcher(service.handle_webhook, workers=1) as dispatcher:
+            service.use_dispatcher(dispatcher)
+            response = service.process_webhook_request(webhook_json("o-1"))
+
+        assert response.status_code == 200
+        assert (dispatcher.metrics.processed, dispatcher.metrics.failed) == (0, 1)
+
+    def test_reject_policy_answers_503(self):
+        """Test a full queue rejects new webhooks so ZenoPay redelivers them."""
+        dispatcher = ThreadedWebhookDispatcher(self.service.handle_webhook, workers=1, max_queue_size=1, overflow="reject")
+        dispatcher.start()
+        self.service.use_dispatcher(dispatcher)
+
+        self.service.process_webhook_request(webhook_json("o-0"))
+        self.wait_until(lambda: dispatcher.queue_depth == 0)
+        self.service.process_webhook_request(webhook_json("o-1"))
+        response = self.service.process_webhook_request(webhook_json("o-2"))
+
+        assert response.status == "error"
+        assert response.status_code == 503
+        metrics = dispatcher.metrics
+        assert (metrics.enqueued, metrics.rejected, metrics.queue_depth, metrics.max_queue_depth) == (2, 1, 1, 1)
+
+        self.release.set()
+        dispatcher.stop()
+        assert sorted(self.handled) == ["o-0", "o-1"]
+
+    def test_spill_policy_dispatches_spilled_events(self, tmp_path):
+        """Test overflowing events are spilled to disk and handled once the queue has room."""
+        spill_path = tmp_path / "webhooks.spill"
+        dispatcher = ThreadedWebhookDispatcher(self.service.handle_webhook, workers=1, max_queue_size=1, overflow="spill", spill_path=spill_path)
+        dispatcher.start()
+        self.service.use_dispatcher(dispatcher)
+
+        self.service.process_webhook_request(webhook_json("o-0"))
+        self.wait_until(lambda: dispatcher.queue_depth == 0)
+        responses = [self.service.process_webhook_request(webhook_json(f"o-{i}")) for i in range(1, 4)]
+
+        assert all(response.status_code == 200 for response in responses)
+        assert dispatcher.metrics.spilled == 2
+        assert dispatcher.metrics.spill_depth == 2
+
+        self.release.set()
+        dispatcher.stop()
+        assert sorted(self.handled) == ["o-0", "o-1", "o-2", "o-3"]
+        assert spill_path.read_text() == ""
+
+    def test_refill_keeps_spill_order_when_the_queue_fills_up(self, tmp_path):
+        """Test spilled events losing their queue slot to a new event go back in front of the spill file."""
+        dispatcher = ThreadedWebhookDispatcher(
+            self.service.handle_webhook, max_queue_size=2, overflow="spill", spill_path=tmp_path / "webhooks.spill"
+        )
+        spill = dispatcher.spill
+        assert spill is not None
+        for i in range(3):
+            spill.append(self.service.parse_webhook(webhook_json(f"o-{i}")))
+        take = spill.take
+
+        def take_then_race(limit: int) -> List[WebhookEvent]:
+            events = take(limit)
+            dispatcher.submit(self.service.parse_webhook(webhook_json("o-new")))
+            return events
+
+        with patch.object(spill, "take", take_then_race):
+            assert dispatcher._refill() == 1
+
+        assert [event.payload.order_id for event in spill.take(5)] == ["o-1", "o-2"]
+        assert len(spill) == 0
+
+    def test_dispatcher_base_class_is_abstract(self):
+        """Test dispatchers must provide the queue."""
+        with pytest.raises(TypeError, match="abstract"):
+            WebhookDispatcher(self.service.handle_webhook)  # type: ignore[abstract]
+
+    def test_spill_path_required(self):
+        """Test the spill policy needs a spill file."""
+        with pytest.raises(ValueError, match="spill_path"):
+            ThreadedWebhookDispatcher(self.service.handle_webhook, overflow="spill")
+
+    @pytest.mark.asyncio
+    async def test_async_dispatcher_awaits_coroutine_handlers(self):
+        """Test asyncio workers await coroutine handlers concurrently."""
+        handled: List[str] = []
+
+        async def handler(event: WebhookEvent):
+            await asyncio.sleep(0.01)
+            handled.append(event.payload.order_id)
+
+        async with AsyncWebhookDispatcher(handler, workers=4, max_queue_size=2) as dispatcher:
+            for i in range(6):
+                await dispatcher.submit_async(self.service.parse_webhook(webhook_json(f"o-{i}")))
+
+        assert sorted(handled) == [f"o-{i}" for i in range(6)]
+        metrics = dispatcher.metrics
+        assert (metrics.enqueued, metrics.processed, metrics.failed, metrics.rejected) == (6, 6, 0, 0)
+        assert metrics.max_queue_depth <= 2
+
+    @pytest.mark.asyncio
+    async def test_async_dispatcher_offloads_sync_handlers(self):
+        """Test sync handlers run off the event loop and failures are counted."""
+        loop_thread = threading.get_ident()
+        threads: List[int] = []
+
+        def handler(event: WebhookEvent):
+            threads.append(threading.get_ident())
+            if event.payload.order_id == "bad":
+                raise RuntimeError("handler failed")
+
+        async with AsyncWebhookDispatcher(handler, workers=2) as dispatcher:
+            dispatcher.submit(self.service.parse_webhook(webhook_json("o-1")))
+            dispatcher.submit(self.service.parse_webhook(webhook_json("bad")))
+
+        assert loop_thread not in threads
+        assert (dispatcher.metrics.processed, dispatcher.metrics.failed) == (1, 1)
+
+    @staticmethod
+    def wait_until(condition, timeout: float = 2.0):
+        """Wait until a condition holds."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline, "condition not met in time"
+            time.sleep(0.001)
+
+
+class TestAsyncWebhookHandling:
+    """Test async webhook handling with several handlers per status."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.service = WebhookService()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def tracked_handler(self, event: WebhookEvent):
+        """Coroutine handler tracking how many calls overlap."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    @pytest.mark.asyncio
+    async def test_handlers_run_concurrently_off_the_loop(self):
+        """Test coroutine handlers run concurrently and sync handlers run in the executor."""
+        loop_thread = threading.get_ident()
+        sync_threads: List[int] = []
+
+        async def slow_handler(event: WebhookEvent):
+            await asyncio.sleep(0.05)
+
+        self.service.on_payment_completed(slow_handler)
+        self.service.on_payment_completed(slow_handler)
+        self.service.on_payment_completed(lambda event: sync_threads.append(threading.get_ident()))
+
+        started = time.perf_counter()
+        response = await self.service.process_webhook_request_async(webhook_json("o-1"))
+
+        assert time.perf_counter() - started < 0.09
+        assert response.status == "success"
+        assert sync_threads and loop_thread not in sync_threads
+
+    @pytest.mark.asyncio
+    async def test_async_handler_concurrency_limit(self):
+        """Test a coroutine handler never runs more often at once than its limit."""
+        self.service.on_payment_completed(self.tracked_handler, max_concurrency=2)
+
+        events = [self.service.parse_webhook(webhook_json(f"o-{i}")) for i in range(6)]
+        responses = await asyncio.gather(*(self.service.handle_webhook_async(event) for event in events))
+
+        assert all(response.status == "success" for response in responses)
+        assert self.max_in_flight == 2
+
+    def test_sync_handler_concurrency_limit(self):
+        """Test a sync handler never runs more often at once than its limit, across threads."""
+        lock = threading.Lock()
+
+        def handler(event: WebhookEvent):
+            with lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.01)
+            with lock:
+                self.in_flight -= 1
+
+        self.service.on_payment_completed(handler, max_concurrency=1)
+        events = [self.service.parse_webhook(webhook_json(f"o-{i}")) for i in range(4)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(self.service.handle_webhook, events))
+
+        assert self.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_handling_refuses_coroutine_handlers_inside_a_loop(self):
+        """Test sync handling inside a running loop fails instead of leaving a coroutine handler unawaited."""
+        self.service.on_payment_completed(self.tracked_handler)
+
+        response = self.service.handle_webhook(self.service.parse_webhook(webhook_json("o-1")))
+        await asyncio.sleep(0.02)
+
+        assert response.status == "error"
+        assert response.status_code == 500
+        assert self.max_in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_process_request_async_with_dispatcher(self):
+        """Test async requests wait for room in a blocking async dispatcher."""
+        self.service.on_payment_completed(self.tracked_handler)
+
+        async with AsyncWebhookDispatcher(self.service.handle_webhook_async, workers=1, max_queue_size=1) as dispatcher:
+            self.service.use_dispatcher(dispatcher)
+            responses = await asyncio.gather(*(self.service.process_webhook_request_async(webhook_json(f"o-{i}")) for i in range(4)))
+
+        assert all("queued" in response.message for response in responses)
+        assert (dispatcher.metrics.processed, dispatcher.metrics.rejected) == (4, 0)
+
+    @pytest.mark.asyncio
+    async def test_process_request_async_invalid_data(self):
+        """Test invalid webhook data is answered with 400."""
+        response = await self.service.process_webhook_request_async(webhook_json_fixtures.invalid_json())
+
+        assert response.status == "error"
+        assert response.status_code == 400
+
+
+class TestWebhookDedup:
+    """Test deduplication of redelivered webhooks."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.service = WebhookService()
+        self.handled: List[str] = []
+        self.service.on_payment_completed(lambda event: self.handled.append(event.payload.order_id))
+        self.service.on_payment_pending(lambda event: self.handled.append(event.payload.order_id))
+
+    def test_store_base_class_is_abstract(self):
+        """Test stores must implement the storage methods."""
+        with pytest.raises(TypeError, match="abstract"):
+            WebhookDedupStore()  # type: ignore[abstract]
+
+    def test_redelivered_webhook_is_handled_once(self):
+        """Test a redelivery is acknowledged without running the handlers again."""
+        store = MemoryDedupStore()
+        self.service.use_dedup(store)
+
+        first = self.service.process_webhook_request(webhook_json("o-1"))
+        second = self.service.process_webhook_request(webhook_json("o-1"))
+
+        assert first.status == second.status == "success"
+        assert "Duplicate" in second.message
+        assert self.handled == ["o-1"]
+        assert (store.stats.checked, store.stats.duplicates, store.stats.size) == (2, 1, 1)
+
+    def test_status_change_is_not_a_duplicate(self):
+        """Test the same order with another status or reference is handled."""
+        self.service.use_dedup(MemoryDedupStore())
+
+        self.service.process_webhook_request(webhook_json("o-1", "PENDING"))
+        self.service.process_webhook_request(webhook_json("o-1", "COMPLETED"))
+        self.service.process_webhook_request(json.dumps({"order_id": "o-1", "payment_status": "COMPLETED", "reference": "OTHER"}))
+
+        assert self.handled == ["o-1", "o-1", "o-1"]
+
+    def test_failed_handling_releases_key(self):
+        """Test a redelivery is handled again when the first attempt failed."""
+        store = MemoryDedupStore()
+        self.service.use_dedup(store)
+        attempts: List[int] = []
+
+        def flaky(event: WebhookEvent):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("database unavailable")
+
+        self.service.on_payment_failed(flaky)
+
+        first = self.service.process_webhook_request(webhook_json("o-1", "FAILED"))
+        second = self.service.process_webhook_request(webhook_json("o-1", "FAILED"))
+        third = self.service.process_webhook_request(webhook_json("o-1", "FAILED"))
+
+        assert (first.status_code, second.status_code) == (500, 200)
+        assert "Duplicate" in third.message
+        assert len(attempts) == 2
+        assert store.stats.released == 1
+
+    def test_rejected_by_full_queue_releases_key(self):
+        """Test an event rejected by the dispatcher is handled on redelivery."""
+        store = MemoryDedupStore()
+        self.service.use_dedup(store)
+        dispatcher = Mock()
+        dispatcher.submit.side_effect = ZenoPayWebhookQueueFullError(queue_size=1)
+        self.service.use_dispatcher(dispatcher)
+
+        response = self.service.process_webhook_request(webhook_json("o-1"))
+
+        assert response.status_code == 503
+        assert not store.seen(("o-1", "COMPLETED", "REF-o-1"))
+
+    def test_memory_store_evicts_least_recently_seen(self):
+        """Test the memory store stays within max_size."""
+        store = MemoryDedupStore(max_size=2)
+
+        assert store.claim(("a", "COMPLETED", ""))
+        assert store.claim(("b", "COMPLETED", ""))
+        assert not store.claim(("a", "COMPLETED", ""))
+        assert store.claim(("c", "COMPLETED", ""))
+
+        assert store.seen(("a", "COMPLETED", ""))
+        assert not store.seen(("b", "COMPLETED", ""))
+        assert store.stats.evictions == 1
+        assert len(store) == 2
+
+    def test_memory_store_ttl(self):
+        """Test keys are forgotten after the TTL."""
+        store = MemoryDedupStore(ttl=0.01)
+
+        assert store.claim(("a", "COMPLETED", ""))
+        time.sleep(0.02)
+
+        assert not store.seen(("a", "COMPLETED", ""))
+        assert store.claim(("a", "COMPLETED", ""))
+
+    def test_sqlite_store_survives_restart(self, tmp_path):
+        """Test keys claimed before a restart are still duplicates afterwards."""
+        path = tmp_path / "seen.db"
+        with SQLiteDedupStore(path) as store:
+            self.service.use_dedup(store)
+            self.service.process_webhook_request(webhook_json("o-1"))
+
+        with SQLiteDedupStore(path) as store:
+            self.service.use_dedup(store)
+            response = self.service.process_webhook_request(webhook_json("o-1"))
+            stats = store.stats
+
+        assert "Duplicate" in response.message
+        assert self.handled == ["o-1"]
+        assert (stats.duplicates, stats.size) == (1, 1)
+
+    def test_sqlite_store_ttl_and_release(self):
+        """Test expired and released keys can be claimed again."""
+        with SQLiteDedupStore(":memory:", ttl=0.01) as store:
+            assert store.claim(("a", "COMPLETED", ""))
+            assert not store.claim(("a", "COMPLETED", ""))
+            time.sleep(0.02)
+            assert store.claim(("a", "COMPLETED", ""))
+
+            store.release(("a", "COMPLETED", ""))
+            assert not store.seen(("a", "COMPLETED", ""))
+            assert store.claim(("a", "COMPLETED", ""))
+
+    def test_concurrent_copies_handled_once(self):
+        """Test copies delivered at the same time on several threads are handled once."""
+        self.service.use_dedup(MemoryDedupStore())
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self.service.process_webhook_request, [webhook_json("o-1")] * 32))
+
+        assert self.handled == ["o-1"]
+
+
+class TestWebhookLog:
+    """Test the webhook write-ahead log."""
+
+    def test_unfinished_entries_are_replayed(self, tmp_path):
+        """Test entries not marked done are replayed after reopening."""
+        with WebhookLog(tmp_path) as log:
+            first = log.append(webhook_json("o-1"))
+            log.append(webhook_json("o-2"))
+            log.mark_done(first)
+
+        with WebhookLog(tmp_path) as log:
+            replayed = [json.loads(raw)["order_id"] for _, raw in log.replay()]
+
+        assert replayed == ["o-2"]
+
+    def test_checkpoint_waits_for_oldest_entry(self, tmp_path):
+        """Test out-of-order completion only moves the checkpoint past finished entries."""
+        with WebhookLog(tmp_path, checkpoint_interval=0) as log:
+            positions = [log.append(webhook_json(f"o-{i}")) for i in range(3)]
+            log.mark_done(positions[1])
+            assert log.checkpoint == positions[0]
+
+            log.mark_done(positions[0])
+            assert log.checkpoint == positions[2]
+            log.mark_done(positions[2])
+            assert log.stats.pending == 0
+
+        with WebhookLog(tmp_path) as log:
+            assert list(log.replay()) == []
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        """Test a partially written record from a crash is dropped on recovery."""
+        with WebhookLog(tmp_path) as log:
+            log.append(webhook_json("o-1"))
+        segment = next(tmp_path.glob("*.log"))
+        with open(segment, "ab") as f:
+            f.write(b"\x40\x00\x00\x00garbage")
+
+        with WebhookLog(tmp_path) as log:
+            log.append(webhook_json("o-2"))
+
+        with WebhookLog(tmp_path) as log:
+            replayed = [json.loads(raw)["order_id"] for _, raw in log.replay()]
+
+        assert replayed == ["o-1", "o-2"]
+
+    def test_segments_roll_and_are_deleted(self, tmp_path):
+        """Test the log rolls over to new segments and deletes finished ones."""
+        with WebhookLog(tmp_path, segment_size=256, checkpoint_interval=0) as log:
+            positions = [log.append(webhook_json(f"o-{i}")) for i in range(20)]
+            assert log.stats.segments > 1
+
+            for position in positions[:-1]:
+                log.mark_done(position)
+
+        assert len(list(tmp_path.glob("*.log"))) == 1
+        with WebhookLog(tmp_path, segment_size=256) as log:
+            assert [position for position, _ in log.replay()] == positions[-1:]
+
+    def test_failed_entries_do_not_pin_the_checkpoint(self, tmp_path):
+        """Test a failed entry lets later segments be deleted and is still replayed."""
+        with WebhookLog(tmp_path, segment_size=256, checkpoint_interval=0) as log:
+            positions = [log.append(webhook_json(f"o-{i}")) for i in range(20)]
+            log.mark_failed(positions[0])
+            for position in positions[1:-1]:
+                log.mark_done(position)
+
+            assert log.checkpoint == positions[-1]
+            assert (log.stats.pending, log.stats.failed) == (1, 1)
+
+        assert len(list(tmp_path.glob("*.log"))) == 2
+        with WebhookLog(tmp_path, segment_size=256, checkpoint_interval=0) as log:
+            assert [position for position, _ in log.replay()] == [positions[0], positions[-1]]
+            log.mark_done(positions[0])
+            log.mark_done(positions[-1])
+
+        assert len(list(tmp_path.glob("*.log"))) == 1
+        with WebhookLog(tmp_path, segment_size=256) as log:
+            assert list(log.replay()) == []
+
+    def test_group_commit_shares_fsyncs(self, tmp_path):
+        """Test concurrent appends are made durable by fewer fsyncs than appends."""
+        with WebhookLog(tmp_path) as log:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                list(executor.map(log.append, [webhook_json(f"o-{i}") for i in range(800)]))
+            stats = log.stats
+
+        assert stats.appended == 800
+        assert stats.fsyncs < stats.appended
+
+    def test_service_replays_acknowledged_events(self, tmp_path):
+        """Test an event acknowledged before a crash is handled after the restart."""
+        service = WebhookService()
+        service.use_log(WebhookLog(tmp_path))
+        service.use_dispatcher(Mock())  # Accepts the event, then the process "crashes"
+
+        response = service.process_webhook_request(webhook_json("o-1"))
+        assert "queued" in response.message
+
+        handled: List[str] = []
+        restarted = WebhookService()
+        restarted.on_payment_completed(lambda event: handled.append(event.payload.order_id))
+        with WebhookLog(tmp_path, checkpoint_interval=0) as log:
+            restarted.use_log(log)
+            assert restarted.replay_log() == 1
+            assert restarted.process_webhook_request(webhook_json("o-2")).status == "success"
+
+        with WebhookLog(tmp_path) as log:
+            assert list(log.replay()) == []
+        assert handled == ["o-1", "o-2"]
+
+    def test_failed_dispatched_events_are_kept_for_replay(self, tmp_path):
+        """Test a handler failing after a dispatcher ack leaves the entry and dedup claim for replay_log."""
+        service = WebhookService()
+        service.use_dedup(MemoryDedupStore())
+
+        def fail(event):
+            raise RuntimeError("database down")
+
+        service.on_payment_completed(fail)
+        with WebhookLog(tmp_path) as log:
+            service.use_log(log)
+            with ThreadedWebhookDispatcher(service.handle_webhook, workers=1) as dispatcher:
+                service.use_dispatcher(dispatcher)
+                assert service.process_webhook_request(webhook_json("o-1")).status_code == 200
+            assert service.process_webhook_request(webhook_json("o-1")).status == "success"  # Still a duplicate
+            assert log.stats.failed == 1
+
+        handled: List[str] = []
+        restarted = WebhookService()
+        restarted.on_payment_completed(lambda event: handled.append(event.payload.order_id))
+        with WebhookLog(tmp_path) as log:
+            restarted.use_log(log)
+            assert restarted.replay_log() == 1
+        assert handled == ["o-1"]
+
+    def test_failed_inline_events_are_left_to_redelivery(self, tmp_path):
+        """Test an inline failure answers 500 and releases the event, so ZenoPay's redelivery is handled once."""
+        service = WebhookService()
+        service.use_dedup(MemoryDedupStore())
+        calls: List[str] = []
+
+        def fail_once(event):
+            calls.append(event.payload.order_id)
+            if len(calls) == 1:
+                raise RuntimeError("database down")
+
+        service.on_payment_completed(fail_once)
+        with WebhookLog(tmp_path) as log:
+            service.use_log(log)
+            assert service.process_webhook_request(webhook_json("o-1")).status_code == 500
+            assert service.process_webhook_request(webhook_json("o-1")).status_code == 200
+
+        with WebhookLog(tmp_path) as log:
+            assert list(log.replay()) == []
+        assert calls == ["o-1", "o-1"]
+
+    @pytest.mark.asyncio
+    async def test_service_logs_before_async_dispatch(self, tmp_path):
+        """Test async requests are logged, and marked done once handled by the dispatcher."""
+        service = WebhookService()
+        service.on_payment_completed(lambda event: None)
+
+        with WebhookLog(tmp_path, checkpoint_interval=0) as log:
+            service.use_log(log)
+            async with AsyncWebhookDispatcher(service.handle_webhook_async, workers=2) as dispatcher:
+                service.use_dispatcher(dispatcher)
+                await asyncio.gather(*(service.process_webhook_request_async(webhook_json(f"o-{i}")) for i in range(10)))
+
+            assert (log.stats.appended, log.stats.pending) == (10, 0)
+
+
+class TestBatchWebhookParsing:
+    """Test streaming batch webhook parsing."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.service = WebhookService()
+
+    def test_parse_webhooks_collects_errors(self):
+        """Test valid records are yielded in order and invalid ones collected."""
+        records = [
+            webhook_json("o-1") + "\n",
+            "\n",
+            webhook_json_fixtures.invalid_json() + "\n",
+            webhook_json("o-2", "FAILED").encode(),
+            json.dumps({"order_id": "o-3", "payment_status": "UNKNOWN"}),
+        ]
+
+        batch = self.service.parse_webhooks(records)
+        events = list(batch)
+
+        assert [(event.payload.order_id, event.payload.payment_status) for event in events] == [("o-1", "COMPLETED"), ("o-2", "FAILED")]
+        assert events[0].raw_data == webhook_json("o-1")
+        assert events[0].timestamp is not None
+        assert batch.parsed == 2
+        assert [failure.line for failure in batch.errors] == [3, 5]
+        assert "Invalid payment status" in batch.errors[1].error
+
+    def test_parse_webhooks_is_lazy(self):
+        """Test records are only consumed as events are requested."""
+        consumed: List[int] = []
+
+        def records():
+            for i in range(1000):
+                consumed.append(i)
+                yield webhook_json(f"o-{i}")
+
+        events = iter(self.service.parse_webhooks(records()))
+        next(events)
+        next(events)
+
+        assert len(consumed) == 2
+
+    def test_parse_webhook_file(self, tmp_path):
+        """Test an NDJSON file is parsed line by line."""
+        path = tmp_path / "webhooks.ndjson"
+        path.write_text("".join(webhook_json(f"o-{i}") + "\n" for i in range(5)) + "not json\n")
+
+        batch = self.service.parse_webhook_file(path)
+
+        assert [event.payload.order_id for event in batch] == [f"o-{i}" for i in range(5)]
+        assert batch.errors[0].line == 6
+        assert batch.errors[0].raw_data == "not json"
+
+    def test_batch_matches_single_parse(self):
+        """Test batch parsing produces the same payload as parse_webhook."""
+        raw = webhook_json_fixtures.valid_completed_json()
+
+        single = self.service.parse_webhook(raw)
+        (batched,) = list(self.service.parse_webhooks([raw]))
+
+        assert batched.payload == single.payload
+        assert batched.raw_data == single.raw_data
+
+
+class TestWebhookAudit:
+    """Test webhook audit logging."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.service = WebhookService()
+        self.records: List[Any] = []
+        self.service.audit_sinks = [CallbackAuditSink(self.records.append)]
+
+    def test_audit_records_per_stage(self):
+        """Test handled, failed and duplicate webhooks produce audit records."""
+        self.service.use_dedup(MemoryDedupStore())
+        self.service.on_payment_completed(lambda event: None)
+        self.service.on_payment_failed(Mock(side_effect=RuntimeError("boom")))
+
+        self.service.process_webhook_request(webhook_json("o-1"))
+        self.service.process_webhook_request(webhook_json("o-1"))
+        self.service.process_webhook_request(webhook_json("o-2", "FAILED"))
+
+        assert [(record.stage, record.order_id) for record in self.records] == [("handled", "o-1"), ("duplicate", "o-1"), ("failed", "o-2")]
+        assert self.records[0].reference == "REF-o-1"
+        assert self.records[2].message == "boom"
+
+    def test_sink_base_class_is_abstract(self):
+        """Test sinks must implement emit."""
+        with pytest.raises(TypeError, match="abstract"):
+            WebhookAuditSink()  # type: ignore[abstract]
+
+    def test_disabled_sink_is_skipped(self):
+        """Test no record is built or emitted for a disabled sink."""
+
+        class DisabledSink(WebhookAuditSink):
+            @property
+            def enabled(self) -> bool:
+                return False
+
+            def emit(self, record: Any) -> None:
+                raise AssertionError("emit called on a disabled sink")
+
+        self.service.audit_sinks = [DisabledSink()]
+        self.service.on_payment_completed(lambda event: None)
+
+        with patch("elusion.zenopay.services.webhooks.WebhookAuditRecord") as record_class:
+            response = self.service.process_webhook_request(webhook_json("o-1"))
+
+        assert response.status == "success"
+        record_class.assert_not_called()
+
+    def test_default_logger_sink(self, caplog):
+        """Test the default sink logs to the audit logger only when INFO is enabled."""
+        service = WebhookService()
+
+        with caplog.at_level(logging.WARNING, logger="elusion.zenopay.webhooks.audit"):
+            service.process_webhook_request(webhook_json("o-1"))
+        assert not [record for record in caplog.records if record.name == "elusion.zenopay.webhooks.audit"]
+
+        with caplog.at_level(logging.INFO, logger="elusion.zenopay.webhooks.audit"):
+            service.process_webhook_request(webhook_json("o-2"))
+        (logged,) = [record for record in caplog.records if record.name == "elusion.zenopay.webhooks.audit"]
+        assert "o-2" in logged.getMessage()
+        assert logged.webhook_audit.stage == "handled"
+
+    def test_ndjson_sink(self, tmp_path):
+        """Test the NDJSON sink writes one JSON object per record."""
+        path = tmp_path / "audit.ndjson"
+        with NDJSONAuditSink(path) as sink:
+            self.service.audit_sinks = [sink]
+            self.service.process_webhook_request(webhook_json("o-1"))
+            self.service.process_webhook_request(webhook_json("o-2", "PENDING"))
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [(line["order_id"], line["payment_status"], line["stage"]) for line in lines] == [
+            ("o-1", "COMPLETED", "handled"),
+            ("o-2", "PENDING", "handled"),
+        ]
+
+    def test_failing_sink_does_not_affect_response(self):
+        """Test an exception from a sink is logged and the webhook still succeeds."""
+        self.service.audit_sinks.insert(0, CallbackAuditSink(Mock(side_effect=OSError("disk full"))))
+
+        response = self.service.process_webhook_request(webhook_json("o-1"))
+
+        assert response.status == "success"
+        assert len(self.records) == 1
+
+
+class TestWebhookASGIApp:
+    """Test the ASGI webhook receiver."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.service = WebhookService()
+        self.handled: List[str] = []
+
+        async def handler(event: WebhookEvent):
+            self.handled.append(event.payload.order_id)
+
+        self.service.on_payment_completed(handler)
+        self.app = WebhookASGIApp(self.service, max_body_size=1024)
+
+    def client(self) -> httpx.AsyncClient:
+        """Build an HTTP client talking to the app in-process."""
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url="http://testserver")
+
+    @pytest.mark.asyncio
+    async def test_post_webhook(self):
+        """Test a valid webhook is handled and acknowledged."""
+        async with self.client() as client:
+            response = await client.post("/zenopay/webhook", content=webhook_json("o-1"))
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "success"
+        assert self.handled == ["o-1"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_requests(self):
+        """Test invalid bodies, paths, methods and oversized bodies are rejected."""
+        async with self.client() as client:
+            invalid = await client.post("/zenopay/webhook", content=webhook_json_fixtures.invalid_json())
+            not_utf8 = await client.post("/zenopay/webhook", content=b"\xff\xfe")
+            not_found = await client.post("/other", content=webhook_json("o-1"))
+            wrong_method = await client.get("/zenopay/webhook")
+            too_large = await client.post("/zenopay/webhook", content=b"x" * 2048)
+
+        assert (invalid.status_code, not_utf8.status_code, not_found.status_code) == (400, 400, 404)
+        assert wrong_method.status_code == 405
+        assert wrong_method.headers["allow"] == "POST"
+        assert too_large.status_code == 413
+        assert self.handled == []
+
+    @pytest.mark.asyncio
+    async def test_queue_full_answers_503(self):
+        """Test a full dispatch queue is reported so ZenoPay retries later."""
+        release = asyncio.Event()
+
+        async def blocked(event: WebhookEvent):
+            await release.wait()
+
+        async with AsyncWebhookDispatcher(blocked, workers=1, max_queue_size=1, overflow="reject") as dispatcher:
+            self.service.use_dispatcher(dispatcher)
+            async with self.client() as client:
+                responses = [await client.post("/zenopay/webhook", content=webhook_json(f"o-{i}")) for i in range(3)]
+            release.set()
+
+        statuses = [response.status_code for response in responses]
+        assert statuses[0] == 200
+        assert statuses[-1] == 503
+
+    @pytest.mark.asyncio
+    async def test_lifespan_starts_and_drains_dispatcher(self):
+        """Test the lifespan protocol starts the dispatcher and drains it on shutdown."""
+        dispatcher = AsyncWebhookDispatcher(self.service.handle_webhook_async, workers=2)
+        self.service.use_dispatcher(dispatcher)
+        messages: asyncio.Queue = asyncio.Queue()
+        sent: List[Dict[str, Any]] = []
+
+        async def send(message):
+            sent.append(message)
+
+        lifespan = asyncio.ensure_future(self.app({"type": "lifespan"}, messages.get, send))
+        await messages.put({"type": "lifespan.startup"})
+        async with self.client() as client:
+            while not sent:
+                await asyncio.sleep(0)
+            for i in range(5):
+                await client.post("/zenopay/webhook", content=webhook_json(f"o-{i}"))
+        await messages.put({"type": "lifespan.shutdown"})
+        await lifespan
+
+        assert [message["type"] for message in sent] == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert sorted(self.handled) == [f"o-{i}" for i in range(5)]
+        assert dispatcher.metrics.processed == 5
+
+
+class TestWebhookSignature:
+    """Test webhook signature verification."""
+
+    SECRET = "whsec_test"
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.service = WebhookService(secret=self.SECRET)
+        self.handled: List[str] = []
+        self.service.on_payment_completed(lambda event: self.handled.append(event.payload.order_id))
+
+    def sign(self, body: str) -> str:
+        """Compute the expected signature independently of the SDK."""
+        return hmac.new(self.SECRET.encode(), body.encode(), hashlib.sha256).hexdigest()
+
+    def test_valid_signature(self):
+        """Test a correctly signed webhook is handled, with str or bytes bodies."""
+        body = webhook_json("o-1")
+
+        first = self.service.process_webhook_request(body, self.sign(body))
+        second = self.service.process_webhook_request(body.encode(), "sha256=" + self.sign(body).upper())
+
+        assert first.status_code == second.status_code == 200
+        assert self.handled == ["o-1", "o-1"]
+
+    def test_invalid_signature_skips_parsing(self):
+        """Test a wrong or missing signature is answered with 401 without parsing the body."""
+        body = webhook_json("o-1")
+
+        with patch.object(self.service, "parse_webhook") as parse:
+            responses = [
+                self.service.process_webhook_request(body, self.sign(body + " ")),
+                self.service.process_webhook_request(body, None),
+                self.service.process_webhook_request(body, "short"),
+                self.service.process_webhook_request(body, "é" * 64),
+            ]
+
+        assert [response.status_code for response in responses] == [401, 401, 401, 401]
+        parse.assert_not_called()
+        assert self.handled == []
+
+    def test_verifier(self):
+        """Test the verifier matches the standard library HMAC and reuses its keyed object."""
+        verifier = WebhookSignatureVerifier(self.SECRET)
+        body = webhook_json("o-1")
+
+        assert verifier.sign(body) == self.sign(body)
+        assert verifier.verify(body.encode(), self.sign(body))
+        assert not verifier.verify(webhook_json("o-2"), self.sign(body))
+        assert self.service.verify_signature(body, self.sign(body))
+        assert WebhookService().verify_signature(body, None)
+
+        with pytest.raises(ValueError):
+            WebhookSignatureVerifier("")
+
+    def test_secret_from_config(self):
+        """Test the client's webhook service verifies with the configured secret."""
+        from elusion.zenopay import ZenoPay
+        from elusion.zenopay.config import ZenoPayConfig
+
+        client = ZenoPay(config=ZenoPayConfig(api_key="test-key", webhook_secret=self.SECRET))
+        body = webhook_json("o-1")
+
+        assert client.webhooks.process_webhook_request(body, "0" * 64).status_code == 401
+        assert client.webhooks.process_webhook_request(body, self.sign(body)).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_asgi_app_checks_signature_header(self):
+        """Test the ASGI app verifies the signature header over the raw body."""
+        body = webhook_json("o-1")
+        app = WebhookASGIApp(self.service)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+            forged = await client.post("/zenopay/webhook", content=body, headers={"X-ZenoPay-Signature": "0" * 64})
+            signed = await client.post("/zenopay/webhook", content=body, headers={"X-ZenoPay-Signature": self.sign(body)})
+
+        assert (forged.status_code, signed.status_code) == (401, 200)
+        assert self.handled == ["o-1"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])